@@ -0,0 +1,75 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Benchmarks of reading records and archiving results."""
+
+import pathlib
+import tempfile
+
+import hvsrpy
+from hvsrpy import settings as hvsr_settings
+from hvsrpy.data_wrangler import READ_FUNCTION_DICT
+
+from .common import synthetic_record, write_synthetic_files
+
+
+class TimeRead:
+
+    params = (list(READ_FUNCTION_DICT.keys()), [600, 3600])
+    param_names = ["ftype", "record_length_in_seconds"]
+
+    def setup(self, ftype, record_length_in_seconds):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fnames = write_synthetic_files(self.tmp_dir.name,
+                                            synthetic_record(record_length_in_seconds))[ftype]
+
+    def teardown(self, ftype, record_length_in_seconds):
+        self.tmp_dir.cleanup()
+
+    def time_read_function(self, ftype, record_length_in_seconds):
+        READ_FUNCTION_DICT[ftype](self.fnames)
+
+    def time_read_single(self, ftype, record_length_in_seconds):
+        hvsrpy.read_single(self.fnames)
+
+
+class TimeHvsrObjectIO:
+
+    params = (["traditional", "azimuthal"], [".csv", ".hvsrpy"])
+    param_names = ["hvsr_type", "extension"]
+
+    def setup(self, hvsr_type, extension):
+        settings = hvsr_settings.HvsrPreProcessingSettings()
+        settings.window_length_in_seconds = 60
+        records = hvsrpy.preprocess(synthetic_record(3600), settings)
+        if hvsr_type == "traditional":
+            settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+        else:
+            settings = hvsr_settings.HvsrAzimuthalProcessingSettings()
+        self.hvsr = hvsrpy.process(records, settings)
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fname = str(pathlib.Path(self.tmp_dir.name) / f"hvsr{extension}")
+        hvsrpy.write_hvsr_object_to_file(self.hvsr, self.fname)
+
+    def teardown(self, hvsr_type, extension):
+        self.tmp_dir.cleanup()
+
+    def time_write_hvsr_object_to_file(self, hvsr_type, extension):
+        hvsrpy.write_hvsr_object_to_file(self.hvsr, self.fname)
+
+    def time_read_hvsr_object_from_file(self, hvsr_type, extension):
+        hvsrpy.read_hvsr_object_from_file(self.fname)
@@ -0,0 +1,121 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Benchmarks of preprocessing and processing."""
+
+import copy
+
+import numpy as np
+
+import hvsrpy
+from hvsrpy import settings as hvsr_settings
+from hvsrpy.processing import PROCESSING_METHODS, TRADITIONAL_PROCESSING_REGISTER
+
+from .common import synthetic_record
+
+PREPROCESSING_SETTINGS = {
+    "traditional": hvsr_settings.HvsrPreProcessingSettings,
+    "azimuthal": hvsr_settings.HvsrPreProcessingSettings,
+    "diffuse_field": hvsr_settings.HvsrPreProcessingSettings,
+    "psd": hvsr_settings.PsdPreProcessingSettings,
+}
+
+PROCESSING_SETTINGS = {
+    "traditional": hvsr_settings.HvsrTraditionalProcessingSettings,
+    "azimuthal": hvsr_settings.HvsrAzimuthalProcessingSettings,
+    "diffuse_field": hvsr_settings.HvsrDiffuseFieldProcessingSettings,
+    "psd": hvsr_settings.PsdProcessingSettings,
+}
+
+
+def _preprocessed_records(processing_method, record_length_in_seconds, window_length_in_seconds):
+    settings = PREPROCESSING_SETTINGS[processing_method]()
+    settings.window_length_in_seconds = window_length_in_seconds
+    settings.filter_corner_frequencies_in_hz = (0.2, 20)
+    return hvsrpy.preprocess([synthetic_record(record_length_in_seconds)], settings)
+
+
+def _processing_settings(processing_method, n_center_frequencies):
+    settings = PROCESSING_SETTINGS[processing_method]()
+    settings.smoothing["center_frequencies_in_hz"] = np.geomspace(0.2, 20, n_center_frequencies)
+    return settings
+
+
+class TimePreprocess:
+
+    params = ([600, 3600], [30, 120])
+    param_names = ["record_length_in_seconds", "window_length_in_seconds"]
+    number = 1
+
+    def setup(self, record_length_in_seconds, window_length_in_seconds):
+        self.record = synthetic_record(record_length_in_seconds)
+        self.settings = hvsr_settings.HvsrPreProcessingSettings()
+        self.settings.window_length_in_seconds = window_length_in_seconds
+        self.settings.filter_corner_frequencies_in_hz = (0.2, 20)
+
+    def time_preprocess(self, record_length_in_seconds, window_length_in_seconds):
+        hvsrpy.preprocess(self.record, self.settings)
+
+
+class TimeProcess:
+
+    params = (list(PROCESSING_METHODS.keys()), [600, 3600], [30, 120], [128, 512])
+    param_names = ["processing_method", "record_length_in_seconds",
+                   "window_length_in_seconds", "n_center_frequencies"]
+
+    def setup(self, processing_method, record_length_in_seconds, window_length_in_seconds, n_center_frequencies):
+        self.records = _preprocessed_records(processing_method, record_length_in_seconds, window_length_in_seconds)
+        self.settings = _processing_settings(processing_method, n_center_frequencies)
+
+    def time_process(self, processing_method, record_length_in_seconds, window_length_in_seconds, n_center_frequencies):
+        hvsrpy.process(self.records, copy.deepcopy(self.settings))
+
+    def peakmem_process(self, processing_method, record_length_in_seconds, window_length_in_seconds, n_center_frequencies):
+        hvsrpy.process(self.records, copy.deepcopy(self.settings))
+
+
+class TimeProcessTraditional:
+
+    params = (list(TRADITIONAL_PROCESSING_REGISTER.keys()),)
+    param_names = ["method_to_combine_horizontals"]
+
+    def setup(self, method_to_combine_horizontals):
+        self.records = _preprocessed_records("traditional", 3600, 60)
+        if method_to_combine_horizontals == "rotdpp":
+            self.settings = hvsr_settings.HvsrTraditionalRotDppProcessingSettings()
+        elif method_to_combine_horizontals in ("single_azimuth", "directional_energy"):
+            self.settings = hvsr_settings.HvsrTraditionalSingleAzimuthProcessingSettings()
+        else:
+            self.settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+        self.settings.method_to_combine_horizontals = method_to_combine_horizontals
+
+    def time_process(self, method_to_combine_horizontals):
+        hvsrpy.process(self.records, copy.deepcopy(self.settings))
+
+
+class TimeWindowRejection:
+
+    params = ([128, 512],)
+    param_names = ["n_center_frequencies"]
+    number = 1
+
+    def setup(self, n_center_frequencies):
+        records = _preprocessed_records("traditional", 3600, 60)
+        settings = _processing_settings("traditional", n_center_frequencies)
+        self.hvsr = hvsrpy.process(records, settings)
+
+    def time_frequency_domain_window_rejection(self, n_center_frequencies):
+        hvsrpy.frequency_domain_window_rejection(self.hvsr, max_iterations=10)
@@ -0,0 +1,56 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Benchmarks of spectral smoothing."""
+
+import numpy as np
+
+from hvsrpy.smoothing import SMOOTHING_OPERATORS, apply_smoothing
+
+BANDWIDTHS = {
+    "konno_and_ohmachi": 40,
+    "parzen": 0.5,
+    "savitzky_and_golay": 9,
+    "linear_rectangular": 0.5,
+    "log_rectangular": 0.05,
+    "linear_triangular": 0.5,
+    "log_triangular": 0.05,
+}
+
+
+class TimeSmoothing:
+
+    params = (list(SMOOTHING_OPERATORS.keys()),
+              ["sparse", "numba", "numba_parallel"],
+              [128, 512],
+              [1, 100])
+    param_names = ["operator", "engine", "n_center_frequencies", "n_spectra"]
+
+    def setup(self, operator, engine, n_center_frequencies, n_spectra):
+        rng = np.random.default_rng(1824)
+        n = 2**15
+        self.frequencies = np.fft.rfftfreq(n, 0.01)
+        self.spectra = np.abs(rng.normal(size=(n_spectra, len(self.frequencies))))
+        self.smoothing = dict(operator=operator,
+                              bandwidth=BANDWIDTHS[operator],
+                              center_frequencies_in_hz=np.geomspace(0.2, 20, n_center_frequencies),
+                              engine=engine)
+
+        # exclude one-time compilation and operator construction.
+        apply_smoothing(self.frequencies, self.spectra, self.smoothing)
+
+    def time_apply_smoothing(self, operator, engine, n_center_frequencies, n_spectra):
+        apply_smoothing(self.frequencies, self.spectra, self.smoothing)
@@ -0,0 +1,152 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Synthetic data shared by the benchmarks, so they may run offline."""
+
+import pathlib
+
+import numpy as np
+from obspy import Stream, Trace, UTCDateTime
+from scipy.signal import butter, sosfilt
+
+import hvsrpy
+
+DT_IN_SECONDS = 0.01
+
+
+def synthetic_record(duration_in_seconds, dt_in_seconds=DT_IN_SECONDS, seed=1824):
+    """Ambient noise like record with a resonance near 2 Hz.
+
+    Parameters
+    ----------
+    duration_in_seconds : float
+        Duration of the record in seconds.
+    dt_in_seconds : float, optional
+        Time step in seconds, default is ``DT_IN_SECONDS``.
+    seed : int, optional
+        Seed of the random number generator, such that the same record
+        is returned for each call.
+
+    Returns
+    -------
+    SeismicRecording3C
+        Synthetic record.
+
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = int(round(duration_in_seconds / dt_in_seconds))
+    fs = 1/dt_in_seconds
+    resonance = butter(2, (1.5, 2.5), btype="bandpass", fs=fs, output="sos")
+    components = []
+    for scale in (1., 1., 0.):
+        noise = rng.normal(size=n_samples)
+        noise += 4*scale*sosfilt(resonance, rng.normal(size=n_samples))
+        components.append(hvsrpy.TimeSeries(noise, dt_in_seconds))
+    return hvsrpy.SeismicRecording3C(*components,
+                                     meta={"file name(s)": "synthetic"})
+
+
+def write_synthetic_files(directory, record):
+    """Write record in each format read by ``hvsrpy.read_single``.
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        Directory in which the files are written.
+    record : SeismicRecording3C
+        Record to be written, its amplitudes are rounded to integers.
+
+    Returns
+    -------
+    dict
+        Keys are the formats in ``READ_FUNCTION_DICT`` and values are
+        the file name(s) to be passed to the reader of that format.
+
+    """
+    directory = pathlib.Path(directory)
+    dt = record.vt.dt_in_seconds
+    counts = {component: np.round(1000*getattr(record, component).amplitude).astype(np.int32)
+              for component in ("ns", "ew", "vt")}
+    channels = {"ns": "HHN", "ew": "HHE", "vt": "HHZ"}
+    starttime = UTCDateTime(2024, 1, 1)
+
+    def stream(components=("ns", "ew", "vt")):
+        return Stream([Trace(counts[component],
+                             header=dict(network="XX", station="SYN",
+                                         channel=channels[component],
+                                         delta=dt, starttime=starttime))
+                       for component in components])
+
+    fnames = {}
+
+    fname = directory / "synthetic.mseed"
+    stream().write(str(fname), format="MSEED", encoding="STEIM2")
+    fnames["mseed"] = str(fname)
+
+    fnames["sac"] = []
+    for component in ("ns", "ew", "vt"):
+        fname = directory / f"synthetic_{channels[component]}.sac"
+        stream((component,)).write(str(fname), format="SAC")
+        fnames["sac"].append(str(fname))
+
+    fname = directory / "synthetic.gcf"
+    stream().write(str(fname), format="GCF")
+    fnames["gcf"] = str(fname)
+
+    n_samples = len(counts["vt"])
+    rows = np.column_stack([counts["vt"], counts["ns"], counts["ew"]])
+
+    fname = directory / "synthetic.saf"
+    header = ["SESAME ASCII data format (saf) v. 1    (this line must not be modified)",
+              f"SAMP_FREQ = {int(round(1/dt))}",
+              f"NDAT = {n_samples}",
+              "START_TIME = 2024 1 1 0 0 0.000",
+              "NORTH_ROT = 0",
+              "CH0_ID = V",
+              "CH1_ID = N",
+              "CH2_ID = E",
+              "####--------------------------------"]
+    np.savetxt(fname, rows, fmt="%d", delimiter=" ",
+               header="\n".join(header), comments="")
+    fnames["saf"] = str(fname)
+
+    fname = directory / "synthetic.minishark"
+    header = [f"#Sample number:\t{n_samples}",
+              f"#Sample rate (sps):\t{int(round(1/dt))}",
+              "#Gain:\t1",
+              "#Conversion factor:\t1"]
+    np.savetxt(fname, rows, fmt="%d", delimiter="\t",
+               header="\n".join(header), comments="")
+    fnames["minishark"] = str(fname)
+
+    fnames["peer"] = []
+    for component, direction in (("ns", "360"), ("ew", "090"), ("vt", "UP")):
+        fname = directory / f"synthetic_{direction}.vt2"
+        header = ["PEER NGA STRONG MOTION DATABASE RECORD",
+                  f"Synthetic, 1/1/2024, Synthetic, {direction}",
+                  "VELOCITY TIME SERIES IN UNITS OF CM/S",
+                  f"NPTS={n_samples:7d}, DT={dt:8.4f} SEC"]
+        amplitude = counts[component].astype(float)
+        n_full = (n_samples // 5) * 5
+        with open(fname, "w") as f:
+            f.write("\n".join(header) + "\n")
+            np.savetxt(f, amplitude[:n_full].reshape(-1, 5), fmt="%15.7E", delimiter="")
+            if n_full < n_samples:
+                np.savetxt(f, amplitude[n_full:].reshape(1, -1), fmt="%15.7E", delimiter="")
+        fnames["peer"].append(str(fname))
+
+    return fnames
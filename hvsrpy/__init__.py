@@ -25,11 +25,14 @@ from .hvsr_traditional import HvsrTraditional
 from .hvsr_azimuthal import HvsrAzimuthal
 from .hvsr_diffuse_field import HvsrDiffuseField
 from .hvsr_spatial import HvsrSpatial, montecarlo_fn
-from .data_wrangler import read, read_single
+from .data_wrangler import read, iread, read_single
 from .seismic_recording_3c import SeismicRecording3C
 from .timeseries import TimeSeries
 from .preprocessing import preprocess
-from .processing import process, rpsd
+from .processing import process, rpsd, PsdAccumulator
+from .stream import process_stream
+from .result_cache import ResultCache
+from .sweep import sweep
 from .settings import *
 from .window_rejection import sta_lta_window_rejection, maximum_value_window_rejection, frequency_domain_window_rejection, manual_window_rejection
 from .object_io import *
@@ -0,0 +1,300 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Bounded caches for reusing expensive intermediate results."""
+
+from collections import OrderedDict
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+__all__ = ["LruCache", "DiskCache", "array_digest", "file_digest"]
+
+
+def array_digest(array):
+    """Digest uniquely identifying the contents of an array.
+
+    Parameters
+    ----------
+    array : ndarray
+        Array to be digested.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the array's dtype, shape, and contents.
+
+    """
+    array = np.ascontiguousarray(array)
+    digest = hashlib.sha1(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(array.view(np.uint8).reshape(-1))
+    return digest.hexdigest()
+
+
+def file_digest(fname, chunk_size_in_bytes=2**20):
+    """Digest uniquely identifying the contents of a file.
+
+    Parameters
+    ----------
+    fname : str or pathlib.Path
+        Name of file to be digested.
+    chunk_size_in_bytes : int, optional
+        Number of bytes read at a time, default is 1 MiB.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the file's contents.
+
+    """
+    digest = hashlib.sha256()
+    with open(fname, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size_in_bytes), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LruCache():
+    """Bounded mapping discarding the least recently used entry.
+
+    Lookups are thread-safe; however, if the same missing key is
+    requested concurrently ``factory`` may be called more than once.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries retained.
+    hits, misses : int
+        Number of successful and unsuccessful lookups, respectively.
+
+    """
+
+    def __init__(self, maxsize=16):
+        """Create empty cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries retained, default is 16.
+
+        """
+        if maxsize < 1:
+            msg = f"maxsize must be a positive integer, not {maxsize}."
+            raise ValueError(msg)
+        self.maxsize = int(maxsize)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory):
+        """Retrieve the entry for ``key``, creating it if necessary.
+
+        Parameters
+        ----------
+        key : hashable
+            Key identifying the entry.
+        factory : callable
+            Function of no arguments which returns the value of the
+            entry, only called if ``key`` is not in the cache.
+
+        Returns
+        -------
+        object
+            Entry associated with ``key``.
+
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        # factory is called without the lock, as it may be slow.
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"LruCache(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, misses={self.misses})"
+
+
+class DiskCache():
+    """Size-bounded on-disk mapping discarding least recently used entries.
+
+    Entries are pickled to individual files in ``directory`` named by
+    their key. The modification time of an entry's file is updated
+    whenever it is used, such that the least recently used entries are
+    discarded first once the total size of all entries exceeds
+    ``max_size_in_bytes``. Entries are written atomically, so a cache
+    directory may be shared by concurrent processes.
+
+    Attributes
+    ----------
+    directory : pathlib.Path
+        Directory in which entries are stored.
+    max_size_in_bytes : int
+        Maximum total size of all entries.
+    hits, misses : int
+        Number of successful and unsuccessful lookups, respectively.
+
+    """
+
+    suffix = ".pkl"
+
+    def __init__(self, directory, max_size_in_bytes=2**30):
+        """Create cache in directory, creating the directory if needed.
+
+        Parameters
+        ----------
+        directory : str or pathlib.Path
+            Directory in which entries are stored.
+        max_size_in_bytes : int, optional
+            Maximum total size of all entries, default is 1 GiB.
+
+        """
+        if max_size_in_bytes < 1:
+            msg = "max_size_in_bytes must be a positive integer, "
+            msg += f"not {max_size_in_bytes}."
+            raise ValueError(msg)
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size_in_bytes = int(max_size_in_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}{self.suffix}"
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def get(self, key, factory):
+        """Retrieve the entry for ``key``, creating it if necessary.
+
+        Parameters
+        ----------
+        key : str
+            Key identifying the entry, must be a valid file name (e.g.,
+            a hexadecimal digest).
+        factory : callable
+            Function of no arguments which returns the value of the
+            entry, only called if ``key`` is not in the cache. Its
+            return value must be picklable.
+
+        Returns
+        -------
+        object
+            Entry associated with ``key``.
+
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            value = factory()
+            self._write(path, value)
+        else:
+            self.hits += 1
+            self._touch(path)
+        return value
+
+    @staticmethod
+    def _touch(path):
+        # mark as used, explicitly as file system timestamps may be coarse.
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _write(self, path, value):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self._touch(path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self._evict(keep=path)
+
+    def _evict(self, keep=None):
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size_in_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:  # pragma: no cover
+                pass
+            size -= entry_size
+
+    @property
+    def size_in_bytes(self):
+        """Total size of all entries in bytes."""
+        return sum(entry[1] for entry in self._entries())
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        for _, _, path in self._entries():
+            path.unlink()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __repr__(self):
+        return f"DiskCache(directory={str(self.directory)!r}, max_size_in_bytes={self.max_size_in_bytes}, size={len(self)}, hits={self.hits}, misses={self.misses})"
@@ -18,40 +18,128 @@
 """File for organizing a command line interface (CLI)."""
 
 import time
-import itertools
 import os
+import copy
+import sys
+import csv
+import json
 from multiprocessing import Pool
 import pathlib
 
 import click
 import matplotlib.pyplot as plt
 
+try:
+    import resource
+except ImportError: # pragma: no cover
+    resource = None
+
 import hvsrpy
 from hvsrpy.object_io import read_settings_object_from_file
 
-def _process_hvsr(fname, preprocessing_settings, processing_settings, settings): # pragma: no cover
+REPORT_STAGES = ("read", "preprocess", "process", "plot", "write")
+
+# state shared by all tasks of a worker, see _initialize_worker.
+_WORKER_STATE = {}
+
+
+def _peak_rss_in_bytes(): # pragma: no cover
+    """Peak resident set size of the current process in bytes.
+
+    This is the high-water mark over the lifetime of the process (i.e.,
+    a worker), such that it includes all files the worker processed
+    previously and not only the current file.
+
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macos bytes.
+    return peak_rss if sys.platform == "darwin" else peak_rss*1024
+
+
+def _initialize_worker(preprocessing_settings, processing_settings, settings): # pragma: no cover
+    """Prepare settings and plotting state once per worker."""
+    _WORKER_STATE["preprocessing_settings"] = preprocessing_settings
+    _WORKER_STATE["processing_settings"] = processing_settings
+    _WORKER_STATE["settings"] = settings
+    if not settings["no_figure"]:
+        plt.style.use(hvsrpy.HVSRPY_MPL_STYLE)
+
+
+def _process_hvsr(fname): # pragma: no cover
+    # copy per file, as processing modifies settings in place (e.g.,
+    # fft_settings) which would otherwise carry over between files.
+    preprocessing_settings = copy.deepcopy(_WORKER_STATE["preprocessing_settings"])
+    processing_settings = copy.deepcopy(_WORKER_STATE["processing_settings"])
+    settings = _WORKER_STATE["settings"]
+
+    timings = {}
     start = time.perf_counter()
     srecords = hvsrpy.read([[fname]])
+    timings["read"] = time.perf_counter() - start
+
+    stage_start = time.perf_counter()
     srecords = hvsrpy.preprocess(srecords, preprocessing_settings)
+    timings["preprocess"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
     hvsr = hvsrpy.process(srecords, processing_settings)
+    timings["process"] = time.perf_counter() - stage_start
 
+    stage_start = time.perf_counter()
     if not settings["no_figure"]:
-        plt.style.use(hvsrpy.HVSRPY_MPL_STYLE)
         fig, ax = plt.subplots(figsize=(3.75, 2.5), dpi=150)
         ax.set_ylim((0, settings["ymax"]))
         hvsrpy.plot_single_panel_hvsr_curves(hvsr, ax=ax)
         fig.savefig(f"{pathlib.Path(fname).stem}.png")
         plt.close()
+    timings["plot"] = time.perf_counter() - stage_start
 
+    stage_start = time.perf_counter()
     if not settings["no_file"]:
         hvsrpy.write_hvsr_object_to_file(hvsr,
                                   f"{pathlib.Path(fname).stem}.csv",
                                   distribution_mc=settings["distribution_mc"],
                                   distribution_fn=settings["distribution_fn"],
                                   )
+    timings["write"] = time.perf_counter() - stage_start
     end = time.perf_counter()
     print(f"{fname} completed in {end-start:.3f} seconds.")
 
+    report = {"file_name": str(fname),
+              "file_size_in_bytes": os.path.getsize(fname),
+              "worker_pid": os.getpid()}
+    for stage in REPORT_STAGES:
+        report[f"{stage}_time_in_seconds"] = timings[stage]
+    report["total_time_in_seconds"] = end - start
+    report["worker_peak_rss_in_bytes"] = _peak_rss_in_bytes()
+    return report
+
+
+def _write_report(reports, fname):
+    """Write per-file reports to a JSON or CSV file."""
+    suffix = pathlib.Path(fname).suffix.lower()
+    if suffix == ".json":
+        with open(fname, "w") as f:
+            json.dump(reports, f, indent=2)
+    elif suffix == ".csv":
+        with open(fname, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(reports[0].keys()))
+            writer.writeheader()
+            writer.writerows(reports)
+    else:
+        msg = f"report must be a .json or .csv file, not {fname}."
+        raise ValueError(msg)
+
+
+def _file_size_or_zero(fname):
+    try:
+        return os.path.getsize(fname)
+    except OSError:
+        return 0
+
+
 @click.command()
 @click.argument('file_names', nargs=-1, type=click.Path())
 @click.option('--preprocessing_settings_file', default=None, type=click.Path(), help="Path to preprocessing settings file.")
@@ -62,23 +150,31 @@ def _process_hvsr(fname, preprocessing_settings, processing_settings, settings):
 @click.option('--no_file', is_flag=True, help="Flag to prevent HVSR from being saved.")
 @click.option('--ymax', default=10., type=float, help="Manually set the upper y limit of the HVSR figure, default is 10.")
 @click.option('--nproc', default=None, type=int, help="Number of subprocesses to launch, default is number of CPUs minus 1.")
+@click.option('--report', default=None, type=click.Path(), help="Path to .json or .csv file where per-file timings, file sizes, and worker peak memory are reported.")
 @click.pass_context
-def cli(ctx, **kwargs):  # pragma: no cover
+def cli(ctx, **kwargs):
     """Command line interface to hvsrpy."""
     preprocessing_settings = read_settings_object_from_file(kwargs.pop("preprocessing_settings_file"))
     processing_settings = read_settings_object_from_file(kwargs.pop("processing_settings_file"))
 
     if kwargs["no_figure"] and kwargs["no_file"]:
         return
-    
-    nproc = os.cpu_count()-1 if kwargs["nproc"] is None else kwargs["nproc"]
+
+    report = kwargs.pop("report")
+    if report is not None and pathlib.Path(report).suffix.lower() not in (".json", ".csv"):
+        raise click.BadParameter("must be a .json or .csv file.", param_hint="--report")
+
+    nproc = max(1, os.cpu_count()-1) if kwargs["nproc"] is None else kwargs["nproc"]
     fnames = kwargs.pop("file_names")
     ntasks = len(fnames)
-    with Pool(min(ntasks, nproc)) as p:
-        p.starmap(_process_hvsr,
-                  zip(fnames,
-                      itertools.repeat(preprocessing_settings),
-                      itertools.repeat(processing_settings),
-                      itertools.repeat(kwargs),
-                    ),
-                  chunksize=max(1, ntasks//nproc))
+
+    # largest files first and one file per task, so idle workers take
+    # the next file rather than waiting on a statically assigned chunk.
+    fnames = sorted(fnames, key=_file_size_or_zero, reverse=True)
+    with Pool(min(ntasks, nproc),
+              initializer=_initialize_worker,
+              initargs=(preprocessing_settings, processing_settings, kwargs)) as p:
+        reports = list(p.imap_unordered(_process_hvsr, fnames, chunksize=1))
+
+    if report is not None:
+        _write_report(reports, report)
@@ -22,8 +22,12 @@ import warnings
 import logging
 import itertools
 import io
+import collections
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+import os
+import struct
 
-import obspy
 import numpy as np
 
 from .regex import saf_npts_exec, saf_fs_exec, saf_row_exec, saf_v_ch_exec, saf_n_ch_exec, saf_e_ch_exec, saf_north_rot_exec, saf_version_exec
@@ -32,6 +36,9 @@ from .regex import peer_direction_exec, peer_npts_exec, peer_dt_exec, peer_sampl
 
 from .timeseries import TimeSeries
 from .seismic_recording_3c import SeismicRecording3C
+from .miniseed import read_miniseed
+from .text_parsing import parse_numbers
+from .cache import LruCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,8 +62,10 @@ def _arrange_traces(traces):
     return ns, ew, vt
 
 
-def _check_npts(npts_header, npts_found):
-    if npts_header != npts_found: # pragma: no cover
+def _check_npts(npts_header, npts_found, n_channels=1):
+    if npts_header*n_channels != npts_found:
+        if n_channels != 1:
+            npts_found = f"{npts_found} samples across {n_channels} channels"
         msg = f"Points listed in file header ({npts_header}) does not match "
         msg += f"the number of points found ({npts_found}) please report this "
         msg += "issue to the hvsrpy developers via GitHub issues "
@@ -64,13 +73,45 @@ def _check_npts(npts_header, npts_found):
         raise ValueError(msg)
 
 
+def _parse_samples(text, sample_exec):
+    """Parse numeric samples from the first match of ``sample_exec`` on.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    Parsing stops at the first token that is not a number, such that
+    trailing text (e.g., a footer) is ignored.
+
+    """
+    match = sample_exec.search(text)
+    if match is None:
+        return np.empty(0)
+    return parse_numbers(text[match.start():], stop_at_non_numeric=True)
+
+
 def _quiet_obspy_read(*args, **kwargs):
+    # imported lazily as obspy is slow to import and often not needed.
+    import obspy
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         results = obspy.read(*args, **kwargs)
     return results
 
 
+def _native_or_obspy_read(fname, **obspy_read_kwargs):
+    """Read miniSEED natively, falling back to ``obspy`` if needed.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    try:
+        return read_miniseed(fname)
+    except (ValueError, NotImplementedError) as e:
+        logger.info(f"Native miniSEED decoder failed for {fname} with {e}, trying obspy.")
+        return _quiet_obspy_read(fname, **obspy_read_kwargs)
+
+
 def _read_mseed(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     """Read seismic data from file(s) in miniSEED format.
 
@@ -91,7 +132,8 @@ def _read_mseed(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     obspy_read_kwargs : dict, optional
         For passing arguments to the ``obspy.read`` function to
         customize its behavior, default is ``None`` indicating
-        not keyword arguments will be passed.
+        the file(s) are decoded natively (see ``hvsrpy.miniseed``),
+        with ``obspy.read`` only used for files that cannot be.
     degrees_from_north : float, optional
         Rotation in degrees of the sensor's north component relative to
         magnetic north; clock wise positive. Default is 0.0
@@ -104,25 +146,27 @@ def _read_mseed(fnames, obspy_read_kwargs=None, degrees_from_north=None):
         Initialized 3-component seismic recording object.
 
     """
+    # use native decoder, unless obspy's options are requested or the
+    # file(s) cannot be decoded natively.
+    read_function = _quiet_obspy_read
     if obspy_read_kwargs is None:
         obspy_read_kwargs = {"format": "MSEED"}
+        read_function = _native_or_obspy_read
 
     # one miniSEED file with all three components.
     if isinstance(fnames, (str, pathlib.Path, io.BytesIO)):
-        traces = _quiet_obspy_read(fnames, **obspy_read_kwargs)
+        traces = read_function(fnames, **obspy_read_kwargs)
         fnames = str(fnames)
     # three miniSEED files; one per component.
     elif isinstance(fnames, (list, tuple)):
-        trace_list = []
+        traces = []
         for fname in fnames:
-            stream = _quiet_obspy_read(fname, **obspy_read_kwargs)
+            stream = read_function(fname, **obspy_read_kwargs)
             if len(stream) != 1: # pragma: no cover
                 msg = f"File {fname} contained {len(stream)}"
                 msg += "traces, rather than 1 as was expected."
                 raise IndexError(msg)
-            trace = stream[0]
-            trace_list.append(trace)
-        traces = obspy.Stream(trace_list)
+            traces.append(stream[0])
         fnames = [str(fname) for fname in fnames]
     else: # pragma: no cover
         msg = "`fnames` must be either `str` or `list`"
@@ -209,17 +253,14 @@ def _read_saf(fnames, obspy_read_kwargs=None, degrees_from_north=None):
                 msg += " CH1 must be vertical; CH2 & CH3 the horizontals."
                 raise ValueError(msg)
 
-    data = np.empty((npts_header, 3), dtype=np.float32)
-
-    idx = 0
-    for group in saf_row_exec.finditer(text):
-        channels = group.groups()
-        data[idx, 0] = float(channels[v_ch])
-        data[idx, 1] = float(channels[n_ch])
-        data[idx, 2] = float(channels[e_ch])
-        idx += 1
+    samples = _parse_samples(text, saf_row_exec)
+    _check_npts(npts_header, samples.size, n_channels=3)
+    samples = samples.reshape(npts_header, 3)
 
-    _check_npts(npts_header, idx)
+    data = np.empty((npts_header, 3), dtype=np.float32)
+    data[:, 0] = samples[:, v_ch]
+    data[:, 1] = samples[:, n_ch]
+    data[:, 2] = samples[:, e_ch]
 
     vt, ns, ew = data.T
 
@@ -276,17 +317,9 @@ def _read_minishark(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     conversion = int(mshark_conversion_exec.search(text).groups()[0])
     gain = int(mshark_gain_exec.search(text).groups()[0])
 
-    data = np.empty((npts_header, 3), dtype=np.float32)
-
-    idx = 0
-    for group in mshark_row_exec.finditer(text):
-        vt, ns, ew = group.groups()
-        data[idx, 0] = float(vt)
-        data[idx, 1] = float(ns)
-        data[idx, 2] = float(ew)
-        idx += 1
-
-    _check_npts(npts_header, idx)
+    samples = _parse_samples(text, mshark_row_exec)
+    _check_npts(npts_header, samples.size, n_channels=3)
+    data = samples.reshape(npts_header, 3).astype(np.float32)
 
     data /= gain
     data /= conversion
@@ -337,6 +370,10 @@ def _read_sac(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     """
     if obspy_read_kwargs is None:
         obspy_read_kwargs = {"format": "SAC"}
+    else:
+        # copied as byteorder is set below and the caller's dict may be
+        # shared with other (concurrent) reads.
+        obspy_read_kwargs = dict(obspy_read_kwargs)
 
     if not isinstance(fnames, (list, tuple)):
         msg = "Must provide 3 sac files (one per trace); only one provided."
@@ -362,7 +399,7 @@ def _read_sac(fnames, obspy_read_kwargs=None, degrees_from_north=None):
 
         trace = stream[0]
         trace_list.append(trace)
-    traces = obspy.Stream(trace_list)
+    traces = trace_list
 
     if len(traces) != 3: # pragma: no cover
         msg = f"Provided {len(traces)} traces, but must only provide 3."
@@ -484,14 +521,8 @@ def _read_peer(fnames, obspy_read_kwargs=None, degrees_from_north=None):
         dt = float(peer_dt_exec.search(text).groups()[0])
         dts.append(dt)
 
-        amplitude = np.empty((npts_header))
-        idx = 0
-        for group in peer_sample_exec.finditer(text):
-            sample, = group.groups()
-            amplitude[idx] = sample
-            idx += 1
-
-        _check_npts(npts_header, idx)
+        amplitude = _parse_samples(text, peer_sample_exec)
+        _check_npts(npts_header, amplitude.size)
 
         component_list.append(TimeSeries(amplitude, dt_in_seconds=dt))
 
@@ -572,6 +603,120 @@ READ_FUNCTION_DICT = {
     "peer": _read_peer
 }
 
+# number of leading bytes inspected to identify a file's format.
+SNIFF_SIZE_IN_BYTES = 4096
+
+
+def _is_mseed(head):
+    if head[:3] == b"MS\x03":
+        return True
+    return (len(head) >= 48 and
+            all(byte in b"0123456789 \x00" for byte in head[:6]) and
+            head[6:7] in (b"D", b"R", b"Q", b"M") and
+            head[7:8] in (b" ", b"\x00"))
+
+
+def _is_sac(head):
+    # header version (nvhdr), the seventh integer header word, is 6.
+    if len(head) < 632:
+        return False
+    return any(struct.unpack_from(f"{order}i", head, 304)[0] == 6 for order in "<>")
+
+
+FORMAT_SIGNATURES = {
+    "mseed": _is_mseed,
+    "saf": lambda head: b"SESAME ASCII data format" in head,
+    "minishark": lambda head: b"#Sample rate" in head,
+    "sac": _is_sac,
+    "peer": lambda head: b"NPTS=" in head and b"DT=" in head,
+}
+
+# detected format of recently read files, keyed on path and stat.
+FORMAT_CACHE = LruCache(maxsize=4096)
+
+
+def _head(fname):
+    """Leading bytes of a file or in-memory file.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    if isinstance(fname, io.BytesIO):
+        return fname.getvalue()[:SNIFF_SIZE_IN_BYTES]
+    if isinstance(fname, io.StringIO):
+        return fname.getvalue()[:SNIFF_SIZE_IN_BYTES].encode(errors="replace")
+    with open(fname, "rb") as f:
+        return f.read(SNIFF_SIZE_IN_BYTES)
+
+
+def _format_cache_key(fnames):
+    """Key identifying file(s) on disk, or ``None`` if in-memory.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    fname = fnames[0] if isinstance(fnames, (list, tuple)) else fnames
+    if not isinstance(fname, (str, pathlib.Path)):
+        return None
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return (os.path.abspath(fname), stat.st_mtime_ns, stat.st_size)
+
+
+def _sniff_format(fnames):
+    """Identify the format of file(s) from their leading bytes.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    Parameters
+    ----------
+    fnames : {str, list}
+        File name(s) as provided to ``read_single``, only the first
+        file is inspected.
+
+    Returns
+    -------
+    str or None
+        Key of ``READ_FUNCTION_DICT`` for the format identified, or
+        ``None`` if no format could be identified.
+
+    """
+    fname = fnames[0] if isinstance(fnames, (list, tuple)) else fnames
+    try:
+        head = _head(fname)
+    except (OSError, TypeError):
+        return None
+    for ftype, is_format in FORMAT_SIGNATURES.items():
+        if is_format(head):
+            return ftype
+    return None
+
+
+def _candidate_formats(fnames):
+    """Formats to be attempted by ``read_single``, most likely first.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    key = _format_cache_key(fnames)
+    if key is None:
+        ftype = _sniff_format(fnames)
+    else:
+        ftype = FORMAT_CACHE.get(key, lambda: _sniff_format(fnames))
+
+    # formats without a signature are attempted before the rest.
+    if ftype is None:
+        ftypes = [ftype for ftype in READ_FUNCTION_DICT if ftype not in FORMAT_SIGNATURES]
+    else:
+        ftypes = [ftype]
+    return ftypes + [ftype for ftype in READ_FUNCTION_DICT if ftype not in ftypes]
+
 
 def read_single(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     """Read file(s) associated with a single recording.
@@ -605,9 +750,18 @@ def read_single(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     SeismicRecording3C
         Initialized three-component seismic recording object.
 
+    Notes
+    -----
+    The file format is identified from the leading bytes of the
+    (first) file and remembered for subsequent reads of the same
+    unmodified file. If the identified format cannot be read the
+    remaining formats are attempted in turn.
+
     """
     logger.info(f"Attempting to read {fnames}")
-    for ftype, read_function in READ_FUNCTION_DICT.items():
+    ftypes = _candidate_formats(fnames)
+    for ftype in ftypes:
+        read_function = READ_FUNCTION_DICT[ftype]
         try:
             srecording_3c = read_function(fnames,
                                           obspy_read_kwargs=obspy_read_kwargs,
@@ -615,7 +769,7 @@ def read_single(fnames, obspy_read_kwargs=None, degrees_from_north=None):
         except Exception as e:
             logger.info(f"Tried reading as {ftype}, got exception |  {e}")
 
-            if ftype == "peer":
+            if ftype == ftypes[-1]:
                 raise e
 
             pass
@@ -629,7 +783,143 @@ def read_single(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     return srecording_3c
 
 
-def read(fnames, obspy_read_kwargs=None, degrees_from_north=None):
+def _read_arguments(fnames, obspy_read_kwargs, degrees_from_north):
+    """Arguments to ``read_single`` for each entry of ``fnames``.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    # if only string provided put it in a list and warn user.
+    if not isinstance(fnames, (list, tuple)):
+        msg = "fnames should be iterable of str or iterable of "
+        msg += "iterable of str."
+        warnings.warn(msg)
+        fnames = [fnames]
+
+    # scale obspy_read_kwargs as needed to match fnames.
+    if isinstance(obspy_read_kwargs, (dict, type(None))):
+        read_kwargs_iter = itertools.repeat(obspy_read_kwargs)
+    else:
+        read_kwargs_iter = obspy_read_kwargs
+
+    # scale degrees_from_north as needed to match fnames.
+    if degrees_from_north is None or np.ndim(degrees_from_north) == 0:
+        degrees_from_north_iter = itertools.repeat(degrees_from_north)
+    else:
+        degrees_from_north_iter = degrees_from_north
+
+    for fname, read_kwargs, _degrees_from_north in zip(fnames, read_kwargs_iter, degrees_from_north_iter):
+
+        # if entry is a list with only a single entry, remove the list.
+        if isinstance(fname, (list, tuple)):
+            if len(fname) == 1:
+                fname = fname[0]
+
+        yield fname, read_kwargs, _degrees_from_north
+
+
+def _read_single_from_arguments(arguments):
+    """Unpack arguments from ``_read_arguments`` into ``read_single``.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    fname, read_kwargs, degrees_from_north = arguments
+    return read_single(fname,
+                       obspy_read_kwargs=read_kwargs,
+                       degrees_from_north=degrees_from_north)
+
+
+def iread(fnames, obspy_read_kwargs=None, degrees_from_north=None,
+          max_workers=1, executor=None, ordered=True):
+    """Read seismic data file(s) lazily.
+
+    Same as ``hvsrpy.read``, except ``SeismicRecording3C`` objects
+    are yielded as soon as they are available such that downstream
+    processing may begin before all files have been read.
+
+    Parameters
+    ----------
+    fnames, obspy_read_kwargs, degrees_from_north
+        See ``hvsrpy.read`` for details.
+    max_workers : int, optional
+        Number of threads used to read files concurrently, default
+        is ``1`` indicating files are read serially, ``None`` uses the
+        ``concurrent.futures.ThreadPoolExecutor`` default. If
+        ``executor`` is provided, only used to limit the number of
+        files read ahead (twice ``max_workers``).
+    executor : concurrent.futures.Executor, optional
+        Executor used to read files concurrently, default is ``None``
+        indicating a thread pool with ``max_workers`` threads is used
+        (if ``max_workers > 1``).
+    ordered : bool, optional
+        Indicates whether recordings are yielded in the order of
+        ``fnames`` (``True``) or in the order in which they finish
+        reading (``False``), default is ``True``.
+
+    Yields
+    ------
+    SeismicRecording3C
+        Initialized three-component seismic recording object, one for
+        each entry in ``fnames``.
+
+    """
+    arguments = _read_arguments(fnames, obspy_read_kwargs, degrees_from_north)
+
+    # limit files read ahead of the consumer to bound memory use.
+    max_pending = 2*(os.cpu_count() if max_workers is None else max_workers)
+
+    if executor is not None:
+        yield from _iread_with_executor(arguments, executor, max_pending, ordered)
+    elif max_workers == 1:
+        for argument in arguments:
+            yield _read_single_from_arguments(argument)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from _iread_with_executor(arguments, executor, max_pending, ordered)
+
+
+def _iread_with_executor(arguments, executor, max_pending, ordered):
+    """Read files with an executor, limiting the number pending.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    pending = collections.deque()
+    try:
+        for argument in arguments:
+            pending.append(executor.submit(_read_single_from_arguments, argument))
+            while len(pending) >= max_pending:
+                yield from _pop_completed(pending, ordered)
+        while pending:
+            yield from _pop_completed(pending, ordered)
+    finally:
+        # abandon outstanding reads if the generator is closed early.
+        for future in pending:
+            future.cancel()
+
+
+def _pop_completed(pending, ordered):
+    """Remove and return result(s) of completed futures.
+
+    .. warning::
+        Private API is subject to change without warning.
+
+    """
+    if ordered:
+        yield pending.popleft().result()
+        return
+    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+def read(fnames, obspy_read_kwargs=None, degrees_from_north=None,
+         max_workers=1, executor=None):
     """Read seismic data file(s).
 
     Parameters
@@ -663,43 +953,25 @@ def read(fnames, obspy_read_kwargs=None, degrees_from_north=None):
         or (if the sensor's orientation is not listed in the file) the
         sensor's north component is aligned with magnetic north
         (i.e., ``degrees_from_north=0``).
+    max_workers : int, optional
+        Number of threads used to read files concurrently, default
+        is ``1`` indicating files are read serially, ``None`` uses the
+        ``concurrent.futures.ThreadPoolExecutor`` default. Reading
+        files concurrently is most beneficial when reading many files
+        from network storage.
+    executor : concurrent.futures.Executor, optional
+        Executor used to read files concurrently, default is ``None``
+        indicating a thread pool with ``max_workers`` threads is used
+        (if ``max_workers > 1``).
 
     Returns
     -------
     list
         Of initialized ``SeismicRecording3C`` objects, one for each each
-        iterable entry provided.
+        iterable entry provided, in the order provided.
 
     """
-    # if only string provided put it in a list and warn user.
-    if not isinstance(fnames, (list, tuple)):
-        msg = "fnames should be iterable of str or iterable of "
-        msg += "iterable of str."
-        warnings.warn(msg)
-        fnames = [fnames]
-
-    # scale obspy_read_kwargs as needed to match fnames.
-    if isinstance(obspy_read_kwargs, (dict, type(None))):
-        read_kwargs_iter = itertools.repeat(obspy_read_kwargs)
-    else:
-        read_kwargs_iter = obspy_read_kwargs
-
-    # scale degrees_from_north as needed to match fnames.
-    if isinstance(obspy_read_kwargs, (dict, type(None))):
-        degrees_from_north_iter = itertools.repeat(degrees_from_north)
-    else:
-        degrees_from_north_iter = degrees_from_north
-
-    seismic_recordings = []
-    for fname, read_kwargs, degrees_from_north in zip(fnames, read_kwargs_iter, degrees_from_north_iter):
-
-        # if entry is a list with only a single entry, remove the list.
-        if isinstance(fname, (list, tuple)):
-            if len(fname) == 1:
-                fname = fname[0]
-
-        seismic_recordings.append(read_single(fname,
-                                              obspy_read_kwargs=read_kwargs,
-                                              degrees_from_north=degrees_from_north))
-
-    return seismic_recordings
+    return list(iread(fnames, obspy_read_kwargs=obspy_read_kwargs,
+                      degrees_from_north=degrees_from_north,
+                      max_workers=max_workers, executor=executor,
+                      ordered=True))
@@ -104,6 +104,26 @@ class HvsrAzimuthal():
         self.meta = dict(meta) if isinstance(meta, dict) else dict()
         self.update_peaks_bounded()
 
+    @classmethod
+    def _from_precomputed(cls, hvsrs, azimuths, meta=None):
+        """Create ``HvsrAzimuthal`` from ``HvsrTraditional`` with peaks.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        Unlike the constructor, ``hvsrs`` are neither checked nor copied
+        and their peaks are not recomputed.
+
+        """
+        obj = cls.__new__(cls)
+        obj.hvsrs = list(hvsrs)
+        obj.azimuths = [float(azimuth) for azimuth in azimuths]
+        obj.meta = dict(meta) if isinstance(meta, dict) else dict()
+        obj.meta["search_range_in_hz"] = obj._search_range_in_hz
+        find_peaks_kwargs = obj.hvsrs[0].meta["find_peaks_kwargs"]
+        obj.meta["find_peaks_kwargs"] = None if find_peaks_kwargs is None else dict(find_peaks_kwargs)
+        return obj
+
     @property
     def _search_range_in_hz(self):
         return self.hvsrs[0]._search_range_in_hz
@@ -167,6 +187,26 @@ class HvsrAzimuthal():
             weights.extend([1/(n_azimuths*n_valid_peaks)]*n_valid_peaks)
         return np.array(weights)
 
+    def _valid_amplitude_and_weights(self):
+        """Valid HVSR curves across all azimuths and their weights.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        Returns
+        -------
+        tuple
+            Of the form ``(amplitude, weights)`` where ``amplitude`` has
+            one row per valid HVSR curve across all azimuths and
+            ``weights`` is a column vector with one weight per row
+            following Cheng et al. (2020).
+
+        """
+        amplitude = np.concatenate([hvsr.amplitude[hvsr.valid_window_boolean_mask]
+                                    for hvsr in self.hvsrs])
+        weights = self._compute_statistical_weights()[:, np.newaxis]
+        return (amplitude, weights)
+
     def mean_fn_frequency(self, distribution="lognormal"):
         """Mean frequency of ``fn`` across all valid HVSR curves and azimuths.
 
@@ -374,18 +414,11 @@ class HvsrAzimuthal():
             If ``distribution`` does not match the available options.
 
         """
-        weights = self._compute_statistical_weights()
-        mean_curve = np.empty_like(self.frequency)
-        for _idx in range(len(mean_curve)):
-            amplitude = [hvsr.amplitude[hvsr.valid_window_boolean_mask][:, _idx].tolist()
-                         for hvsr in self.hvsrs]
-            amplitude = _flatten_list(amplitude)
-            mean_curve[_idx] = _nanmean_weighted(distribution=distribution,
-                                                 values=np.array(amplitude),
-                                                 weights=weights,
-                                                 mean_kwargs=dict(axis=0))
-
-        return mean_curve
+        amplitude, weights = self._valid_amplitude_and_weights()
+        return _nanmean_weighted(distribution=distribution,
+                                 values=amplitude,
+                                 weights=weights,
+                                 mean_kwargs=dict(axis=0))
 
     def std_curve(self, distribution="lognormal"):
         """Sample standard deviation associated with mean HVSR curve
@@ -410,19 +443,12 @@ class HvsrAzimuthal():
             If ``distribution`` does not match the available options.
 
         """
-        weights = self._compute_statistical_weights()
-        std_curve = np.empty_like(self.frequency)
-        for _idx in range(len(std_curve)):
-            amplitude = [hvsr.amplitude[hvsr.valid_window_boolean_mask][:, _idx].tolist()
-                         for hvsr in self.hvsrs]
-            amplitude = _flatten_list(amplitude)
-            std_curve[_idx] = _nanstd_weighted(distribution=distribution,
-                                               values=np.array(amplitude),
-                                               weights=weights,
-                                               std_kwargs=dict(axis=0),
-                                               denominator="cheng")
-
-        return std_curve
+        amplitude, weights = self._valid_amplitude_and_weights()
+        return _nanstd_weighted(distribution=distribution,
+                                values=amplitude,
+                                weights=weights,
+                                std_kwargs=dict(axis=0),
+                                denominator="cheng")
 
     def nth_std_curve(self, n, distribution="lognormal"):
         """nth standard deviation on mean curve considering all valid
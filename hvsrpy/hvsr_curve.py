@@ -20,6 +20,7 @@
 import logging
 
 import numpy as np
+from numba import njit
 from scipy.signal import find_peaks
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,43 @@ logger = logging.getLogger(__name__)
 __all__ = ["HvsrCurve"]
 
 
+@njit(cache=True)
+def _peak_prominences(amplitude, rows, cols): # pragma: no cover
+    """Prominence of the peaks at ``amplitude[rows, cols]``.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Follows ``scipy.signal.peak_prominences`` with ``wlen=None``.
+
+    """
+    prominences = np.empty(len(rows))
+    n_samples = amplitude.shape[1]
+    for idx in range(len(rows)):
+        row = rows[idx]
+        peak = cols[idx]
+        height = amplitude[row, peak]
+
+        # search left until a higher sample or the start.
+        left_min = height
+        i = peak
+        while i >= 0 and amplitude[row, i] <= height:
+            if amplitude[row, i] < left_min:
+                left_min = amplitude[row, i]
+            i -= 1
+
+        # search right until a higher sample or the end.
+        right_min = height
+        i = peak
+        while i < n_samples and amplitude[row, i] <= height:
+            if amplitude[row, i] < right_min:
+                right_min = amplitude[row, i]
+            i += 1
+
+        prominences[idx] = height - max(left_min, right_min)
+    return prominences
+
+
 class HvsrCurve():
     """Class for creating and manipulating ``HvsrCurve`` objects.
 
@@ -65,7 +103,8 @@ class HvsrCurve():
         Returns
         -------
         ndarray
-            ``values`` as ``ndarray`` of doubles.
+            ``values`` as ``ndarray`` of doubles (or singles if
+            ``value`` is an ``ndarray`` of singles).
 
         Raises
         ------
@@ -75,8 +114,10 @@ class HvsrCurve():
             If ``value`` contains nan or a value less than or equal to zero.
 
         """
+        # single precision is preserved, otherwise cast to double.
+        dtype = np.float32 if getattr(value, "dtype", None) == np.float32 else np.double
         try:
-            value = np.array(value, dtype=np.double)
+            value = np.array(value, dtype=dtype)
         except ValueError:
             msg = f"{name} must be castable to array of doubles, "
             msg += f"not {type(value)}."
@@ -150,6 +191,118 @@ class HvsrCurve():
                                                                 find_peaks_kwargs=find_peaks_kwargs)
         return (frequency, amplitude)
 
+    @staticmethod
+    def _find_peaks_condition(value):
+        """Convert ``find_peaks`` condition to an inclusive interval.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        Returns ``None`` if ``value`` is not a scalar or a pair of
+        scalars (e.g., a per-sample array), which is not supported in
+        the batched peak finder.
+
+        """
+        if isinstance(value, (int, float, np.number)):
+            return (float(value), np.inf)
+        if isinstance(value, (tuple, list)) and len(value) == 2:
+            interval = []
+            for bound, default in zip(value, (-np.inf, np.inf)):
+                if bound is None:
+                    interval.append(default)
+                elif isinstance(bound, (int, float, np.number)):
+                    interval.append(float(bound))
+                else:
+                    return None
+            return tuple(interval)
+        return None
+
+    @staticmethod
+    def _find_peaks_bounded_batch(frequency, amplitude, search_range_in_hz=(None, None), find_peaks_kwargs=None):
+        """Finds frequency and amplitude of the highest peak of each curve.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        Batched equivalent of ``_find_peak_bounded`` for a 2D
+        ``amplitude`` array with one curve per row. The search range is
+        resolved once, local maxima are identified for all curves at
+        once, and the ``height``, ``prominence``, and ``distance``
+        keyword arguments of ``find_peaks`` are applied in vectorized
+        form. Curves containing plateaus (i.e., adjacent equal
+        amplitudes) and unsupported ``find_peaks_kwargs`` are handled
+        by ``find_peaks``.
+
+        Returns
+        -------
+        tuple
+            Of the form ``(peak_frequencies, peak_amplitudes)`` with one
+            entry per curve, curves without a peak are ``np.nan``.
+
+        """
+        f_low_idx, f_high_idx = HvsrCurve._search_range_to_index_range(frequency,
+                                                                       search_range_in_hz)
+        frequency = frequency[f_low_idx:f_high_idx]
+        amplitude = np.asarray(np.atleast_2d(amplitude))[:, f_low_idx:f_high_idx]
+        find_peaks_kwargs = {} if find_peaks_kwargs is None else dict(find_peaks_kwargs)
+        n_curves = amplitude.shape[0]
+        peak_frequencies = np.full(n_curves, np.nan)
+        peak_amplitudes = np.full(n_curves, np.nan)
+
+        # resolve conditions, None if the batched approach does not apply.
+        conditions = {}
+        for key, value in find_peaks_kwargs.items():
+            if key in ("height", "prominence"):
+                if value is not None:
+                    conditions[key] = HvsrCurve._find_peaks_condition(value)
+            elif key == "distance":
+                # distance never removes the highest peak, but it may if
+                # combined with prominence.
+                if value is not None:
+                    conditions[key] = value if isinstance(value, (int, float, np.number)) and value >= 1 else None
+            else:
+                conditions[key] = None
+        if "distance" in conditions and "prominence" in conditions:
+            conditions["distance"] = None
+        fallback_rows = np.arange(n_curves)
+        if None not in conditions.values() and amplitude.shape[1] > 2:
+            diff = np.diff(amplitude, axis=1)
+            is_peak = np.zeros(amplitude.shape, dtype=bool)
+            is_peak[:, 1:-1] = (diff[:, :-1] > 0) & (diff[:, 1:] < 0)
+
+            if "height" in conditions:
+                h_min, h_max = conditions["height"]
+                is_peak &= (amplitude >= h_min) & (amplitude <= h_max)
+
+            if "prominence" in conditions:
+                p_min, p_max = conditions["prominence"]
+                rows, cols = np.nonzero(is_peak)
+                prominences = _peak_prominences(amplitude, rows, cols)
+                reject = (prominences < p_min) | (prominences > p_max)
+                is_peak[rows[reject], cols[reject]] = False
+
+            has_peak = np.any(is_peak, axis=1)
+            peak_indices = np.argmax(np.where(is_peak, amplitude, -np.inf), axis=1)
+            rows = np.flatnonzero(has_peak)
+            peak_frequencies[rows] = frequency[peak_indices[rows]]
+            peak_amplitudes[rows] = amplitude[rows, peak_indices[rows]]
+
+            # plateaus require scipy's midpoint logic.
+            has_plateau = np.any(diff == 0, axis=1)
+            peak_frequencies[has_plateau] = np.nan
+            peak_amplitudes[has_plateau] = np.nan
+            fallback_rows = np.flatnonzero(has_plateau)
+
+        for row in fallback_rows:
+            f_peak, a_peak = HvsrCurve._find_peak_unbounded(frequency,
+                                                            amplitude[row],
+                                                            find_peaks_kwargs=find_peaks_kwargs)
+            if f_peak is not None:
+                peak_frequencies[row] = f_peak
+                peak_amplitudes[row] = a_peak
+
+        return (peak_frequencies, peak_amplitudes)
+
     def __init__(self, frequency, amplitude, meta=None):
         """Create ``HvsrCurve`` from iterables of frequency and amplitude.
 
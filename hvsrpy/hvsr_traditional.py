@@ -122,6 +122,38 @@ class HvsrTraditional():
 
         return cls(example.frequency, amplitude, meta=meta)
 
+    @classmethod
+    def _from_precomputed(cls, frequency, amplitude, main_peak_frq,
+                          main_peak_amp, valid_window_boolean_mask,
+                          valid_peak_boolean_mask, search_range_in_hz,
+                          find_peaks_kwargs, meta=None):
+        """Create ``HvsrTraditional`` from previously validated arrays.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        Unlike the constructor, ``frequency`` and ``amplitude`` are
+        neither checked nor copied (so they may be read-only memory
+        maps) and the peaks are not recomputed, instead the provided
+        peaks are assumed to correspond to ``search_range_in_hz`` and
+        ``find_peaks_kwargs``.
+
+        """
+        obj = cls.__new__(cls)
+        obj.frequency = frequency
+        obj.amplitude = amplitude
+        obj.n_curves = len(amplitude)
+        obj.valid_window_boolean_mask = np.array(valid_window_boolean_mask, dtype=bool)
+        obj.valid_peak_boolean_mask = np.array(valid_peak_boolean_mask, dtype=bool)
+        obj.meta = dict(meta) if isinstance(meta, dict) else dict()
+        obj._main_peak_frq = np.array(main_peak_frq, dtype=np.double)
+        obj._main_peak_amp = np.array(main_peak_amp, dtype=np.double)
+        obj._search_range_in_hz = tuple(search_range_in_hz)
+        obj._find_peaks_kwargs = {} if find_peaks_kwargs is None else dict(find_peaks_kwargs)
+        obj.meta["search_range_in_hz"] = obj._search_range_in_hz
+        obj.meta["find_peaks_kwargs"] = None if find_peaks_kwargs is None else dict(find_peaks_kwargs)
+        return obj
+
     @ property
     def peak_frequencies(self):
         """Valid peak frequency vector, one per window or earthquake recording."""
@@ -161,28 +193,19 @@ class HvsrTraditional():
             self.meta["search_range_in_hz"] = self._search_range_in_hz
             self.meta["find_peaks_kwargs"] = None if find_peaks_kwargs is None else dict(find_peaks_kwargs) 
 
-        all_curves_flat = True
-        for _idx, _amplitude in enumerate(self.amplitude):
-            (f_peak, a_peak) = HvsrCurve._find_peak_bounded(self.frequency,
-                                                            _amplitude,
-                                                            search_range_in_hz=self._search_range_in_hz,
-                                                            find_peaks_kwargs=self._find_peaks_kwargs)
-
-            if f_peak is None:
-                logger.info(f"No peak found in window {_idx}.")
-                self._main_peak_frq[_idx] = np.nan
-                self._main_peak_amp[_idx] = np.nan
-                self.valid_window_boolean_mask[_idx] = False
-                self.valid_peak_boolean_mask[_idx] = False
-            else:
-                all_curves_flat = False
-                self._main_peak_frq[_idx] = f_peak
-                self._main_peak_amp[_idx] = a_peak
-                self.valid_window_boolean_mask[_idx] = True
-                self.valid_peak_boolean_mask[_idx] = True
-
-        logger.info(f"None of the curves contained a peak.")
-        if all_curves_flat:
+        (self._main_peak_frq[:],
+         self._main_peak_amp[:]) = HvsrCurve._find_peaks_bounded_batch(self.frequency,
+                                                                        self.amplitude,
+                                                                        search_range_in_hz=self._search_range_in_hz,
+                                                                        find_peaks_kwargs=self._find_peaks_kwargs)
+        has_peak = ~np.isnan(self._main_peak_frq)
+        for _idx in np.flatnonzero(~has_peak):
+            logger.info(f"No peak found in window {_idx}.")
+        self.valid_window_boolean_mask[:] = has_peak
+        self.valid_peak_boolean_mask[:] = has_peak
+
+        if not np.any(has_peak):
+            logger.info(f"None of the curves contained a peak.")
             self.valid_window_boolean_mask[:] = True
 
     def mean_fn_frequency(self, distribution="lognormal"):
@@ -0,0 +1,596 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Native decoder for the common encodings of miniSEED (v2 and v3).
+
+Records with a fixed header and payloads encoded as 16-bit integers,
+32-bit integers, 32-bit floats, 64-bit floats, Steim1, or Steim2 are
+decoded without ``obspy``. Anything else (e.g., other encodings,
+records without blockette 1000, or traces with gaps) is reported with
+a ``NotImplementedError`` such that the caller may fall back to
+``obspy``.
+"""
+
+import io
+import pathlib
+from types import SimpleNamespace
+
+import numpy as np
+from numba import njit, prange
+
+from .parallel import PARALLEL_REGION_LOCK
+
+__all__ = ["read_miniseed"]
+
+# payload encodings supported, as defined in the SEED manual.
+ENCODING_INT16 = 1
+ENCODING_INT32 = 3
+ENCODING_FLOAT32 = 4
+ENCODING_FLOAT64 = 5
+ENCODING_STEIM1 = 10
+ENCODING_STEIM2 = 11
+SUPPORTED_ENCODINGS = (ENCODING_INT16, ENCODING_INT32, ENCODING_FLOAT32,
+                       ENCODING_FLOAT64, ENCODING_STEIM1, ENCODING_STEIM2)
+
+# status codes returned by the compiled scanner and decoder.
+STATUS_OK = 0
+STATUS_NOT_MINISEED = 1
+STATUS_UNSUPPORTED = 2
+STATUS_CORRUPT = 3
+
+# columns of the record table returned by the compiled scanner.
+(COL_OFFSET, COL_RECORD_LENGTH, COL_DATA_OFFSET, COL_DATA_LENGTH,
+ COL_ENCODING, COL_LITTLE_ENDIAN, COL_N_SAMPLES, COL_STARTTIME_NS,
+ COL_ID_OFFSET, COL_ID_LENGTH, COL_VERSION) = range(11)
+N_COLUMNS = 11
+
+NS_PER_S = 1_000_000_000
+
+
+@njit(cache=True)
+def _uint(buf, idx, n_bytes, little_endian):  # pragma: no cover
+    value = 0
+    for k in range(n_bytes):
+        byte = buf[idx + k] if not little_endian else buf[idx + n_bytes - 1 - k]
+        value = (value << 8) | np.int64(byte)
+    return value
+
+
+@njit(cache=True)
+def _uint32(buf, idx, little_endian):  # pragma: no cover
+    b0, b1, b2, b3 = np.int64(buf[idx]), np.int64(buf[idx+1]), np.int64(buf[idx+2]), np.int64(buf[idx+3])
+    if little_endian:
+        return (b3 << 24) | (b2 << 16) | (b1 << 8) | b0
+    return (b0 << 24) | (b1 << 16) | (b2 << 8) | b3
+
+
+@njit(cache=True)
+def _int(buf, idx, n_bytes, little_endian):  # pragma: no cover
+    value = _uint(buf, idx, n_bytes, little_endian)
+    if value >= (np.int64(1) << (8*n_bytes - 1)):
+        value -= np.int64(1) << (8*n_bytes)
+    return value
+
+
+@njit(cache=True)
+def _float(buf, idx, n_bytes, little_endian):  # pragma: no cover
+    tmp = np.empty(n_bytes, dtype=np.uint8)
+    for k in range(n_bytes):
+        tmp[k] = buf[idx + k] if little_endian else buf[idx + n_bytes - 1 - k]
+    if n_bytes == 4:
+        return np.float64(tmp.view(np.float32)[0])
+    return tmp.view(np.float64)[0]
+
+
+@njit(cache=True)
+def _epoch_ns(year, day_of_year, hour, minute, second, nanosecond):  # pragma: no cover
+    y = year - 1
+    days_before_year = 365*y + y//4 - y//100 + y//400
+    days_before_1970 = 365*1969 + 1969//4 - 1969//100 + 1969//400
+    days = days_before_year - days_before_1970 + day_of_year - 1
+    seconds = ((days*24 + hour)*60 + minute)*60 + second
+    return seconds*1_000_000_000 + nanosecond
+
+
+@njit(cache=True)
+def _sample_rate_v2(factor, multiplier):  # pragma: no cover
+    if factor == 0 or multiplier == 0:
+        return 0.
+    if factor > 0 and multiplier > 0:
+        return float(factor) * float(multiplier)
+    if factor > 0 and multiplier < 0:
+        return -float(factor) / float(multiplier)
+    if factor < 0 and multiplier > 0:
+        return -float(multiplier) / float(factor)
+    return 1. / (float(factor) * float(multiplier))
+
+
+@njit(cache=True)
+def _is_v2_header(buf, pos):  # pragma: no cover
+    for k in range(6):
+        byte = buf[pos + k]
+        if not ((48 <= byte <= 57) or byte == 32 or byte == 0):
+            return False
+    quality = buf[pos + 6]
+    if not (quality == 68 or quality == 82 or quality == 81 or quality == 77):
+        return False
+    return buf[pos + 7] == 32 or buf[pos + 7] == 0
+
+
+@njit(cache=True, nogil=True)
+def _scan_records(buf):  # pragma: no cover
+    """Locate and parse the header of every record in a buffer.
+
+    Returns
+    -------
+    tuple
+        Of the form ``(status, table, sample_rates)`` where ``table``
+        has one row per record and columns ``COL_*``.
+
+    """
+    n = buf.size
+    capacity = max(16, n // 256)
+    table = np.zeros((capacity, N_COLUMNS), dtype=np.int64)
+    sample_rates = np.zeros(capacity, dtype=np.float64)
+    n_records = 0
+    pos = 0
+    while pos < n:
+        if n_records == capacity:
+            capacity *= 2
+            _table = np.zeros((capacity, N_COLUMNS), dtype=np.int64)
+            _table[:n_records] = table[:n_records]
+            table = _table
+            _sample_rates = np.zeros(capacity, dtype=np.float64)
+            _sample_rates[:n_records] = sample_rates[:n_records]
+            sample_rates = _sample_rates
+        row = table[n_records]
+
+        # miniSEED v3, all header fields are little endian.
+        if pos + 40 <= n and buf[pos] == 77 and buf[pos+1] == 83 and buf[pos+2] == 3:
+            nanosecond = _uint(buf, pos + 4, 4, True)
+            year = _uint(buf, pos + 8, 2, True)
+            day = _uint(buf, pos + 10, 2, True)
+            rate = _float(buf, pos + 16, 8, True)
+            if rate < 0:
+                rate = -1. / rate
+            id_length = _uint(buf, pos + 33, 1, True)
+            extra_length = _uint(buf, pos + 34, 2, True)
+            data_length = _uint(buf, pos + 36, 4, True)
+            row[COL_OFFSET] = pos
+            row[COL_ID_OFFSET] = pos + 40
+            row[COL_ID_LENGTH] = id_length
+            row[COL_DATA_OFFSET] = pos + 40 + id_length + extra_length
+            row[COL_DATA_LENGTH] = data_length
+            row[COL_RECORD_LENGTH] = 40 + id_length + extra_length + data_length
+            row[COL_ENCODING] = buf[pos + 15]
+            row[COL_LITTLE_ENDIAN] = 1
+            row[COL_N_SAMPLES] = _uint(buf, pos + 24, 4, True)
+            row[COL_STARTTIME_NS] = _epoch_ns(year, day, buf[pos + 12], buf[pos + 13], buf[pos + 14], nanosecond)
+            row[COL_VERSION] = 3
+            sample_rates[n_records] = rate
+
+        # miniSEED v2, header byte order is inferred from the year.
+        elif pos + 48 <= n and _is_v2_header(buf, pos):
+            little = False
+            year = _uint(buf, pos + 20, 2, little)
+            day = _uint(buf, pos + 22, 2, little)
+            if not (1900 <= year <= 2100 and 1 <= day <= 366):
+                little = True
+                year = _uint(buf, pos + 20, 2, little)
+                day = _uint(buf, pos + 22, 2, little)
+                if not (1900 <= year <= 2100 and 1 <= day <= 366):
+                    return (STATUS_NOT_MINISEED, table[:n_records], sample_rates[:n_records])
+            n_samples = _uint(buf, pos + 30, 2, little)
+            rate = _sample_rate_v2(_int(buf, pos + 32, 2, little), _int(buf, pos + 34, 2, little))
+            activity_flags = buf[pos + 36]
+            n_blockettes = buf[pos + 39]
+            time_correction = _int(buf, pos + 40, 4, little)
+            data_offset = _uint(buf, pos + 44, 2, little)
+            blockette = _uint(buf, pos + 46, 2, little)
+            nanosecond = _uint(buf, pos + 28, 2, little) * 100_000
+
+            record_length = 0
+            encoding = -1
+            data_little = False
+            for _ in range(n_blockettes):
+                if blockette < 48 or pos + blockette + 8 > n:
+                    break
+                blockette_type = _uint(buf, pos + blockette, 2, little)
+                if blockette_type == 1000:
+                    encoding = buf[pos + blockette + 4]
+                    data_little = buf[pos + blockette + 5] == 0
+                    record_length = np.int64(1) << buf[pos + blockette + 6]
+                elif blockette_type == 1001:
+                    nanosecond += _int(buf, pos + blockette + 5, 1, little) * 1_000
+                elif blockette_type == 100:
+                    rate = _float(buf, pos + blockette + 4, 4, little)
+                blockette = _uint(buf, pos + blockette + 2, 2, little)
+                if blockette == 0:
+                    break
+
+            if record_length == 0:
+                return (STATUS_UNSUPPORTED, table[:n_records], sample_rates[:n_records])
+
+            # apply time correction, unless it has already been applied.
+            if time_correction != 0 and (activity_flags & 2) == 0:
+                nanosecond += time_correction * 100_000
+
+            row[COL_OFFSET] = pos
+            row[COL_ID_OFFSET] = pos + 8
+            row[COL_ID_LENGTH] = 12
+            row[COL_DATA_OFFSET] = pos + data_offset
+            row[COL_DATA_LENGTH] = record_length - data_offset if data_offset > 0 else 0
+            row[COL_RECORD_LENGTH] = record_length
+            row[COL_ENCODING] = encoding
+            row[COL_LITTLE_ENDIAN] = 1 if data_little else 0
+            row[COL_N_SAMPLES] = n_samples
+            row[COL_STARTTIME_NS] = _epoch_ns(year, day, buf[pos + 24], buf[pos + 25], buf[pos + 26], nanosecond)
+            row[COL_VERSION] = 2
+            sample_rates[n_records] = rate
+
+        else:
+            return (STATUS_NOT_MINISEED, table[:n_records], sample_rates[:n_records])
+
+        if pos + row[COL_RECORD_LENGTH] > n:
+            return (STATUS_CORRUPT, table[:n_records], sample_rates[:n_records])
+        pos += row[COL_RECORD_LENGTH]
+        n_records += 1
+
+    return (STATUS_OK, table[:n_records], sample_rates[:n_records])
+
+
+@njit(cache=True)
+def _decode_steim(buf, start, length, n_samples, steim2, little, out):  # pragma: no cover
+    """Decode Steim1 or Steim2 compressed record into ``out``.
+
+    Steim frames are big endian by definition, however some writers
+    (e.g., libmseed) follow the word order of blockette 1000 in which
+    case each difference is swapped individually.
+
+    Returns the number of samples decoded, or ``-1`` if the record is
+    corrupt.
+
+    """
+    n_frames = length // 64
+    count = 0
+    previous = np.int64(0)
+    for frame in range(n_frames):
+        frame_start = start + 64*frame
+        nibbles = _uint32(buf, frame_start, little)
+        for k in range(1, 16):
+            if count >= n_samples:
+                return count
+            idx = frame_start + 4*k
+
+            # integration constants in the first frame.
+            if frame == 0 and k == 1:
+                previous = _int(buf, idx, 4, little)
+                continue
+            if frame == 0 and k == 2:
+                continue
+
+            code = (nibbles >> (30 - 2*k)) & 3
+            if code == 0:
+                continue
+            word = _uint32(buf, idx, little)
+            if code == 1:
+                # single byte differences are stored in order regardless.
+                word = _uint32(buf, idx, False)
+                n_differences, bits = 4, 8
+            elif code == 2 and not steim2:
+                if little:
+                    word = (_uint(buf, idx, 2, True) << 16) | _uint(buf, idx + 2, 2, True)
+                n_differences, bits = 2, 16
+            elif code == 3 and not steim2:
+                n_differences, bits = 1, 32
+            else:
+                dnib = (word >> 30) & 3
+                if code == 2 and dnib == 1:
+                    n_differences, bits = 1, 30
+                elif code == 2 and dnib == 2:
+                    n_differences, bits = 2, 15
+                elif code == 2 and dnib == 3:
+                    n_differences, bits = 3, 10
+                elif code == 3 and dnib == 0:
+                    n_differences, bits = 5, 6
+                elif code == 3 and dnib == 1:
+                    n_differences, bits = 6, 5
+                elif code == 3 and dnib == 2:
+                    n_differences, bits = 7, 4
+                else:
+                    return -1
+
+            mask = (np.int64(1) << bits) - 1
+            sign = np.int64(1) << (bits - 1)
+            for j in range(n_differences):
+                if count >= n_samples:
+                    break
+                difference = (word >> ((n_differences - 1 - j)*bits)) & mask
+                if difference >= sign:
+                    difference -= mask + 1
+                # first difference is relative to the previous record.
+                if count > 0:
+                    previous += difference
+                out[count] = previous
+                count += 1
+    return count
+
+
+@njit(cache=True)
+def _decode_primitive(buf, start, n_samples, encoding, little, out):  # pragma: no cover
+    """Decode record of integers or floats into ``out``."""
+    if encoding == ENCODING_INT16:
+        n_bytes = 2
+    elif encoding == ENCODING_FLOAT64:
+        n_bytes = 8
+    else:
+        n_bytes = 4
+
+    # gather bytes in native (i.e., little endian) order.
+    raw = np.empty(n_samples*n_bytes, dtype=np.uint8)
+    if little:
+        raw[:] = buf[start:start + n_samples*n_bytes]
+    else:
+        for k in range(n_samples):
+            for b in range(n_bytes):
+                raw[k*n_bytes + b] = buf[start + k*n_bytes + n_bytes - 1 - b]
+
+    if encoding == ENCODING_INT16:
+        out[:] = raw.view(np.int16)
+    elif encoding == ENCODING_INT32:
+        out[:] = raw.view(np.int32)
+    elif encoding == ENCODING_FLOAT32:
+        out[:] = raw.view(np.float32)
+    else:
+        out[:] = raw.view(np.float64)
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def _decode_records(buf, table, out_offsets, out):  # pragma: no cover
+    """Decode the payload of every record into ``out``, in parallel.
+
+    Returns
+    -------
+    ndarray
+        Status of each record.
+
+    """
+    n_records = table.shape[0]
+    status = np.zeros(n_records, dtype=np.int64)
+    for r in prange(n_records):
+        start = table[r, COL_DATA_OFFSET]
+        length = table[r, COL_DATA_LENGTH]
+        n_samples = table[r, COL_N_SAMPLES]
+        encoding = table[r, COL_ENCODING]
+        little = table[r, COL_LITTLE_ENDIAN] == 1
+        _out = out[out_offsets[r]:out_offsets[r] + n_samples]
+        if encoding == ENCODING_STEIM1 or encoding == ENCODING_STEIM2:
+            if _decode_steim(buf, start, length, n_samples, encoding == ENCODING_STEIM2, little, _out) != n_samples:
+                status[r] = STATUS_CORRUPT
+        elif encoding == ENCODING_INT16 or encoding == ENCODING_INT32 or encoding == ENCODING_FLOAT32 or encoding == ENCODING_FLOAT64:
+            n_bytes = 2 if encoding == ENCODING_INT16 else (8 if encoding == ENCODING_FLOAT64 else 4)
+            if n_samples * n_bytes > length:
+                status[r] = STATUS_CORRUPT
+            else:
+                _decode_primitive(buf, start, n_samples, encoding, little, _out)
+        else:
+            status[r] = STATUS_UNSUPPORTED
+    return status
+
+
+def _buffer(source):
+    """Bytes of a file name or file-like object as ``uint8`` array.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    if isinstance(source, io.BytesIO):
+        return np.frombuffer(source.getbuffer(), dtype=np.uint8)[source.tell():]
+    if pathlib.Path(source).stat().st_size == 0:
+        msg = f"{source} is empty."
+        raise ValueError(msg)
+    return np.memmap(source, dtype=np.uint8, mode="r")
+
+
+def _identifier(buf, row):
+    """Network, station, location, and channel of a record.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    raw = bytes(buf[row[COL_ID_OFFSET]:row[COL_ID_OFFSET] + row[COL_ID_LENGTH]])
+    if row[COL_VERSION] == 2:
+        text = raw.decode("ascii", errors="replace")
+        station, location, channel, network = text[0:5], text[5:7], text[7:10], text[10:12]
+        return tuple(part.strip(" \x00") for part in (network, station, location, channel))
+
+    # FDSN source identifier, FDSN:NET_STA_LOC_BAND_SOURCE_SUBSOURCE.
+    text = raw.decode("ascii", errors="replace")
+    parts = text.split(":", 1)[-1].split("_")
+    if len(parts) != 6:
+        msg = f"Source identifier {text} is not supported."
+        raise NotImplementedError(msg)
+    network, station, location, *channel = parts
+    return (network, station, location, "".join(channel))
+
+
+def _index_traces(source):
+    """Scan the records of a file and group them into traces.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    source : str, pathlib.Path, or io.BytesIO
+        Name of the miniSEED file, or an in-memory file.
+
+    Returns
+    -------
+    tuple
+        Of the form ``(buf, traces)`` where ``buf`` is the (memory
+        mapped) content of ``source`` and ``traces`` is a ``list``, one
+        entry per channel in order of first appearance, with attributes
+        ``identifier``, ``sampling_rate``, and ``table`` (the records of
+        the channel sorted by start time). No samples are decoded.
+
+    Raises
+    ------
+    ValueError
+        If ``source`` is not a miniSEED file.
+    NotImplementedError
+        If ``source`` contains records that are not supported or a
+        channel's sample rate is not constant.
+
+    """
+    buf = _buffer(source)
+    status, table, sample_rates = _scan_records(buf)
+    if status == STATUS_NOT_MINISEED or len(table) == 0:
+        msg = f"{source} is not a miniSEED file."
+        raise ValueError(msg)
+    if status != STATUS_OK:
+        msg = f"{source} contains miniSEED records that are not supported."
+        raise NotImplementedError(msg)
+
+    # ignore records without samples (e.g., log or timing records).
+    keep = table[:, COL_N_SAMPLES] > 0
+    table, sample_rates = table[keep], sample_rates[keep]
+    if np.any(~np.isin(table[:, COL_ENCODING], SUPPORTED_ENCODINGS)):
+        msg = f"{source} contains data encodings that are not supported."
+        raise NotImplementedError(msg)
+
+    # group records into traces, identifiers are compared as raw bytes.
+    max_length = int(np.max(table[:, COL_ID_LENGTH]))
+    columns = np.arange(max_length)
+    raw = np.asarray(buf)[np.minimum(table[:, COL_ID_OFFSET, np.newaxis] + columns, buf.size - 1)]
+    raw[columns >= table[:, COL_ID_LENGTH, np.newaxis]] = 0
+    raw = np.ascontiguousarray(raw).view(np.dtype((np.void, max_length))).reshape(-1)
+    _, first, inverse = np.unique(raw, return_index=True, return_inverse=True)
+    groups = {}
+    for group in np.argsort(first):
+        identifier = _identifier(buf, table[first[group]])
+        indices = np.flatnonzero(inverse.reshape(-1) == group)
+        groups[identifier] = np.concatenate((groups.get(identifier, indices[:0]), indices))
+
+    traces = []
+    for identifier, indices in groups.items():
+        indices = indices[np.argsort(table[indices, COL_STARTTIME_NS], kind="stable")]
+        rates = sample_rates[indices]
+        if rates[0] <= 0 or np.any(np.abs(rates - rates[0]) > 1e-4*rates[0]):
+            msg = f"Sample rate of {'.'.join(identifier)} is not constant."
+            raise NotImplementedError(msg)
+        traces.append(SimpleNamespace(identifier=identifier,
+                                      sampling_rate=float(rates[0]),
+                                      table=table[indices]))
+    return buf, traces
+
+
+def _contiguous(trace):
+    """Check if the records of a trace are free of gaps and overlaps.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    delta_ns = NS_PER_S / trace.sampling_rate
+    n_samples = trace.table[:, COL_N_SAMPLES]
+    starts = trace.table[:, COL_STARTTIME_NS]
+    expected = starts[:-1] + n_samples[:-1]*delta_ns
+    return np.all(np.abs(starts[1:] - expected) <= delta_ns/2)
+
+
+def _decode(buf, table, source):
+    """Decode the samples of consecutive records.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    buf : ndarray
+        Content of ``source``, see ``_index_traces``.
+    table : ndarray
+        Records to be decoded, see ``_index_traces``.
+    source : str, pathlib.Path, or io.BytesIO
+        Name of the miniSEED file, used only for error messages.
+
+    Returns
+    -------
+    ndarray
+        Samples of the records, concatenated in the order of ``table``.
+
+    """
+    n_samples = table[:, COL_N_SAMPLES]
+    out_offsets = np.concatenate(([0], np.cumsum(n_samples)[:-1])).astype(np.int64)
+    out = np.empty(int(np.sum(n_samples)), dtype=np.float64)
+    with PARALLEL_REGION_LOCK:
+        status = _decode_records(buf, table, out_offsets, out)
+    if np.any(status != STATUS_OK):
+        msg = f"{source} contains records that could not be decoded."
+        raise NotImplementedError(msg)
+    return out
+
+
+def read_miniseed(source):
+    """Read all traces from a miniSEED file without ``obspy``.
+
+    Parameters
+    ----------
+    source : str, pathlib.Path, or io.BytesIO
+        Name of the miniSEED file, or an in-memory file.
+
+    Returns
+    -------
+    list
+        Of traces, one per channel, in order of first appearance. Each
+        trace has attributes ``data`` (``ndarray`` of ``float64``) and
+        ``stats`` (and its alias ``meta``) with attributes
+        ``network``, ``station``, ``location``, ``channel``, ``delta``,
+        ``sampling_rate``, ``npts``, and ``starttime_ns``, such that it
+        may be used in place of an ``obspy`` ``Trace`` where only
+        these attributes are required.
+
+    Raises
+    ------
+    ValueError
+        If ``source`` is not a miniSEED file.
+    NotImplementedError
+        If ``source`` is a miniSEED file but cannot be decoded natively
+        (e.g., unsupported encoding, gaps, or overlaps).
+
+    """
+    buf, traces = _index_traces(source)
+    for trace in traces:
+        if not _contiguous(trace):
+            msg = f"Trace {'.'.join(trace.identifier)} contains gaps or overlaps."
+            raise NotImplementedError(msg)
+
+    # decode each trace straight into its output buffer.
+    results = []
+    for trace in traces:
+        data = _decode(buf, trace.table, source)
+        network, station, location, channel = trace.identifier
+        stats = SimpleNamespace(network=network, station=station,
+                                location=location, channel=channel,
+                                sampling_rate=trace.sampling_rate,
+                                delta=1/trace.sampling_rate,
+                                npts=data.size,
+                                starttime_ns=int(trace.table[0, COL_STARTTIME_NS]))
+        results.append(SimpleNamespace(data=data, stats=stats, meta=stats))
+    return results
@@ -18,6 +18,7 @@
 """Summary of functions to control hvsrpy input-output (IO)."""
 
 import json
+import struct
 from copy import deepcopy
 
 import numpy as np
@@ -35,11 +36,15 @@ __all__ = [
     "read_settings_object_from_file",
 ]
 
+BINARY_EXTENSION = ".hvsrpy"
+BINARY_MAGIC = b"HVSRPY\x00\x01"
+BINARY_ALIGNMENT_IN_BYTES = 64
+
 def write_hvsr_object_to_file(hvsr,
                        fname,
                        distribution_mc="lognormal",
                        distribution_fn="lognormal"):
-    """Write HVSR object to text-based file.
+    """Write HVSR object to text-based or binary file.
 
     Parameters
     ----------
@@ -47,10 +52,12 @@ def write_hvsr_object_to_file(hvsr,
         HVSR object that should be archived to a file on disk.
     fname : str
         Name of output file where the contents of the HVSR object are
-        to be stored. May be a relative or the full path.
+        to be stored. May be a relative or the full path. If ``fname``
+        ends with ``".hvsrpy"`` the binary format is used, otherwise
+        the text-based format is used.
     distribution_mc : {"normal", "lognormal"}, optional
         Assumed distribution of mean curve, default is "lognormal".
-        Ignored for ``HvsrDiffuseField`` objects.
+        Ignored for ``HvsrDiffuseField`` objects and the binary format.
     distribution_fn : {"normal", "lognormal"}, optional
         Assumed distribution of ``fn``, the default is ``"lognormal"``.
         Ignored for ``HvsrDiffuseField`` objects.
@@ -58,9 +65,20 @@ def write_hvsr_object_to_file(hvsr,
     Returns
     -------
     None
-        Instead writes HVSR object to disk in text-based format.
+        Instead writes HVSR object to disk.
+
+    Notes
+    -----
+    The binary format consists of a short fixed-size preamble, a
+    JSON header containing the meta information, masks, and array
+    layout, followed by the raw (64-byte aligned) arrays, such that
+    the amplitudes can be memory-mapped on reading.
 
     """
+    if str(fname).endswith(BINARY_EXTENSION):
+        _write_hvsr_object_to_binary_file(hvsr, fname)
+        return
+
     meta = deepcopy(hvsr.meta)
 
     if isinstance(hvsr, HvsrTraditional):
@@ -137,14 +155,21 @@ def write_hvsr_object_to_file(hvsr,
     np.savetxt(fname, array, delimiter=",", header=header, encoding="utf-8")
 
 
-def read_hvsr_object_from_file(fname):
-    """Reads HVSR object from text-based file.
+def read_hvsr_object_from_file(fname, mmap_mode="r"):
+    """Reads HVSR object from text-based or binary file.
 
     Parameters
     ----------
     fname : str
         Name of output file where the contents of the HVSR object are
-        stored. May be a relative or the full path.
+        stored. May be a relative or the full path. If ``fname``
+        ends with ``".hvsrpy"`` the binary format is assumed, otherwise
+        the text-based format is assumed.
+    mmap_mode : {"r", "c", None}, optional
+        Only used for the binary format, if not ``None`` the HVSR
+        amplitudes are memory-mapped using the provided mode
+        (see ``numpy.memmap``), default is ``"r"`` (i.e., read-only),
+        if ``None`` the amplitudes are read into memory.
 
     Returns
     -------
@@ -152,6 +177,9 @@ def read_hvsr_object_from_file(fname):
         HVSR object that was archived in a file on disk.
 
     """
+    if str(fname).endswith(BINARY_EXTENSION):
+        return _read_hvsr_object_from_binary_file(fname, mmap_mode=mmap_mode)
+
     with open(fname, "r") as f:
         lines = f.readlines()
 
@@ -222,6 +250,141 @@ def read_hvsr_object_from_file(fname):
     return hvsr
 
 
+def _align(nbytes, alignment=BINARY_ALIGNMENT_IN_BYTES):
+    """Round ``nbytes`` up to the next multiple of ``alignment``.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    return -(-nbytes // alignment) * alignment
+
+
+def _write_hvsr_object_to_binary_file(hvsr, fname):
+    """Write HVSR object to binary file.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    header = dict(meta=deepcopy(hvsr.meta))
+
+    if isinstance(hvsr, HvsrTraditional):
+        hvsrs = [hvsr]
+    elif isinstance(hvsr, HvsrAzimuthal):
+        hvsrs = hvsr.hvsrs
+        header["azimuths"] = list(hvsr.azimuths)
+    elif isinstance(hvsr, HvsrDiffuseField):
+        hvsrs = []
+    else:
+        raise NotImplementedError
+
+    if len(hvsrs) == 0:
+        arrays = dict(frequency=hvsr.frequency, amplitude=hvsr.amplitude)
+    else:
+        # Note: HvsrAzimuthal does not require each HvsrTraditional to have the same number of curves.
+        header["n_curves"] = [_hvsr.n_curves for _hvsr in hvsrs]
+        header["search_range_in_hz"] = hvsrs[0]._search_range_in_hz
+        header["find_peaks_kwargs"] = hvsrs[0].meta["find_peaks_kwargs"]
+        arrays = dict(
+            frequency=hvsrs[0].frequency,
+            amplitude=np.concatenate([_hvsr.amplitude for _hvsr in hvsrs]),
+            main_peak_frq=np.concatenate([_hvsr._main_peak_frq for _hvsr in hvsrs]),
+            main_peak_amp=np.concatenate([_hvsr._main_peak_amp for _hvsr in hvsrs]),
+            valid_window_boolean_mask=np.concatenate([_hvsr.valid_window_boolean_mask for _hvsr in hvsrs]),
+            valid_peak_boolean_mask=np.concatenate([_hvsr.valid_peak_boolean_mask for _hvsr in hvsrs]),
+        )
+
+    # layout of raw arrays, offsets relative to the start of the data.
+    arrays = {key: np.ascontiguousarray(value) for key, value in arrays.items()}
+    layout = {}
+    offset = 0
+    for key, value in arrays.items():
+        layout[key] = dict(dtype=value.dtype.str, shape=list(value.shape),
+                           offset=offset)
+        offset = _align(offset + value.nbytes)
+    header["arrays"] = layout
+
+    header = json.dumps(header).encode("utf-8")
+    preamble = BINARY_MAGIC + struct.pack("<Q", len(header))
+    data_start = _align(len(preamble) + len(header))
+    with open(fname, "wb") as f:
+        f.write(preamble)
+        f.write(header)
+        for key, value in arrays.items():
+            f.write(b"\x00"*(data_start + layout[key]["offset"] - f.tell()))
+            value.tofile(f)
+
+
+def _read_hvsr_object_from_binary_file(fname, mmap_mode="r"):
+    """Read HVSR object from binary file.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    with open(fname, "rb") as f:
+        preamble = f.read(len(BINARY_MAGIC) + 8)
+        if preamble[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            msg = f"{fname} is not a valid {BINARY_EXTENSION} file."
+            raise ValueError(msg)
+        (header_nbytes,) = struct.unpack("<Q", preamble[len(BINARY_MAGIC):])
+        header = json.loads(f.read(header_nbytes).decode("utf-8"))
+    data_start = _align(len(preamble) + header_nbytes)
+
+    def load(key, mmap_mode=None):
+        layout = header["arrays"][key]
+        kwargs = dict(dtype=np.dtype(layout["dtype"]),
+                      shape=tuple(layout["shape"]),
+                      offset=data_start + layout["offset"])
+        if mmap_mode is None:
+            with open(fname, "rb") as f:
+                f.seek(kwargs["offset"])
+                count = int(np.prod(kwargs["shape"]))
+                array = np.fromfile(f, dtype=kwargs["dtype"], count=count)
+            return array.reshape(kwargs["shape"])
+        return np.memmap(fname, mode=mmap_mode, **kwargs)
+
+    meta = header["meta"]
+    frequency = load("frequency")
+    amplitude = load("amplitude", mmap_mode=mmap_mode)
+
+    if meta["processing_method"] == "diffuse_field":
+        hvsr = HvsrDiffuseField(frequency, amplitude, meta=meta)
+        hvsr.update_peaks_bounded(search_range_in_hz=tuple(meta["search_range_in_hz"]),
+                                  find_peaks_kwargs=meta["find_peaks_kwargs"])
+        return hvsr
+
+    main_peak_frq = load("main_peak_frq")
+    main_peak_amp = load("main_peak_amp")
+    valid_window_boolean_mask = load("valid_window_boolean_mask")
+    valid_peak_boolean_mask = load("valid_peak_boolean_mask")
+
+    hvsrs = []
+    start = 0
+    for n_curves in header["n_curves"]:
+        stop = start + n_curves
+        hvsrs.append(HvsrTraditional._from_precomputed(
+            frequency,
+            amplitude[start:stop],
+            main_peak_frq[start:stop],
+            main_peak_amp[start:stop],
+            valid_window_boolean_mask[start:stop],
+            valid_peak_boolean_mask[start:stop],
+            search_range_in_hz=header["search_range_in_hz"],
+            find_peaks_kwargs=header["find_peaks_kwargs"],
+            meta=meta if meta["processing_method"] == "traditional" else {},
+        ))
+        start = stop
+
+    if meta["processing_method"] == "traditional":
+        return hvsrs[0]
+    elif meta["processing_method"] == "azimuthal":
+        return HvsrAzimuthal._from_precomputed(hvsrs, header["azimuths"], meta=meta)
+    else:
+        raise NotImplementedError
+
+
 def write_settings_object_to_file(settings_object, fname):
     """Write HVSR settings object to text-based file.
 
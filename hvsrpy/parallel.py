@@ -0,0 +1,32 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Coordination of numba parallel regions launched from Python threads.
+
+numba's default ``workqueue`` threading layer (used when neither TBB nor
+OpenMP is available) terminates the interpreter if ``parallel=True``
+functions are called concurrently from more than one Python thread.
+Launches of such functions are therefore serialized with
+``PARALLEL_REGION_LOCK``; each launch still uses all of numba's threads.
+"""
+
+import threading
+
+__all__ = ["PARALLEL_REGION_LOCK"]
+
+# re-entrant so a parallel region may be launched while already held.
+PARALLEL_REGION_LOCK = threading.RLock()
@@ -18,12 +18,71 @@
 import warnings
 
 import numpy as np
+from scipy.signal import detrend
 
 from .seismic_recording_3c import SeismicRecording3C
 from .instrument_response import _remove_instrument_response, _differentiate
 from .processing import prepare_fft_settings
 
 
+def _split_and_detrend(srecord3c, window_length_in_seconds, detrend_type,
+                       dtype="float64"):
+    """Split record into time windows and detrend each window.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    srecord3c : SeismicRecording3C
+        Record to be split.
+    window_length_in_seconds : float or None
+        Duration of each window in seconds, if ``None`` the record is
+        not split.
+    detrend_type : {"constant", "linear", "none"} or None
+        Type of detrend applied to each window, if ``None`` or
+        ``"none"`` no detrend is performed.
+    dtype : {"float64", "float32"}, optional
+        Floating point precision of the windows returned, default is
+        ``"float64"``.
+
+    Returns
+    -------
+    list of SeismicRecording3C
+        Time windows.
+
+    """
+    if window_length_in_seconds is not None:
+        windows = srecord3c.split(window_length_in_seconds)
+    else:
+        windows = [srecord3c]
+
+    components = ["ns", "ew", "vt"]
+    if (detrend_type is None) or (detrend_type == "none"):
+        for window in windows:
+            for component in components:
+                tseries = getattr(window, component)
+                tseries.amplitude = tseries.amplitude.astype(dtype, copy=False)
+        return windows
+
+    # detrend all windows of equal length at once to boost performance.
+    windows_by_n_samples = {}
+    for window in windows:
+        windows_by_n_samples.setdefault(window.vt.n_samples, []).append(window)
+
+    for group in windows_by_n_samples.values():
+        amplitudes = np.array([[getattr(window, component).amplitude for window in group]
+                               for component in components])
+        amplitudes = detrend(amplitudes, axis=-1, type=detrend_type,
+                             overwrite_data=True).astype(dtype, copy=False)
+        for w_idx, window in enumerate(group):
+            for c_idx, component in enumerate(components):
+                getattr(window, component).amplitude = amplitudes[c_idx, w_idx]
+            window.meta["detrend"] = detrend_type
+
+    return windows
+
+
 def hvsr_preprocess(records, settings):
 
     preprocessed_records = []
@@ -51,17 +110,11 @@ def hvsr_preprocess(records, settings):
             warnings.simplefilter("ignore")
             srecord3c.butterworth_filter(settings.filter_corner_frequencies_in_hz)
 
-        # divide raw signal into time windows.
-        if settings.window_length_in_seconds is not None:
-            windows = srecord3c.split(settings.window_length_in_seconds)
-        else:
-            windows = [srecord3c]
-
-        # detrend each time window individually.
-        if (settings.detrend is not None) and (settings.detrend != "none"):
-            for window in windows:
-                window.detrend(type=settings.detrend)
-
+        # divide raw signal into time windows and detrend.
+        windows = _split_and_detrend(srecord3c,
+                                     settings.window_length_in_seconds,
+                                     settings.detrend,
+                                     dtype=settings.dtype)
         preprocessed_records.extend(windows)
 
     return preprocessed_records
@@ -120,17 +173,10 @@ def psd_preprocess(records, settings):
                                              settings.fft_settings)
                 setattr(srecord3c, component, new_tseries)
 
-        # divide raw signal into time windows.
-        if settings.window_length_in_seconds is not None:
-            windows = srecord3c.split(settings.window_length_in_seconds)
-        else:
-            windows = [srecord3c]
-
-        # detrend each time window individually.
-        if (settings.detrend is not None) and (settings.detrend != "none"):
-            for window in windows:
-                window.detrend(type=settings.detrend)
-
+        # divide raw signal into time windows and detrend.
+        windows = _split_and_detrend(srecord3c,
+                                     settings.window_length_in_seconds,
+                                     settings.detrend)
         preprocessed_records.extend(windows)
 
     return preprocessed_records
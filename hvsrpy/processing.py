@@ -15,16 +15,22 @@
 #     You should have received a copy of the GNU General Public License
 #     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
 
+import os
 import warnings
+import copy
+import itertools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import numpy as np
-from numpy.fft import rfft
+from scipy.fft import rfft
 
-from .smoothing import SMOOTHING_OPERATORS
+from .smoothing import apply_smoothing
 from .hvsr_traditional import HvsrTraditional
 from .hvsr_azimuthal import HvsrAzimuthal
 from .hvsr_diffuse_field import HvsrDiffuseField
-from .timeseries import TimeSeries
+from .timeseries import _taper
+from .seismic_recording_3c import SeismicRecording3C
 from .settings import HvsrTraditionalSingleAzimuthProcessingSettings
 from .psd import Psd
 
@@ -73,6 +79,10 @@ COMBINE_HORIZONTAL_REGISTER = {
 }
 
 
+# upper limit on the memory used by each batched fft, in bytes.
+FFT_BATCH_SIZE_IN_BYTES = 2**26
+
+
 def nextpow2(n, minimum_power_of_two=2**15):  # 2**15 = 32768
     power_of_two = minimum_power_of_two
     while True:
@@ -166,58 +176,199 @@ def check_nyquist_frequency(dt, fcs):
         raise ValueError(msg)
 
 
-def traditional_hvsr_processing(records, settings):
-    prepare_fft_settings(records, settings)
+def _processing_dtype(settings):
+    """Floating point type in which records are to be processed.
 
-    records, dt_with_count = prepare_records_with_inconsistent_dt(
-        records, settings)
+    .. warning::
+        Private methods are subject to change without warning.
 
-    # allocate array for hvsr results.
-    fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
-    hvsr_spectra = np.empty((len(records), len(fcs)))
-    check_nyquist_frequency(max(dt_with_count.keys()), fcs)
+    """
+    dtype = np.dtype(getattr(settings, "dtype", "float64"))
+    if dtype not in (np.float32, np.float64):
+        msg = f"dtype must be 'float32' or 'float64', not '{dtype}'."
+        raise ValueError(msg)
+    return dtype
 
-    # process in groups of constant dt for efficiency.
-    hvsr_idx = 0
-    cur_idx = 0
+
+def _tapered_stack(records, window_type_and_width, components=("ns", "ew", "vt"),
+                   dtype=np.float64):
+    """Stack and taper components of records into a contiguous array.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    records : iterable of SeismicRecording3C
+        Records to be stacked, all should share a common time step.
+    window_type_and_width : list
+        A list with entries like ``["tukey", 0.1]`` that control the
+        window type and width, respectively.
+    components : tuple of str, optional
+        Components to be stacked, default is ``("ns", "ew", "vt")``.
+    dtype : dtype, optional
+        Floating point type of the stack, default is ``np.float64``.
+
+    Returns
+    -------
+    ndarray
+        Of shape ``(n_records, n_components, n_samples)``, where
+        ``n_samples`` is the largest number of samples of any record.
+        Each record is tapered over its own length and then zero
+        padded, such that its transform is identical to that of the
+        tapered record.
+
+    """
+    n_samples = max(record.vt.n_samples for record in records)
+    stack = np.zeros((len(records), len(components), n_samples), dtype=dtype)
+    tapers = {}
+    for r_idx, record in enumerate(records):
+        for c_idx, component in enumerate(components):
+            tseries = getattr(record, component)
+            stack[r_idx, c_idx, :tseries.n_samples] = tseries.amplitude
+
+        _n_samples = record.vt.n_samples
+        if _n_samples not in tapers:
+            tapers[_n_samples] = _taper(_n_samples, *window_type_and_width).astype(dtype)
+        stack[r_idx, :, :_n_samples] *= tapers[_n_samples]
+    return stack
+
+
+def _batched_rfft(records, settings, components=("ns", "ew", "vt")):
+    """Fourier transform of tapered records in batches of constant size.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    records : list of SeismicRecording3C
+        Records to be transformed, all should share a common time step.
+    settings : HvsrProcessingSettings
+        Processing settings, ``window_type_and_width``,
+        ``fft_settings``, and ``dtype`` (if defined) are used.
+    components : tuple of str, optional
+        Components to be transformed, default is ``("ns", "ew", "vt")``.
+
+    Yields
+    ------
+    tuple
+        Of the form ``(start_idx, stop_idx, fft)`` where ``fft`` is the
+        complex-valued transform of ``records[start_idx:stop_idx]`` of
+        shape ``(stop_idx - start_idx, n_components, n_frequencies)``,
+        ``complex64`` if ``settings.dtype`` is ``"float32"`` otherwise
+        ``complex128``.
+
+    """
+    dtype = _processing_dtype(settings)
+    n_frequencies = settings.fft_settings["n"]//2 + 1
+    bytes_per_record = len(components) * n_frequencies * 2*dtype.itemsize
+    batch_size = max(1, FFT_BATCH_SIZE_IN_BYTES // bytes_per_record)
+    for start_idx in range(0, len(records), batch_size):
+        batch = records[start_idx:start_idx+batch_size]
+        stack = _tapered_stack(batch, settings.window_type_and_width,
+                               components=components, dtype=dtype)
+        fft = rfft(stack, axis=-1, **settings.fft_settings)
+        yield (start_idx, start_idx + len(batch), fft)
+
+
+def _traditional_raw_spectra(records, dt_with_count, settings):
+    """Unsmoothed horizontal and vertical amplitude spectra.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    records : list of SeismicRecording3C
+        Records to be transformed, after preparation with
+        ``prepare_records_with_inconsistent_dt``.
+    dt_with_count : dict
+        Number of records with each time step.
+    settings : HvsrTraditionalProcessingSettings
+        Processing settings, ``window_type_and_width``,
+        ``fft_settings``, and ``method_to_combine_horizontals`` are
+        used; ``smoothing`` is not.
+
+    Returns
+    -------
+    tuple
+        Of the form ``(hvsr_indices_to_order, groups)`` where
+        ``groups`` is a list with one entry per time step of the form
+        ``(dt, fft_frq, raw_spectra, count)``; the first ``count`` rows of
+        ``raw_spectra`` are the combined horizontals and the remaining
+        rows are the verticals.
+
+    """
     hvsr_indices_to_order = np.empty(len(records), dtype=int)
+    groups = []
+    cur_idx = 0
+    method = COMBINE_HORIZONTAL_REGISTER[settings.method_to_combine_horizontals]
     for dt, count in dt_with_count.items():
 
-        fft_frq = np.fft.rfftfreq(settings.fft_settings["n"], dt)
-        raw_spectra = np.empty((count*2, len(fft_frq)))
-        hor_idx = 0
-        ver_idx = count
+        # only examine records with the current dt.
+        group = []
         for org_idx, record in enumerate(records):
-            # only examine records with the current dt.
             if record.ns.dt_in_seconds != dt:
                 continue
 
             # track original position for later reorder.
             hvsr_indices_to_order[org_idx] = cur_idx
             cur_idx += 1
+            group.append(record)
 
-            # window time series to mitigate frequency-domain artifacts.
-            record.window(*settings.window_type_and_width)
+        # window and transform all records at once to boost performance.
+        fft_frq = np.fft.rfftfreq(settings.fft_settings["n"], dt)
+        raw_spectra = np.empty((count*2, len(fft_frq)),
+                               dtype=_processing_dtype(settings))
+        for start_idx, stop_idx, fft in _batched_rfft(group, settings):
+            fft = np.abs(fft)
 
-            # compute fft of horizontals and combine.
-            fft_ns = np.abs(rfft(record.ns.amplitude, **settings.fft_settings))
-            fft_ew = np.abs(rfft(record.ew.amplitude, **settings.fft_settings))
-            method = COMBINE_HORIZONTAL_REGISTER[settings.method_to_combine_horizontals]
-            h = method(fft_ns, fft_ew, settings)
+            # combine horizontals.
+            raw_spectra[start_idx:stop_idx] = method(fft[:, 0], fft[:, 1], settings)
 
-            # compute fft of vertical.
-            v = np.abs(rfft(record.vt.amplitude, **settings.fft_settings))
+            # vertical.
+            raw_spectra[count+start_idx:count+stop_idx] = fft[:, 2]
 
-            # store.
-            raw_spectra[hor_idx] = h
-            raw_spectra[ver_idx] = v
-            hor_idx += 1
-            ver_idx += 1
+        groups.append((dt, fft_frq, raw_spectra, count))
 
+    return (hvsr_indices_to_order, groups)
+
+
+def _traditional_hvsr_from_raw_spectra(records, raw, settings):
+    """Smooth raw amplitude spectra and compute their ratio.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    records : list of SeismicRecording3C
+        Records from which ``raw`` was computed, only their metadata
+        is used.
+    raw : tuple
+        Output of ``_traditional_raw_spectra``.
+    settings : HvsrTraditionalProcessingSettings
+        Processing settings, ``smoothing`` is used.
+
+    Returns
+    -------
+    HvsrTraditional
+        Traditional HVSR, one curve per record.
+
+    """
+    hvsr_indices_to_order, groups = raw
+
+    # allocate array for hvsr results.
+    fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
+    hvsr_spectra = np.empty((len(hvsr_indices_to_order), len(fcs)),
+                            dtype=groups[0][2].dtype)
+    check_nyquist_frequency(max(group[0] for group in groups), fcs)
+
+    hvsr_idx = 0
+    for _, fft_frq, raw_spectra, count in groups:
         # smooth each dt group at once to boost performance.
-        operator, bandwidth = settings.smoothing["operator"], settings.smoothing["bandwidth"]
-        smooth_spectra = SMOOTHING_OPERATORS[operator](
-            fft_frq, raw_spectra, fcs, bandwidth)
+        smooth_spectra = apply_smoothing(fft_frq, raw_spectra, settings.smoothing)
 
         # compute hvsr.
         hvsr_spectra[hvsr_idx:hvsr_idx +
@@ -235,15 +386,93 @@ def traditional_hvsr_processing(records, settings):
     return HvsrTraditional(fcs, hvsr_spectra, meta={**records[0].meta, **settings.attr_dict})
 
 
-def traditional_single_azimuth_hvsr_processing(records, settings):
+def traditional_hvsr_processing(records, settings):
     prepare_fft_settings(records, settings)
 
+    records, dt_with_count = prepare_records_with_inconsistent_dt(
+        records, settings)
+
+    raw = _traditional_raw_spectra(records, dt_with_count, settings)
+    return _traditional_hvsr_from_raw_spectra(records, raw, settings)
+
+
+def _rotated_amplitude_spectra(fft_ns, fft_ew, azimuths_in_degrees):
+    """Amplitude spectra of the horizontals rotated to each azimuth.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    As rotation, windowing, and the Fourier transform are linear, the
+    transform of the horizontal rotated in the time domain to an azimuth
+    (see ``single_azimuth``) is equal to the same combination of the
+    complex-valued transforms of the north-south and east-west
+    components.
+
+    Parameters
+    ----------
+    fft_ns, fft_ew : ndarray
+        Complex-valued Fourier transforms of the north-south and
+        east-west components of common shape.
+    azimuths_in_degrees : iterable of float
+        Rotation azimuths in degrees measured clockwise positive from
+        north.
+
+    Returns
+    -------
+    ndarray
+        Of shape ``(n_azimuths, *fft_ns.shape)``, the amplitude spectra
+        of the rotated horizontal, one per azimuth.
+
+    """
+    radians_from_north = np.radians(np.atleast_1d(azimuths_in_degrees))
+    radians_from_north = radians_from_north.reshape(-1, *([1]*fft_ns.ndim))
+
+    # match precision of the transforms (e.g., to keep complex64).
+    cos = np.cos(radians_from_north).astype(fft_ns.real.dtype)
+    sin = np.sin(radians_from_north).astype(fft_ns.real.dtype)
+    return np.abs(cos*fft_ns + sin*fft_ew)
+
+
+def _single_azimuth_hvsr_spectra(records, settings, azimuths_in_degrees):
+    """HVSR spectra of records with horizontals rotated to each azimuth.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Each component is transformed only once per record, the horizontal
+    for each azimuth is formed in the frequency domain (see
+    ``_rotated_amplitude_spectra``), and the smoothed vertical is
+    shared by all azimuths.
+
+    Parameters
+    ----------
+    records : list of SeismicRecording3C
+        Records to be processed, must be prepared (i.e., passed
+        through ``prepare_fft_settings``).
+    settings : HvsrProcessingSettings
+        Processing settings, ``window_type_and_width``,
+        ``fft_settings``, ``smoothing``, and
+        ``handle_dissimilar_time_steps_by`` are used.
+    azimuths_in_degrees : iterable of float
+        Rotation azimuths in degrees measured clockwise positive from
+        north.
+
+    Returns
+    -------
+    tuple
+        Of the form ``(records, hvsr_spectra)`` where ``records`` are
+        the records after handling dissimilar time steps and
+        ``hvsr_spectra`` is of shape
+        ``(n_azimuths, n_records, n_center_frequencies)``.
+
+    """
     records, dt_with_count = prepare_records_with_inconsistent_dt(
         records, settings)
 
     # allocate array for hvsr results.
     fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
-    hvsr_spectra = np.empty((len(records), len(fcs)))
+    hvsr_spectra = np.empty((len(azimuths_in_degrees), len(records), len(fcs)),
+                            dtype=_processing_dtype(settings))
     check_nyquist_frequency(max(dt_with_count.keys()), fcs)
 
     # process in groups of constant dt for efficiency.
@@ -252,52 +481,42 @@ def traditional_single_azimuth_hvsr_processing(records, settings):
     hvsr_indices_to_order = np.empty(len(records), dtype=int)
     for dt, count in dt_with_count.items():
 
-        fft_frq = np.fft.rfftfreq(settings.fft_settings["n"], dt)
-        raw_spectra = np.empty((count*2, len(fft_frq)))
-        hor_idx = 0
-        ver_idx = count
+        # only examine records with the current dt.
+        group = []
         for org_idx, record in enumerate(records):
-            # only examine records with defined dt.
             if record.ns.dt_in_seconds != dt:
                 continue
 
             # track original position for later reorder.
             hvsr_indices_to_order[org_idx] = cur_idx
             cur_idx += 1
+            group.append(record)
 
-            # combine horizontal components in the time domain.
-            h = single_azimuth(record.ns.amplitude,
-                               record.ew.amplitude,
-                               settings.azimuth_in_degrees)
-            h = TimeSeries(h, record.ns.dt_in_seconds)
-
-            # window time series to mitigate frequency-domain artifacts.
-            h.window(*settings.window_type_and_width)
-            v = TimeSeries.from_timeseries(record.vt)
-            v.window(*settings.window_type_and_width)
-
-            # compute fourier transform.
-            raw_spectra[hor_idx] = np.abs(
-                rfft(h.amplitude, **settings.fft_settings))
-            raw_spectra[ver_idx] = np.abs(
-                rfft(v.amplitude, **settings.fft_settings))
-            hor_idx += 1
-            ver_idx += 1
-
-        # smooth each dt group at once to boost performance.
-        operator, bandwidth = settings.smoothing["operator"], settings.smoothing["bandwidth"]
-        smooth_spectra = SMOOTHING_OPERATORS[operator](
-            fft_frq, raw_spectra, fcs, bandwidth)
-
-        # compute hvsr.
-        hvsr_spectra[hvsr_idx:hvsr_idx +
-                     count] = smooth_spectra[:count] / smooth_spectra[count:]
+        # transform each component only once, rotate in frequency domain.
+        fft_frq = np.fft.rfftfreq(settings.fft_settings["n"], dt)
+        for start_idx, stop_idx, fft in _batched_rfft(group, settings):
+            smooth_v = apply_smoothing(fft_frq, np.abs(fft[:, 2]), settings.smoothing)
+            for az_idx, azimuth in enumerate(azimuths_in_degrees):
+                raw_h = _rotated_amplitude_spectra(fft[:, 0], fft[:, 1], azimuth)[0]
+                smooth_h = apply_smoothing(fft_frq, raw_h, settings.smoothing)
+                hvsr_spectra[az_idx, hvsr_idx+start_idx:hvsr_idx+stop_idx] = smooth_h / smooth_v
         hvsr_idx += count
 
     # reorder hvsr spectra to follow original order.
-    hvsr_spectra = hvsr_spectra[hvsr_indices_to_order]
+    hvsr_spectra = hvsr_spectra[:, hvsr_indices_to_order]
 
-    return HvsrTraditional(fcs, hvsr_spectra, meta={**records[0].meta, **settings.attr_dict})
+    return (records, hvsr_spectra)
+
+
+def traditional_single_azimuth_hvsr_processing(records, settings):
+    prepare_fft_settings(records, settings)
+
+    records, hvsr_spectra = _single_azimuth_hvsr_spectra(records,
+                                                         settings,
+                                                         [settings.azimuth_in_degrees])
+
+    fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
+    return HvsrTraditional(fcs, hvsr_spectra[0], meta={**records[0].meta, **settings.attr_dict})
 
 
 def traditional_rotdpp_hvsr_processing(records, settings):
@@ -308,59 +527,50 @@ def traditional_rotdpp_hvsr_processing(records, settings):
 
     # allocate array for hvsr results.
     fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
-    hvsr_spectra = np.empty((len(records), len(fcs)))
+    dtype = _processing_dtype(settings)
+    hvsr_spectra = np.empty((len(records), len(fcs)), dtype=dtype)
     check_nyquist_frequency(max(dt_with_count.keys()), fcs)
 
     # process in groups of constant dt for efficiency.
     hvsr_idx = 0
     cur_idx = 0
     hvsr_indices_to_order = np.empty(len(records), dtype=int)
-    # TODO (jpv): Accelerate computation by smoothing all azimuth and all dt simultaneously.
     for dt, _ in dt_with_count.items():
 
-        fft_frq = np.fft.rfftfreq(settings.fft_settings["n"], dt)
-        raw_spectra_per_record = np.empty(
-            (len(settings.azimuths_in_degrees)+1, len(fft_frq)))
+        # only examine records with the current dt.
+        group = []
         for org_idx, record in enumerate(records):
-            # only examine records with defined dt.
             if record.ns.dt_in_seconds != dt:
                 continue
 
             # track original position for later reorder.
             hvsr_indices_to_order[org_idx] = cur_idx
             cur_idx += 1
+            group.append(record)
 
-            # prepare vertical component only once per record.
-            v = TimeSeries.from_timeseries(record.vt)
-            v.window(*settings.window_type_and_width)
-            fft_v = np.abs(rfft(v.amplitude, **settings.fft_settings))
-            raw_spectra_per_record[-1] = fft_v
-
-            # rotate horizontals through defined azimuths.
-            for idx, azimuth in enumerate(settings.azimuths_in_degrees):
-                h = single_azimuth(record.ns.amplitude,
-                                   record.ew.amplitude,
-                                   azimuth
-                                   )
-                h = TimeSeries(h, dt_in_seconds=record.ns.dt_in_seconds)
-                h.window(*settings.window_type_and_width)
-                fft_h = np.abs(rfft(h.amplitude, **settings.fft_settings))
-                raw_spectra_per_record[idx] = fft_h
-
-            # smooth.
-            operator, bandwidth = settings.smoothing["operator"], settings.smoothing["bandwidth"]
-            smooth_spectra = SMOOTHING_OPERATORS[operator](
-                fft_frq, raw_spectra_per_record, fcs, bandwidth)
-
-            # select ppth percentile.
-            smooth_h = np.percentile(smooth_spectra[:-1],
-                                     settings.ppth_percentile_for_rotdpp_computation,
-                                     axis=0)
-            smooth_v = smooth_spectra[-1]
-
-            # compute hvsr.
-            hvsr_spectra[hvsr_idx] = smooth_h / smooth_v
-            hvsr_idx += 1
+        # transform each component only once, rotate in frequency domain.
+        fft_frq = np.fft.rfftfreq(settings.fft_settings["n"], dt)
+        raw_spectra_per_record = np.empty(
+            (len(settings.azimuths_in_degrees)+1, len(fft_frq)), dtype=dtype)
+        for _, _, fft in _batched_rfft(group, settings):
+            for fft_ns, fft_ew, fft_vt in fft:
+                raw_spectra_per_record[:-1] = _rotated_amplitude_spectra(fft_ns,
+                                                                         fft_ew,
+                                                                         settings.azimuths_in_degrees)
+                raw_spectra_per_record[-1] = np.abs(fft_vt)
+
+                # smooth all azimuths and the vertical at once.
+                smooth_spectra = apply_smoothing(fft_frq, raw_spectra_per_record, settings.smoothing)
+
+                # select ppth percentile.
+                smooth_h = np.percentile(smooth_spectra[:-1],
+                                         settings.ppth_percentile_for_rotdpp_computation,
+                                         axis=0)
+                smooth_v = smooth_spectra[-1]
+
+                # compute hvsr.
+                hvsr_spectra[hvsr_idx] = smooth_h / smooth_v
+                hvsr_idx += 1
 
     # reorder hvsr spectra to follow original order.
     hvsr_spectra = hvsr_spectra[hvsr_indices_to_order]
@@ -397,72 +607,260 @@ def azimuthal_hvsr_processing(records, settings):
         smoothing=settings.smoothing,
         handle_dissimilar_time_steps_by=settings.handle_dissimilar_time_steps_by,
         fft_settings=settings.fft_settings,
+        dtype=getattr(settings, "dtype", "float64"),
     )
+
+    # share fourier transforms and smoothed vertical across azimuths.
+    _records, hvsr_spectra = _single_azimuth_hvsr_spectra(records,
+                                                          single_azimuth_settings,
+                                                          settings.azimuths_in_degrees)
+
+    fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
     hvsr_per_azimuth = []
-    for azimuth in settings.azimuths_in_degrees:
+    for azimuth, spectra in zip(settings.azimuths_in_degrees, hvsr_spectra):
         single_azimuth_settings.azimuth_in_degrees = azimuth
-        hvsr = traditional_single_azimuth_hvsr_processing(records,
-                                                          single_azimuth_settings)
+        hvsr = HvsrTraditional(fcs, spectra, meta={**_records[0].meta, **single_azimuth_settings.attr_dict})
         hvsr_per_azimuth.append(hvsr)
     return HvsrAzimuthal(hvsr_per_azimuth, settings.azimuths_in_degrees, meta={**records[0].meta, **settings.attr_dict})
 
 
-def _rpds_single_component(timeseries, settings):
-    """Compute power spectral density of real-valued, time-domain data.
+class PsdAccumulator():
+    """Streaming accumulator of the power spectral density (PSD).
 
-    timeseries : iterable of TimeSeries
-        Time-domain data in the form of iterable object containing
-        ``TimeSeries`` objects. These data are assumed to have already
-        been preprocessed. This is the data that will be processed.
-    settings : PsdProcessingSettings
-        ``PsdProcessingSettings`` object that controls how the
-        time-domain data will be processed.
+    Time windows are consumed one at a time (or in batches) and only
+    the running sum of the (normalized) power spectrum of each
+    component is retained, such that the PSD of an arbitrarily
+    long recording can be computed with constant memory.
 
-    Returns
-    -------
-    Psd
-        Instantiated PSD object according to the processing settings
-        selected.
+    Attributes
+    ----------
+    settings : {PsdProcessingSettings, HvsrDiffuseFieldProcessingSettings}
+        Processing settings, ``window_type_and_width``,
+        ``fft_settings``, and ``smoothing`` are used.
+    n_windows : int
+        Number of time windows accumulated.
+    dt_in_seconds : float
+        Time step of the time windows accumulated, ``None`` if no time
+        windows have been accumulated.
 
     """
-    n = settings.fft_settings.get("n", timeseries[0].n_samples)
-    psd = np.zeros(n/2 if n % 2 else int(n/2)+1)
-    for tseries in timeseries:
-
-        # window time series to mitigate frequency-domain artifacts.
-        tseries.window(*settings.window_type_and_width)
-
-        # compute fourier transform.
-        fft = rfft(tseries.amplitude, **settings.fft_settings)
 
-        # compute square of fourier transform
-        # (not quite the psd; need the normalizations).
-        psd += np.real(np.conjugate(fft) * fft)
-
-    # scale according to window; see Welch (1967)
-    window = TimeSeries(amplitude=np.ones_like(tseries.amplitude),
-                        dt_in_seconds=tseries.dt_in_seconds)
-    window.window(*settings.window_type_and_width)
-    window_scaling_factor = np.mean(window.amplitude**2)
-    psd /= window_scaling_factor
-
-    # scale by number of samples;
-    # Welch (1967) shows (1/L)**2 * L scaling for I_{k} simplify to 1/L.
-    psd /= tseries.n_samples
-
-    # scaly by number of samples; (add for power spectrum).
-    # psd /= tseries.n_samples * tseries.n_samples
+    def __init__(self, settings):
+        """Create empty ``PsdAccumulator``.
+
+        Parameters
+        ----------
+        settings : {PsdProcessingSettings, HvsrDiffuseFieldProcessingSettings}
+            Processing settings that control how the time windows will
+            be processed. If ``fft_settings`` does not define ``n`` it
+            is selected based on the first batch of time windows and
+            held constant thereafter.
+
+        Returns
+        -------
+        PsdAccumulator
+            Empty accumulator.
+
+        """
+        self.settings = settings
+        self.n_windows = 0
+        self.dt_in_seconds = None
+        self._power = None
+        self._window_scaling = {}
+
+    @property
+    def n(self):
+        """Number of points in the Fourier transform."""
+        if self.settings.fft_settings is None:
+            return None
+        return self.settings.fft_settings.get("n", None)
+
+    @property
+    def frequency(self):
+        """Frequency vector of the (unsmoothed) PSD."""
+        if self.dt_in_seconds is None:
+            raise ValueError("PsdAccumulator is empty.")
+        return np.fft.rfftfreq(self.n, self.dt_in_seconds)
+
+    def _window_scaling_factor(self, n_samples):
+        """Scaling of a time window of ``n_samples``; see Welch (1967).
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        """
+        try:
+            return self._window_scaling[n_samples]
+        except KeyError:
+            taper = _taper(n_samples, *self.settings.window_type_and_width)
+            scaling = np.mean(taper**2) * n_samples
+            self._window_scaling[n_samples] = scaling
+            return scaling
 
-    # compute power spectrum density (remove for power spectrum).
-    psd /= tseries.fs
+    def _check_records(self, records):
+        """Check records are consistent with those accumulated.
 
-    # scale by two b/c only looking at positive frequencies.
-    psd *= 2
+        .. warning::
+            Private methods are subject to change without warning.
 
-    # compute average psd over all records (i.e., windows).
-    psd /= len(timeseries)
+        """
+        if self.n is None:
+            prepare_fft_settings(records, self.settings)
+        if self.dt_in_seconds is None:
+            self.dt_in_seconds = records[0].vt.dt_in_seconds
 
-    return psd
+        for record in records:
+            if record.vt.dt_in_seconds != self.dt_in_seconds:
+                msg = "All time windows must have the same dt_in_seconds; "
+                msg += f"expected {self.dt_in_seconds}, not {record.vt.dt_in_seconds}."
+                raise ValueError(msg)
+            if record.vt.n_samples > self.n:
+                msg = f"Time window with {record.vt.n_samples} samples is "
+                msg += f"longer than the Fourier transform with n={self.n}."
+                raise ValueError(msg)
+
+    def partial_fit(self, records):
+        """Accumulate the power spectra of time windows.
+
+        Parameters
+        ----------
+        records : {SeismicRecording3C, iterable of SeismicRecording3C}
+            Time window(s) to be accumulated, may be a generator. These
+            data are assumed to have already been preprocessed.
+
+        Returns
+        -------
+        PsdAccumulator
+            The updated accumulator (i.e., ``self``).
+
+        """
+        if isinstance(records, SeismicRecording3C):
+            records = [records]
+        records = iter(records)
+
+        while True:
+            # consume in batches so the fourier transforms are vectorized.
+            if self.n is None:
+                batch_size = 1
+            else:
+                batch_size = max(1, FFT_BATCH_SIZE_IN_BYTES // (3 * (self.n//2 + 1) * 16))
+            batch = list(itertools.islice(records, batch_size))
+            if len(batch) == 0:
+                break
+            self._check_records(batch)
+
+            for start_idx, stop_idx, fft in _batched_rfft(batch, self.settings):
+                power = np.real(np.conjugate(fft) * fft)
+                scaling = np.array([self._window_scaling_factor(record.vt.n_samples)
+                                    for record in batch[start_idx:stop_idx]])
+                power = np.sum(power / scaling[:, np.newaxis, np.newaxis], axis=0)
+                if self._power is None:
+                    self._power = power
+                else:
+                    self._power += power
+            self.n_windows += len(batch)
+
+        return self
+
+    def merge(self, other):
+        """Combine the time windows accumulated by ``other`` into ``self``.
+
+        Parameters
+        ----------
+        other : PsdAccumulator
+            Accumulator (e.g., from a parallel worker or a different
+            file) with consistent time step and Fourier transform.
+
+        Returns
+        -------
+        PsdAccumulator
+            The updated accumulator (i.e., ``self``).
+
+        """
+        if other.n_windows == 0:
+            return self
+
+        if self.n_windows == 0:
+            self.settings.fft_settings = copy.deepcopy(other.settings.fft_settings)
+            self.dt_in_seconds = other.dt_in_seconds
+            self._power = np.array(other._power)
+            self.n_windows = other.n_windows
+            return self
+
+        if (self.n != other.n) or (self.dt_in_seconds != other.dt_in_seconds):
+            msg = "Accumulators must have the same n and dt_in_seconds; "
+            msg += f"({self.n}, {self.dt_in_seconds}) is not "
+            msg += f"({other.n}, {other.dt_in_seconds})."
+            raise ValueError(msg)
+
+        self._power += other._power
+        self.n_windows += other.n_windows
+        return self
+
+    def psd(self):
+        """Unsmoothed PSD of each component averaged over all windows.
+
+        Returns
+        -------
+        dict
+            Of the form ``dict(ns=psd_ns, ew=psd_ew, vt=psd_vt)`` where
+            each entry is an ``ndarray`` with one value per
+            ``frequency``.
+
+        """
+        if self.n_windows == 0:
+            raise ValueError("PsdAccumulator is empty.")
+
+        # power is already scaled by window and number of samples;
+        # scale by two b/c only looking at positive frequencies;
+        # and average over all records (i.e., windows).
+        psd = self._power * (2 * self.dt_in_seconds / self.n_windows)
+        return dict(ns=psd[0], ew=psd[1], vt=psd[2])
+
+    def to_psd(self):
+        """PSD of each component, smoothed according to ``settings``.
+
+        Returns
+        -------
+        dict
+            Of the form ``dict(ns=Psd, ew=Psd, vt=Psd)``.
+
+        """
+        frequency = self.frequency
+        psd = self.psd()
+        if self.settings.smoothing is not None:
+            spectra = np.array([psd["ns"], psd["ew"], psd["vt"]])
+            smooth_spectra = apply_smoothing(frequency, spectra, self.settings.smoothing)
+            frequency = np.array(self.settings.smoothing["center_frequencies_in_hz"])
+            psd = dict(ns=smooth_spectra[0], ew=smooth_spectra[1], vt=smooth_spectra[2])
+        return {component: Psd(frequency, psd[component]) for component in ["ns", "ew", "vt"]}
+
+    def to_hvsr_diffuse_field(self, meta=None):
+        """HVSR according to diffuse field theory.
+
+        Parameters
+        ----------
+        meta : dict, optional
+            Meta information about the object, default is ``None``.
+
+        Returns
+        -------
+        HvsrDiffuseField
+            HVSR computed from the smoothed PSDs.
+
+        """
+        fcs = np.array(self.settings.smoothing["center_frequencies_in_hz"])
+        check_nyquist_frequency(self.dt_in_seconds, fcs)
+
+        # smooth.
+        psd = self.psd()
+        spectra = np.array([psd["ns"] + psd["ew"], psd["vt"]])
+        smooth_spectra = apply_smoothing(self.frequency, spectra, self.settings.smoothing)
+        hor = smooth_spectra[0]
+        ver = smooth_spectra[1]
+
+        # compute hvsr
+        return HvsrDiffuseField(fcs, np.sqrt(hor/ver), meta=meta)
 
 
 def rpsd(records, settings):
@@ -478,38 +876,13 @@ def rpsd(records, settings):
 
     Returns
     -------
-    Psd
-        Instantiated PSD object according to the processing settings
-        selected.
+    dict
+        Of the form ``dict(ns=Psd, ew=Psd, vt=Psd)``, see
+        ``PsdAccumulator`` to compute the PSD of records one at a time.
 
     """
     prepare_fft_settings(records, settings)
-    fft_frq = np.fft.rfftfreq(
-        settings.fft_settings["n"], records[0].vt.dt_in_seconds)
-    psd_ns = _rpds_single_component(
-        [record.ns for record in records], settings)
-    psd_ew = _rpds_single_component(
-        [record.ew for record in records], settings)
-    psd_vt = _rpds_single_component(
-        [record.vt for record in records], settings)
-
-    if settings.smoothing is not None:
-        operator, bandwidth = settings.smoothing["operator"], settings.smoothing["bandwidth"]
-        fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
-        spectra = np.empty((3, len(fft_frq)))
-        spectra[0] = psd_ns
-        spectra[1] = psd_ew
-        spectra[2] = psd_vt
-        smooth_spectra = SMOOTHING_OPERATORS[operator](
-            fft_frq, spectra, fcs, bandwidth)
-        fft_frq = fcs
-        psd_ns = smooth_spectra[0]
-        psd_ew = smooth_spectra[1]
-        psd_vt = smooth_spectra[2]
-
-    return dict(ns=Psd(fft_frq, psd_ns),
-                ew=Psd(fft_frq, psd_ew),
-                vt=Psd(fft_frq, psd_vt))
+    return PsdAccumulator(settings).partial_fit(records).to_psd()
 
 
 def diffuse_field_hvsr_processing(records, settings):
@@ -526,30 +899,73 @@ def diffuse_field_hvsr_processing(records, settings):
         msg += "to only process those records with similar time steps."
         raise ValueError(msg)
 
-    # allocate array for hvsr results.
-    fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
-    check_nyquist_frequency(max(dt_with_count.keys()), fcs)
+    # accumulate psd and compute hvsr.
+    accumulator = PsdAccumulator(settings).partial_fit(records)
+    return accumulator.to_hvsr_diffuse_field(meta={**records[0].meta, **settings.attr_dict})
+
+
+def _concatenate_results(results, meta=None):
+    """Combine results from consecutive sets of records.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    meta = results[0].meta if meta is None else meta
+    if isinstance(results[0], HvsrAzimuthal):
+        hvsrs = []
+        for idx, ex_hvsr in enumerate(results[0].hvsrs):
+            amplitude = np.concatenate([result.hvsrs[idx].amplitude for result in results])
+            hvsrs.append(HvsrTraditional(ex_hvsr.frequency, amplitude, meta=ex_hvsr.meta))
+        return HvsrAzimuthal(hvsrs, results[0].azimuths, meta=meta)
+    else:
+        amplitude = np.concatenate([result.amplitude for result in results])
+        return HvsrTraditional(results[0].frequency, amplitude, meta=meta)
+
+
+EXECUTORS = {
+    "threads": ThreadPoolExecutor,
+    "processes": ProcessPoolExecutor,
+}
+
+
+def _process_concurrently(records, settings):
+    """Process records in chunks using concurrent workers.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    try:
+        executor_class = EXECUTORS[settings.executor]
+    except KeyError:
+        msg = f"executor {settings.executor} not recognized, try one of "
+        msg += f"{['serial', *EXECUTORS.keys()]}."
+        raise ValueError(msg)
+
+    # steps that depend on all records must be performed up front.
+    records = list(records)
+    prepare_fft_settings(records, settings)
+    records, _ = prepare_records_with_inconsistent_dt(records, settings)
+
+    # divide records into contiguous chunks, one per worker.
+    chunk_settings = copy.deepcopy(settings)
+    chunk_settings.executor = "serial"
+    max_workers = settings.max_workers
+    n_chunks = min(len(records), max_workers if max_workers is not None else os.cpu_count())
+    bounds = np.linspace(0, len(records), n_chunks+1).astype(int)
+    chunks = [records[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
 
-    # compute psd.
-    fft_frq = np.fft.rfftfreq(
-        settings.fft_settings["n"], records[0].vt.dt_in_seconds)
-    psd_ns = _rpds_single_component(
-        [record.ns for record in records], settings)
-    psd_ew = _rpds_single_component(
-        [record.ew for record in records], settings)
-    psd_vt = _rpds_single_component(
-        [record.vt for record in records], settings)
+    # avoid forking a process with running threads (e.g., numba's).
+    kwargs = {}
+    if executor_class is ProcessPoolExecutor and "forkserver" in multiprocessing.get_all_start_methods():
+        kwargs["mp_context"] = multiprocessing.get_context("forkserver")
 
-    # smooth.
-    operator, bandwidth = settings.smoothing["operator"], settings.smoothing["bandwidth"]
-    spectra = np.array([psd_ns + psd_ew, psd_vt])
-    smooth_spectra = SMOOTHING_OPERATORS[operator](
-        fft_frq, spectra, fcs, bandwidth)
-    hor = smooth_spectra[0]
-    ver = smooth_spectra[1]
+    method = PROCESSING_METHODS[settings.processing_method]
+    with executor_class(max_workers=max_workers, **kwargs) as executor:
+        results = list(executor.map(method, chunks, itertools.repeat(chunk_settings)))
 
-    # compute hvsr
-    return HvsrDiffuseField(fcs, np.sqrt(hor/ver), meta={**records[0].meta, **settings.attr_dict})
+    return _concatenate_results(results, meta={**records[0].meta, **settings.attr_dict})
 
 
 PROCESSING_METHODS = {
@@ -577,4 +993,6 @@ def process(records, settings):
         selected.
 
     """
+    if getattr(settings, "executor", "serial") != "serial":
+        return _process_concurrently(records, settings)
     return PROCESSING_METHODS[settings.processing_method](records, settings)
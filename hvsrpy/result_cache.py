@@ -0,0 +1,196 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Persistent on-disk cache of reading, preprocessing, and processing."""
+
+import copy
+import hashlib
+import json
+
+from .metadata import __version__
+from .cache import DiskCache, array_digest, file_digest
+from .data_wrangler import read
+from .preprocessing import preprocess
+from .processing import process, prepare_fft_settings, prepare_records_with_inconsistent_dt, COMBINE_HORIZONTAL_REGISTER, _traditional_raw_spectra, _traditional_hvsr_from_raw_spectra
+
+__all__ = ["ResultCache"]
+
+# settings which do not change the raw (i.e., unsmoothed) spectra.
+RAW_SPECTRA_INDEPENDENT_SETTINGS = ("smoothing", "executor", "max_workers")
+
+
+def _digest(*parts):
+    """Digest uniquely identifying json-serializable parts.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    text = json.dumps([__version__, *parts], sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _records_digest(records):
+    """Digest uniquely identifying the contents of records.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    digests = []
+    for record in records:
+        digests.append([record.vt.dt_in_seconds,
+                        record.degrees_from_north,
+                        record.meta,
+                        *[array_digest(getattr(record, component).amplitude) for component in ("ns", "ew", "vt")]])
+    return _digest("records", digests)
+
+
+def _flatten_fnames(fnames):
+    """Flatten nested iterable of file names.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    if isinstance(fnames, (list, tuple)):
+        for fname in fnames:
+            yield from _flatten_fnames(fname)
+    else:
+        yield str(fnames)
+
+
+class ResultCache():
+    """Persistent cache of the results of ``read``, ``preprocess``,
+    and ``process``.
+
+    Each stage's output is stored on disk keyed on a digest of its
+    input (i.e., the contents of the files read or the records
+    provided), a digest of the relevant settings' ``attr_dict``, and
+    the version of hvsrpy. Traditional HVSR processing with a
+    frequency-domain combination of the horizontals is cached before
+    smoothing, such that changing only the smoothing settings reuses
+    the raw amplitude spectra rather than recomputing them.
+
+    Attributes
+    ----------
+    disk_cache : DiskCache
+        Size-bounded least recently used on-disk storage.
+
+    Examples
+    --------
+    >>> cache = hvsrpy.ResultCache("hvsrpy_cache")
+    >>> records = cache.read(fnames)
+    >>> records = cache.preprocess(records, preprocessing_settings)
+    >>> hvsr = cache.process(records, processing_settings)
+
+    """
+
+    def __init__(self, directory, max_size_in_bytes=2**30):
+        """Create cache in directory, creating the directory if needed.
+
+        Parameters
+        ----------
+        directory : str or pathlib.Path
+            Directory in which results are stored.
+        max_size_in_bytes : int, optional
+            Maximum total size of stored results, once exceeded the
+            least recently used results are discarded, default is
+            1 GiB.
+
+        """
+        self.disk_cache = DiskCache(directory, max_size_in_bytes=max_size_in_bytes)
+
+    def read(self, fnames, obspy_read_kwargs=None, degrees_from_north=None):
+        """Cached equivalent of ``hvsrpy.read``.
+
+        Parameters
+        ----------
+        fnames, obspy_read_kwargs, degrees_from_north
+            Refer to ``hvsrpy.read``.
+
+        Returns
+        -------
+        list
+            Of ``SeismicRecording3C`` objects.
+
+        """
+        digests = [file_digest(fname) for fname in _flatten_fnames(fnames)]
+        key = _digest("read", fnames, digests, obspy_read_kwargs, degrees_from_north)
+        return self.disk_cache.get(key, lambda: read(fnames,
+                                                      obspy_read_kwargs=obspy_read_kwargs,
+                                                      degrees_from_north=degrees_from_north))
+
+    def preprocess(self, records, settings):
+        """Cached equivalent of ``hvsrpy.preprocess``.
+
+        Parameters
+        ----------
+        records, settings
+            Refer to ``hvsrpy.preprocess``.
+
+        Returns
+        -------
+        list
+            Of preprocessed ``SeismicRecording3C`` objects.
+
+        Notes
+        -----
+        Unlike ``hvsrpy.preprocess``, ``records`` are never modified;
+        the records provided are copied before they are preprocessed.
+
+        """
+        records = list(records) if isinstance(records, (list, tuple)) else [records]
+        key = _digest("preprocess", _records_digest(records), settings.attr_dict)
+        return self.disk_cache.get(key, lambda: preprocess(copy.deepcopy(records), settings))
+
+    def process(self, records, settings):
+        """Cached equivalent of ``hvsrpy.process``.
+
+        Parameters
+        ----------
+        records, settings
+            Refer to ``hvsrpy.process``.
+
+        Returns
+        -------
+        HvsrTraditional, HvsrAzimuthal, HvsrDiffuseField, Psd
+            Instantiated object according to the processing settings
+            selected.
+
+        """
+        records = list(records)
+        prepare_fft_settings(records, settings)
+        records_digest = _records_digest(records)
+
+        if (settings.processing_method == "traditional" and
+                getattr(settings, "method_to_combine_horizontals", None) in COMBINE_HORIZONTAL_REGISTER):
+            records, dt_with_count = prepare_records_with_inconsistent_dt(records, settings)
+            raw_settings = {k: v for k, v in settings.attr_dict.items() if k not in RAW_SPECTRA_INDEPENDENT_SETTINGS}
+            key = _digest("raw_spectra", records_digest, raw_settings)
+            raw = self.disk_cache.get(key, lambda: _traditional_raw_spectra(records, dt_with_count, settings))
+            return _traditional_hvsr_from_raw_spectra(records, raw, settings)
+
+        key = _digest("process", records_digest, settings.attr_dict)
+        return self.disk_cache.get(key, lambda: process(records, settings))
+
+    def clear(self):
+        """Remove all stored results."""
+        self.disk_cache.clear()
+
+    def __repr__(self):
+        return f"ResultCache(disk_cache={self.disk_cache!r})"
@@ -20,8 +20,9 @@
 import json
 
 import numpy as np
+from scipy.signal import sosfiltfilt
 
-from .timeseries import TimeSeries
+from .timeseries import TimeSeries, _butterworth_sos
 
 __all__ = ["SeismicRecording3C"]
 
@@ -129,13 +130,17 @@ class SeismicRecording3C():
         for component in ["ns", "ew", "vt"]:
             getattr(self, component).detrend(type=type)
 
-    def split(self, window_length_in_seconds):
+    def split(self, window_length_in_seconds, overlap=0.):
         """Split component ``TimeSeries`` into time windows.
 
         Parameters
         ----------
         window_length_in_seconds : float
             Duration of each split in seconds.
+        overlap : float, optional
+            Fraction of each window shared with the following window,
+            must be in the interval ``[0, 1)``, default is ``0.``
+            indicating windows only share a single sample (see notes).
 
         Returns
         -------
@@ -149,17 +154,44 @@ class SeismicRecording3C():
             number of windows. Without this, for example, a 10-minute
             record could not be broken into 10, 1-minute records.
 
+            The components of each split are read-only views into the
+            components of the original record, see
+            ``TimeSeries.split`` for details.
+
         """
         self.meta["split"] = window_length_in_seconds
+        if overlap:
+            self.meta["split overlap"] = overlap
+        dt = self.ns.dt_in_seconds
+        views = [getattr(self, component)._split_views(window_length_in_seconds, overlap=overlap)
+                 for component in ["ns", "ew", "vt"]]
+        (ns_windows, ns_tail), (ew_windows, ew_tail), (vt_windows, vt_tail) = views
+
         split_recordings = []
-        for (_ns, _ew, _vt) in zip(self.ns.split(window_length_in_seconds),
-                                   self.ew.split(window_length_in_seconds),
-                                   self.vt.split(window_length_in_seconds)):
-            split_recordings.append(SeismicRecording3C(_ns, _ew, _vt,
-                                                       degrees_from_north=self.degrees_from_north,
-                                                       meta=self.meta))
+        for _ns, _ew, _vt in zip(ns_windows, ew_windows, vt_windows):
+            split_recordings.append(self._from_views(_ns, _ew, _vt, dt))
+        if ns_tail is not None:
+            split_recordings.append(self._from_views(ns_tail, ew_tail, vt_tail, dt))
         return split_recordings
 
+    def _from_views(self, ns, ew, vt, dt_in_seconds):
+        """Create ``SeismicRecording3C`` sharing memory with ``self``.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        """
+        obj = SeismicRecording3C.__new__(SeismicRecording3C)
+        obj.ns = TimeSeries._from_view(ns, dt_in_seconds)
+        obj.ew = TimeSeries._from_view(ew, dt_in_seconds)
+        obj.vt = TimeSeries._from_view(vt, dt_in_seconds)
+        obj.degrees_from_north = self.degrees_from_north
+        obj.meta = {"file name(s)": "seismic recording was not created from file",
+                    "deployed degrees from north": self.degrees_from_north,
+                    "current degrees from north": self.degrees_from_north,
+                    **self.meta}
+        return obj
+
     def window(self, type="tukey", width=0.1):
         """Window component ``TimeSeries``.
 
@@ -202,9 +234,15 @@ class SeismicRecording3C():
 
         """
         self.meta["butterworth_filter"] = fcs_in_hz
-        for component in ["ns", "ew", "vt"]:
-            getattr(self, component).butterworth_filter(fcs_in_hz=fcs_in_hz,
-                                                        order=order)
+        sos = _butterworth_sos(fcs_in_hz, order, self.ns.fs)
+        if sos is None:
+            return None
+
+        # filter all components at once to boost performance.
+        # cached sos is read-only, but scipy requires a writeable buffer.
+        amplitudes = np.array([self.ns.amplitude, self.ew.amplitude, self.vt.amplitude])
+        amplitudes = sosfiltfilt(sos.copy(), amplitudes, axis=-1)
+        self.ns.amplitude, self.ew.amplitude, self.vt.amplitude = amplitudes
 
     def orient_sensor_to(self, degrees_from_north):
         """Orient sensor's horizontal components.
@@ -151,6 +151,7 @@ class PreProcessingSettings(Settings):
                  window_length_in_seconds=60.,
                  detrend="linear",
                  ignore_dissimilar_time_step_warning=False,
+                 dtype="float64",
                  ):
         """Base class for preprocessing.
 
@@ -169,12 +170,14 @@ class PreProcessingSettings(Settings):
                            "window_length_in_seconds",
                            "detrend",
                            "ignore_dissimilar_time_step_warning",
+                           "dtype",
                            ])
         self.orient_to_degrees_from_north = orient_to_degrees_from_north
         self.filter_corner_frequencies_in_hz = filter_corner_frequencies_in_hz
         self.window_length_in_seconds = window_length_in_seconds
         self.detrend = detrend
         self.ignore_dissimilar_time_step_warning = ignore_dissimilar_time_step_warning
+        self.dtype = dtype
 
 
 class HvsrPreProcessingSettings(PreProcessingSettings):
@@ -186,6 +189,7 @@ class HvsrPreProcessingSettings(PreProcessingSettings):
                  detrend="linear",
                  ignore_dissimilar_time_step_warning=False,
                  preprocessing_method="hvsr",
+                 dtype="float64",
                  ):
         """Initialize ``HvsrPreProcessingSettings`` object.
 
@@ -223,6 +227,11 @@ class HvsrPreProcessingSettings(PreProcessingSettings):
         preprocessing_method : str, optional
             Defines pre-processing for later reference, default is
             ``'hvsr'``. Should not be changed.
+        dtype : {"float64", "float32"}, optional
+            Floating point precision in which the preprocessed time
+            windows are stored, default is ``"float64"``. Use
+            ``"float32"`` to halve the memory used by the time windows
+            (see ``HvsrTraditionalProcessingSettings`` for accuracy).
 
         Returns
         -------
@@ -237,7 +246,8 @@ class HvsrPreProcessingSettings(PreProcessingSettings):
                          filter_corner_frequencies_in_hz=filter_corner_frequencies_in_hz,
                          window_length_in_seconds=window_length_in_seconds,
                          detrend=detrend,
-                         ignore_dissimilar_time_step_warning=ignore_dissimilar_time_step_warning)
+                         ignore_dissimilar_time_step_warning=ignore_dissimilar_time_step_warning,
+                         dtype=dtype)
         self.attrs.extend(["preprocessing_method"])
         self.preprocessing_method = preprocessing_method
 
@@ -293,7 +303,7 @@ class PsdPreProcessingSettings(PreProcessingSettings):
             A list with entries like ``["tukey", 0.1]`` that control the
             window type and width, respectively.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft``, default is ``None``
+            Custom settings for ``scipy.fft.rfft``, default is ``None``
             indicating ``hvsrpy`` defaults will be used.
         instrument_transfer_function : InstrumentTransferFunction, optional
             If the sensor's frequency response is provided it will be
@@ -361,7 +371,7 @@ class PsdProcessingSettings(Settings):
             Smoothing information like ``dict(operator="konno_and_ohmachi",
             bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft``, default is ``None``
+            Custom settings for ``scipy.fft.rfft``, default is ``None``
             indicating ``hvsrpy`` defaults will be used.
         handle_dissimilar_time_steps_by : {"frequency_domain_resampling", "keeping_smallest_time_step", "keeping_majority_time_step"}, optional
             Method to resolve multiple records with a different
@@ -438,6 +448,9 @@ class HvsrTraditionalProcessingSettingsBase(HvsrProcessingSettings):
                  handle_dissimilar_time_steps_by="frequency_domain_resampling",
                  fft_settings=None,
                  processing_method="traditional",
+                 executor="serial",
+                 max_workers=None,
+                 dtype="float64",
                  ):
         """Base class for traditional HVSR processing settings.
 
@@ -457,8 +470,14 @@ class HvsrTraditionalProcessingSettingsBase(HvsrProcessingSettings):
                          smoothing=smoothing,
                          handle_dissimilar_time_steps_by=handle_dissimilar_time_steps_by,
                          fft_settings=fft_settings)
-        self.attrs.extend(["processing_method"])
+        self.attrs.extend(["processing_method",
+                           "executor",
+                           "max_workers",
+                           "dtype"])
         self.processing_method = processing_method
+        self.executor = executor
+        self.max_workers = max_workers
+        self.dtype = dtype
 
 
 class HvsrTraditionalProcessingSettings(HvsrTraditionalProcessingSettingsBase):
@@ -472,6 +491,9 @@ class HvsrTraditionalProcessingSettings(HvsrTraditionalProcessingSettingsBase):
                  handle_dissimilar_time_steps_by="frequency_domain_resampling",
                  processing_method="traditional",
                  method_to_combine_horizontals="geometric_mean",
+                 executor="serial",
+                 max_workers=None,
+                 dtype="float64",
                  ):
         """Initialize ``HvsrTraditionalProcessingSettings`` object.
 
@@ -487,7 +509,8 @@ class HvsrTraditionalProcessingSettings(HvsrTraditionalProcessingSettingsBase):
             Smoothing information like ``dict(operator="konno_and_ohmachi",
             bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft`` default is ``None``.
+            Custom settings for ``scipy.fft.rfft`` (e.g.,
+            ``dict(workers=4)``), default is ``None``.
         handle_dissimilar_time_steps_by : {"frequency_domain_resampling", "keeping_smallest_time_step", "keeping_majority_time_step"}, optional
             Method to resolve multiple records with a different
             time step, default is ``"frequency_domain_resampling"``.
@@ -500,6 +523,21 @@ class HvsrTraditionalProcessingSettings(HvsrTraditionalProcessingSettingsBase):
             "quadratic_mean", "geometric_mean", "total_horizontal_energy",
             "vector_summation", and "maximum_horizontal_value", default
             is "geometric_mean".
+        executor : {"serial", "threads", "processes"}, optional
+            Executor used to process the records, default is
+            ``"serial"``. If ``"threads"`` or ``"processes"`` the
+            records are divided into chunks which are processed
+            concurrently.
+        max_workers : int, optional
+            Maximum number of workers used by the executor, default is
+            ``None`` indicating the number of processors on the machine.
+        dtype : {"float64", "float32"}, optional
+            Floating point precision of the Fourier transforms, spectra,
+            and HVSR curves, default is ``"float64"``. ``"float32"``
+            (with ``complex64`` Fourier transforms) halves memory use and
+            bandwidth; HVSR amplitudes typically agree with
+            ``"float64"`` to a relative error better than 1E-4 and peak
+            frequencies to within one center frequency.
 
         Returns
         -------
@@ -513,7 +551,10 @@ class HvsrTraditionalProcessingSettings(HvsrTraditionalProcessingSettingsBase):
                          smoothing=smoothing,
                          handle_dissimilar_time_steps_by=handle_dissimilar_time_steps_by,
                          fft_settings=fft_settings,
-                         processing_method=processing_method)
+                         processing_method=processing_method,
+                         executor=executor,
+                         max_workers=max_workers,
+                         dtype=dtype)
         self.attrs.extend(["method_to_combine_horizontals"])
         self.method_to_combine_horizontals = method_to_combine_horizontals
 
@@ -530,6 +571,9 @@ class HvsrTraditionalSingleAzimuthProcessingSettings(HvsrTraditionalProcessingSe
                  processing_method="traditional",
                  method_to_combine_horizontals="single_azimuth",
                  azimuth_in_degrees=20.,
+                 executor="serial",
+                 max_workers=None,
+                 dtype="float64",
                  ):
         """Initialize ``HvsrTraditionalSingleAzimuthProcessingSettings`` object.
 
@@ -545,7 +589,8 @@ class HvsrTraditionalSingleAzimuthProcessingSettings(HvsrTraditionalProcessingSe
             Smoothing information like ``dict(operator="konno_and_ohmachi",
             bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft`` default is ``None``.
+            Custom settings for ``scipy.fft.rfft`` (e.g.,
+            ``dict(workers=4)``), default is ``None``.
         handle_dissimilar_time_steps_by : {"frequency_domain_resampling", "keeping_smallest_time_step", "keeping_majority_time_step"}, optional
             Method to resolve multiple records with a different
             time step, default is ``"frequency_domain_resampling"``.
@@ -559,6 +604,18 @@ class HvsrTraditionalSingleAzimuthProcessingSettings(HvsrTraditionalProcessingSe
             Azimuth at which to compute the single azimuth HVSR,
             measured from north in degrees (clockwise positive). Default
             is 20 degrees (i.e., 20 degrees to the east from north).
+        executor : {"serial", "threads", "processes"}, optional
+            Executor used to process the records, default is
+            ``"serial"``. If ``"threads"`` or ``"processes"`` the
+            records are divided into chunks which are processed
+            concurrently.
+        max_workers : int, optional
+            Maximum number of workers used by the executor, default is
+            ``None`` indicating the number of processors on the machine.
+        dtype : {"float64", "float32"}, optional
+            Floating point precision of the Fourier transforms, spectra,
+            and HVSR curves, default is ``"float64"``, see
+            ``HvsrTraditionalProcessingSettings`` for details.
 
         Returns
         -------
@@ -572,7 +629,10 @@ class HvsrTraditionalSingleAzimuthProcessingSettings(HvsrTraditionalProcessingSe
                          smoothing=smoothing,
                          handle_dissimilar_time_steps_by=handle_dissimilar_time_steps_by,
                          fft_settings=fft_settings,
-                         processing_method=processing_method)
+                         processing_method=processing_method,
+                         executor=executor,
+                         max_workers=max_workers,
+                         dtype=dtype)
         self.attrs.extend(["method_to_combine_horizontals",
                            "azimuth_in_degrees",
                            ])
@@ -592,7 +652,10 @@ class HvsrTraditionalRotDppProcessingSettings(HvsrTraditionalProcessingSettingsB
                  processing_method="traditional",
                  method_to_combine_horizontals="rotdpp",
                  ppth_percentile_for_rotdpp_computation=50.,
-                 azimuths_in_degrees=np.arange(0, 180, 5)
+                 azimuths_in_degrees=np.arange(0, 180, 5),
+                 executor="serial",
+                 max_workers=None,
+                 dtype="float64",
                  ):
         """Initialize ``HvsrTraditionalRotDppProcessingSettings`` object.
 
@@ -608,7 +671,8 @@ class HvsrTraditionalRotDppProcessingSettings(HvsrTraditionalProcessingSettingsB
             Smoothing information like ``dict(operator="konno_and_ohmachi",
             bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft`` default is ``None``.
+            Custom settings for ``scipy.fft.rfft`` (e.g.,
+            ``dict(workers=4)``), default is ``None``.
         handle_dissimilar_time_steps_by : {"frequency_domain_resampling", "keeping_smallest_time_step", "keeping_majority_time_step"}, optional
             Method to resolve multiple records with a different
             time step, default is ``"frequency_domain_resampling"``.
@@ -626,6 +690,18 @@ class HvsrTraditionalRotDppProcessingSettings(HvsrTraditionalProcessingSettingsB
             Azimuths measured from north in degrees (clockwise positive)
             at which to compute single azimuth HVSRs, to then select
             the frequency-by-frequency ppth precentile.
+        executor : {"serial", "threads", "processes"}, optional
+            Executor used to process the records, default is
+            ``"serial"``. If ``"threads"`` or ``"processes"`` the
+            records are divided into chunks which are processed
+            concurrently.
+        max_workers : int, optional
+            Maximum number of workers used by the executor, default is
+            ``None`` indicating the number of processors on the machine.
+        dtype : {"float64", "float32"}, optional
+            Floating point precision of the Fourier transforms, spectra,
+            and HVSR curves, default is ``"float64"``, see
+            ``HvsrTraditionalProcessingSettings`` for details.
 
         Returns
         -------
@@ -640,6 +716,9 @@ class HvsrTraditionalRotDppProcessingSettings(HvsrTraditionalProcessingSettingsB
                          handle_dissimilar_time_steps_by=handle_dissimilar_time_steps_by,
                          fft_settings=fft_settings,
                          processing_method=processing_method,
+                         executor=executor,
+                         max_workers=max_workers,
+                         dtype=dtype,
                          )
         self.attrs.extend(["method_to_combine_horizontals",
                            "ppth_percentile_for_rotdpp_computation",
@@ -659,7 +738,10 @@ class HvsrAzimuthalProcessingSettings(HvsrProcessingSettings):
                  fft_settings=None,
                  handle_dissimilar_time_steps_by="frequency_domain_resampling",
                  processing_method="azimuthal",
-                 azimuths_in_degrees=np.arange(0, 180, 5)):
+                 azimuths_in_degrees=np.arange(0, 180, 5),
+                 executor="serial",
+                 max_workers=None,
+                 dtype="float64"):
         """Initialize ``HvsrAzimuthalProcessingSettings`` object.
 
         Parameters
@@ -674,7 +756,8 @@ class HvsrAzimuthalProcessingSettings(HvsrProcessingSettings):
             Smoothing information like ``dict(operator="konno_and_ohmachi",
             bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft`` default is ``None``.
+            Custom settings for ``scipy.fft.rfft`` (e.g.,
+            ``dict(workers=4)``), default is ``None``.
         handle_dissimilar_time_steps_by : {"frequency_domain_resampling", "keeping_smallest_time_step", "keeping_majority_time_step"}, optional
             Method to resolve multiple records with a different
             time step, default is ``"frequency_domain_resampling"``.
@@ -684,6 +767,18 @@ class HvsrAzimuthalProcessingSettings(HvsrProcessingSettings):
         azimuths_in_degrees : iterable of float, optional
             Azimuths measured from north in degrees (clockwise positive)
             at which to compute single azimuth HVSRs.
+        executor : {"serial", "threads", "processes"}, optional
+            Executor used to process the records, default is
+            ``"serial"``. If ``"threads"`` or ``"processes"`` the
+            records are divided into chunks which are processed
+            concurrently.
+        max_workers : int, optional
+            Maximum number of workers used by the executor, default is
+            ``None`` indicating the number of processors on the machine.
+        dtype : {"float64", "float32"}, optional
+            Floating point precision of the Fourier transforms, spectra,
+            and HVSR curves, default is ``"float64"``, see
+            ``HvsrTraditionalProcessingSettings`` for details.
 
         Returns
         -------
@@ -700,9 +795,15 @@ class HvsrAzimuthalProcessingSettings(HvsrProcessingSettings):
                          handle_dissimilar_time_steps_by=handle_dissimilar_time_steps_by,
                          )
         self.attrs.extend(["processing_method",
-                           "azimuths_in_degrees"])
+                           "azimuths_in_degrees",
+                           "executor",
+                           "max_workers",
+                           "dtype"])
         self.processing_method = processing_method
         self.azimuths_in_degrees = azimuths_in_degrees
+        self.executor = executor
+        self.max_workers = max_workers
+        self.dtype = dtype
 
 
 class HvsrDiffuseFieldProcessingSettings(HvsrProcessingSettings):
@@ -729,7 +830,8 @@ class HvsrDiffuseFieldProcessingSettings(HvsrProcessingSettings):
             Smoothing information like ``dict(operator="konno_and_ohmachi",
             bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
         fft_settings : dict or None, optional
-            Custom settings for ``np.fft.rfft`` default is ``None``.
+            Custom settings for ``scipy.fft.rfft`` (e.g.,
+            ``dict(workers=4)``), default is ``None``.
         handle_dissimilar_time_steps_by : {"frequency_domain_resampling", "keeping_smallest_time_step", "keeping_majority_time_step"}, optional
             Method to resolve multiple records with a different
             time step, default is ``"frequency_domain_resampling"``.
@@ -18,7 +18,47 @@
 """Definitions for frequency-domain smoothing functions."""
 
 import numpy as np
-from numba import njit
+import numba
+from numba import njit, prange
+from scipy.sparse import csr_matrix
+
+from .cache import LruCache, array_digest
+from .parallel import PARALLEL_REGION_LOCK
+
+
+@njit(cache=True)
+def _is_sorted(frequencies): # pragma: no cover
+    """Check if ``frequencies`` are monotonically increasing.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    for f_index in range(frequencies.size - 1):
+        if frequencies[f_index + 1] < frequencies[f_index]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _band_indices(frequencies, f_low, f_high, is_sorted): # pragma: no cover
+    """Range of indices of ``frequencies`` in ``[f_low, f_high]``.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Notes
+    -----
+    The range is widened by one index on either side to guard against
+    round-off, so callers must still test each frequency. If the
+    frequencies are not sorted the full range is returned.
+
+    """
+    if not is_sorted:
+        return 0, frequencies.size
+    start = max(np.searchsorted(frequencies, f_low, side="left") - 1, 0)
+    stop = min(np.searchsorted(frequencies, f_high, side="right") + 1, frequencies.size)
+    return start, stop
 
 
 @njit(cache=True)
@@ -61,7 +101,10 @@ def konno_and_ohmachi(frequencies, spectrum, fcs, bandwidth=40.): # pragma: no c
     ncols = fcs.size
     smoothed_spectrum = np.empty((nrows, ncols))
 
-    for fc_index, fc in enumerate(fcs):
+    is_sorted = _is_sorted(frequencies)
+
+    for fc_index in prange(fcs.size):
+        fc = fcs[fc_index]
 
         if fc < 1E-6:
             smoothed_spectrum[:, fc_index] = 0
@@ -70,7 +113,10 @@ def konno_and_ohmachi(frequencies, spectrum, fcs, bandwidth=40.): # pragma: no c
         sumproduct = np.zeros(nrows)
         sumwindow = 0
 
-        for f_index, f in enumerate(frequencies):
+        # only examine frequencies in the band of the smoothing window.
+        start, stop = _band_indices(frequencies, fc*lower_limit, fc*upper_limit, is_sorted)
+        for f_index in range(start, stop):
+            f = frequencies[f_index]
             f_on_fc = f/fc
 
             if (f < 1E-6) or (f_on_fc > upper_limit) or (f_on_fc < lower_limit):
@@ -133,7 +179,10 @@ def parzen(frequencies, spectrum, fcs, bandwidth=0.5): # pragma: no cover
     ncols = fcs.size
     smoothed_spectrum = np.empty((nrows, ncols))
 
-    for fc_index, fc in enumerate(fcs):
+    is_sorted = _is_sorted(frequencies)
+
+    for fc_index in prange(fcs.size):
+        fc = fcs[fc_index]
 
         if fc < 1E-6:
             smoothed_spectrum[:, fc_index] = 0
@@ -142,7 +191,10 @@ def parzen(frequencies, spectrum, fcs, bandwidth=0.5): # pragma: no cover
         sumproduct = np.zeros(nrows)
         sumwindow = 0
 
-        for f_index, f in enumerate(frequencies):
+        # only examine frequencies in the band of the smoothing window.
+        start, stop = _band_indices(frequencies, fc + lower_limit, fc + upper_limit, is_sorted)
+        for f_index in range(start, stop):
+            f = frequencies[f_index]
             f_minus_fc = f - fc
 
             if (f < 1E-6) or (f_minus_fc > upper_limit) or (f_minus_fc < lower_limit):
@@ -194,6 +246,18 @@ def savitzky_and_golay(frequencies, spectrum, fcs, bandwidth=9): # pragma: no co
        Differentiation of Data by Simplified Least Squares Procedures"
        Anal. Chem. 36, 1627-1639.
 
+    """
+    nfcs, coefficients, normalization_coefficient = _savitzky_and_golay_setup(
+        frequencies, fcs, bandwidth)
+    return _savitzky_and_golay(spectrum, nfcs, coefficients, normalization_coefficient)
+
+
+def _savitzky_and_golay_setup(frequencies, fcs, bandwidth):
+    """Indices and coefficients for Savitzky and Golay smoothing.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
     """
     m = int(bandwidth)
     if m % 2 != 1:
@@ -214,7 +278,7 @@ def savitzky_and_golay(frequencies, spectrum, fcs, bandwidth=9): # pragma: no co
     df = diff[0]
     nfcs = np.round((fcs - np.min(frequencies)) / df).astype(int)
 
-    return _savitzky_and_golay(spectrum, nfcs, coefficients, normalization_coefficient)
+    return (nfcs, coefficients, normalization_coefficient)
 
 
 @njit(cache=True)
@@ -226,7 +290,8 @@ def _savitzky_and_golay(spectrum, nfcs, coefficients, normalization_coefficient)
 
     ncoeff = coefficients.size
 
-    for nfc_idx, spectrum_idx in enumerate(nfcs):
+    for nfc_idx in prange(ncols):
+        spectrum_idx = nfcs[nfc_idx]
 
         if (spectrum_idx < ncoeff) or (spectrum_idx + ncoeff > nfreqs):
             smoothed_spectrum[:, nfc_idx] = 0
@@ -248,7 +313,10 @@ def linear_rectangular(frequencies, spectrum, fcs, bandwidth=0.5): # pragma: no
     nfcs = fcs.size
     smoothed_spectrum = np.empty((nspectra, nfcs))
 
-    for fc_index, fc in enumerate(fcs):
+    is_sorted = _is_sorted(frequencies)
+
+    for fc_index in prange(fcs.size):
+        fc = fcs[fc_index]
 
         if fc < 1E-6:
             smoothed_spectrum[:, fc_index] = 0
@@ -257,7 +325,10 @@ def linear_rectangular(frequencies, spectrum, fcs, bandwidth=0.5): # pragma: no
         sumproduct = np.zeros(nspectra)
         sumwindow = 0
 
-        for f_index, f in enumerate(frequencies):
+        # only examine frequencies in the band of the smoothing window.
+        start, stop = _band_indices(frequencies, fc - bandwidth/2, fc + bandwidth/2, is_sorted)
+        for f_index in range(start, stop):
+            f = frequencies[f_index]
             f_minus_fc = f - fc
 
             if (f < 1E-6) or (np.abs(f_minus_fc) > bandwidth/2):
@@ -285,7 +356,10 @@ def log_rectangular(frequencies, spectrum, fcs, bandwidth=0.05): # pragma: no co
     nfcs = fcs.size
     smoothed_spectrum = np.empty((nspectra, nfcs))
 
-    for fc_index, fc in enumerate(fcs):
+    is_sorted = _is_sorted(frequencies)
+
+    for fc_index in prange(fcs.size):
+        fc = fcs[fc_index]
 
         if fc < 1E-6:
             smoothed_spectrum[:, fc_index] = 0
@@ -294,7 +368,10 @@ def log_rectangular(frequencies, spectrum, fcs, bandwidth=0.05): # pragma: no co
         sumproduct = np.zeros(nspectra)
         sumwindow = 0
 
-        for f_index, f in enumerate(frequencies):
+        # only examine frequencies in the band of the smoothing window.
+        start, stop = _band_indices(frequencies, fc*lower_limit, fc*upper_limit, is_sorted)
+        for f_index in range(start, stop):
+            f = frequencies[f_index]
             f_on_fc = f / fc
 
             if (f < 1E-6) or (f_on_fc < lower_limit) or (f_on_fc > upper_limit):
@@ -319,7 +396,10 @@ def linear_triangular(frequencies, spectrum, fcs, bandwidth=0.5): # pragma: no c
     nfcs = fcs.size
     smoothed_spectrum = np.empty((nspectra, nfcs))
 
-    for fc_index, fc in enumerate(fcs):
+    is_sorted = _is_sorted(frequencies)
+
+    for fc_index in prange(fcs.size):
+        fc = fcs[fc_index]
 
         if fc < 1E-6:
             smoothed_spectrum[:, fc_index] = 0
@@ -328,7 +408,10 @@ def linear_triangular(frequencies, spectrum, fcs, bandwidth=0.5): # pragma: no c
         sumproduct = np.zeros(nspectra)
         sumwindow = 0
 
-        for f_index, f in enumerate(frequencies):
+        # only examine frequencies in the band of the smoothing window.
+        start, stop = _band_indices(frequencies, fc - bandwidth/2, fc + bandwidth/2, is_sorted)
+        for f_index in range(start, stop):
+            f = frequencies[f_index]
             f_minus_fc = f - fc
 
             if (f < 1E-6) or (np.abs(f_minus_fc) > bandwidth/2):
@@ -356,7 +439,10 @@ def log_triangular(frequencies, spectrum, fcs, bandwidth=0.05): # pragma: no cov
     nfcs = fcs.size
     smoothed_spectrum = np.empty((nspectra, nfcs))
 
-    for fc_index, fc in enumerate(fcs):
+    is_sorted = _is_sorted(frequencies)
+
+    for fc_index in prange(fcs.size):
+        fc = fcs[fc_index]
 
         if fc < 1E-6:
             smoothed_spectrum[:, fc_index] = 0
@@ -365,7 +451,10 @@ def log_triangular(frequencies, spectrum, fcs, bandwidth=0.05): # pragma: no cov
         sumproduct = np.zeros(nspectra)
         sumwindow = 0
 
-        for f_index, f in enumerate(frequencies):
+        # only examine frequencies in the band of the smoothing window.
+        start, stop = _band_indices(frequencies, fc*lower_limit, fc*upper_limit, is_sorted)
+        for f_index in range(start, stop):
+            f = frequencies[f_index]
             f_on_fc = f/fc
 
             if (f < 1E-6) or (f_on_fc < lower_limit) or (f_on_fc > upper_limit):
@@ -393,3 +482,365 @@ SMOOTHING_OPERATORS = {
     "linear_triangular": linear_triangular,
     "log_triangular": log_triangular,
 }
+
+
+# parallel variants distribute the center frequencies across threads.
+# note: not cached to disk as numba would not distinguish them from the
+# serial variants compiled from the same python function.
+def _parallel(kernel):
+    return njit(parallel=True)(kernel.py_func)
+
+
+_savitzky_and_golay_parallel = _parallel(_savitzky_and_golay)
+
+
+def _savitzky_and_golay_parallel_wrapper(frequencies, spectrum, fcs, bandwidth=9): # pragma: no cover
+    nfcs, coefficients, normalization_coefficient = _savitzky_and_golay_setup(
+        frequencies, fcs, bandwidth)
+    return _savitzky_and_golay_parallel(spectrum, nfcs, coefficients, normalization_coefficient)
+
+
+PARALLEL_SMOOTHING_OPERATORS = {
+    "konno_and_ohmachi": _parallel(konno_and_ohmachi),
+    "parzen": _parallel(parzen),
+    "savitzky_and_golay": _savitzky_and_golay_parallel_wrapper,
+    "linear_rectangular": _parallel(linear_rectangular),
+    "log_rectangular": _parallel(log_rectangular),
+    "linear_triangular": _parallel(linear_triangular),
+    "log_triangular": _parallel(log_triangular),
+}
+
+
+def _konno_and_ohmachi_window(frequencies, fc, bandwidth):
+    n = 3
+    upper_limit = np.power(10, +n/bandwidth)
+    lower_limit = np.power(10, -n/bandwidth)
+    f_on_fc = frequencies/fc
+    keep = ~((frequencies < 1E-6) | (f_on_fc > upper_limit) | (f_on_fc < lower_limit))
+    indices = np.flatnonzero(keep)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        window = bandwidth * np.log10(f_on_fc[indices])
+        window = np.sin(window) / window
+    window *= window
+    window *= window
+    window[np.abs(frequencies[indices] - fc) < 1E-6] = 1.
+    return (indices, window)
+
+
+def _parzen_window(frequencies, fc, bandwidth):
+    a = (np.pi*280) / (2*151)
+    upper_limit = np.sqrt(6) * a/bandwidth
+    lower_limit = -1 * upper_limit
+    f_minus_fc = frequencies - fc
+    keep = ~((frequencies < 1E-6) | (f_minus_fc > upper_limit) | (f_minus_fc < lower_limit))
+    indices = np.flatnonzero(keep)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        window = a*f_minus_fc[indices] / bandwidth
+        window = np.sin(window) / window
+    window *= window
+    window *= window
+    window[np.abs(frequencies[indices] - fc) < 1E-6] = 1.
+    return (indices, window)
+
+
+def _linear_rectangular_window(frequencies, fc, bandwidth):
+    keep = ~((frequencies < 1E-6) | (np.abs(frequencies - fc) > bandwidth/2))
+    indices = np.flatnonzero(keep)
+    return (indices, np.ones(indices.size))
+
+
+def _log_rectangular_window(frequencies, fc, bandwidth):
+    lower_limit = np.power(10, -bandwidth/2)
+    upper_limit = np.power(10, +bandwidth/2)
+    f_on_fc = frequencies / fc
+    keep = ~((frequencies < 1E-6) | (f_on_fc < lower_limit) | (f_on_fc > upper_limit))
+    indices = np.flatnonzero(keep)
+    return (indices, np.ones(indices.size))
+
+
+def _linear_triangular_window(frequencies, fc, bandwidth):
+    f_minus_fc = frequencies - fc
+    keep = ~((frequencies < 1E-6) | (np.abs(f_minus_fc) > bandwidth/2))
+    indices = np.flatnonzero(keep)
+    window = 1. - np.abs(f_minus_fc[indices])*(2/bandwidth)
+    return (indices, window)
+
+
+def _log_triangular_window(frequencies, fc, bandwidth):
+    lower_limit = np.power(10, -bandwidth/2)
+    upper_limit = np.power(10, +bandwidth/2)
+    f_on_fc = frequencies / fc
+    keep = ~((frequencies < 1E-6) | (f_on_fc < lower_limit) | (f_on_fc > upper_limit))
+    indices = np.flatnonzero(keep)
+    window = 1 - np.abs(np.log10(f_on_fc[indices]))*(2/bandwidth)
+    return (indices, window)
+
+
+def _smoothing_band(operator, fc, bandwidth):
+    """Frequency band ``(f_low, f_high)`` of a smoothing window.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    if operator == "konno_and_ohmachi":
+        n = 3
+        return (fc*np.power(10, -n/bandwidth), fc*np.power(10, +n/bandwidth))
+    elif operator == "parzen":
+        a = (np.pi*280) / (2*151)
+        upper_limit = np.sqrt(6) * a/bandwidth
+        return (fc - upper_limit, fc + upper_limit)
+    elif operator in ["linear_rectangular", "linear_triangular"]:
+        return (fc - bandwidth/2, fc + bandwidth/2)
+    else:
+        return (fc*np.power(10, -bandwidth/2), fc*np.power(10, +bandwidth/2))
+
+
+SMOOTHING_WINDOWS = {
+    "konno_and_ohmachi": _konno_and_ohmachi_window,
+    "parzen": _parzen_window,
+    "linear_rectangular": _linear_rectangular_window,
+    "log_rectangular": _log_rectangular_window,
+    "linear_triangular": _linear_triangular_window,
+    "log_triangular": _log_triangular_window,
+}
+
+SMOOTHING_OPERATOR_CACHE = LruCache(maxsize=16)
+
+# upper limit on the memory used by each sparse product, in bytes.
+SMOOTHING_BATCH_SIZE_IN_BYTES = 2**26
+
+
+class SmoothingOperator():
+    """Smoothing operator stored as a sparse matrix of weights.
+
+    Applying the operator is equivalent to calling the function of the
+    same name in ``SMOOTHING_OPERATORS``, however the weights are
+    computed only once and smoothing becomes a single sparse
+    matrix-matrix product.
+
+    Attributes
+    ----------
+    operator : str
+        Name of smoothing operator, see ``SMOOTHING_OPERATORS``.
+    bandwidth : float
+        Bandwidth of smoothing operator.
+    weights : csr_matrix
+        Normalized smoothing weights of shape
+        ``(nfcs, nfrequency)``.
+
+    """
+
+    def __init__(self, operator, frequencies, fcs, bandwidth):
+        """Build smoothing operator.
+
+        Parameters
+        ----------
+        operator : str
+            Name of smoothing operator, see ``SMOOTHING_OPERATORS``.
+        frequencies : ndarray
+            Frequencies of the spectrum to be smoothed, must be of
+            shape `(nfrequency,)`.
+        fcs : ndarray
+            1D array of center frequencies where smoothed spectrum is
+            calculated.
+        bandwidth : float
+            Bandwidth of smoothing operator, see the function of the
+            same name in ``SMOOTHING_OPERATORS`` for details.
+
+        """
+        frequencies = np.array(frequencies, dtype=float)
+        fcs = np.array(fcs, dtype=float)
+        if operator == "savitzky_and_golay":
+            weights = self._savitzky_and_golay_weights(frequencies, fcs, bandwidth)
+        elif operator in SMOOTHING_WINDOWS:
+            weights = self._windowed_weights(operator,
+                                             frequencies, fcs, bandwidth)
+        else:
+            msg = f"Smoothing operator {operator} not recognized, "
+            msg += f"try one of {list(SMOOTHING_OPERATORS.keys())}."
+            raise KeyError(msg)
+
+        self.operator = operator
+        self.bandwidth = bandwidth
+        self.weights = weights
+        self._single_precision_weights = None
+
+    @staticmethod
+    def _windowed_weights(operator, frequencies, fcs, bandwidth):
+        window_function = SMOOTHING_WINDOWS[operator]
+        is_sorted = _is_sorted(frequencies)
+        indptr = np.zeros(fcs.size + 1, dtype=np.int64)
+        all_indices, all_weights = [], []
+        for fc_index, fc in enumerate(fcs):
+            indices, window = np.empty(0, dtype=np.int64), np.empty(0)
+            if fc >= 1E-6:
+                # only examine frequencies in the band of the smoothing window.
+                start, stop = _band_indices(frequencies,
+                                            *_smoothing_band(operator, fc, bandwidth),
+                                            is_sorted)
+                _indices, _window = window_function(frequencies[start:stop], fc, bandwidth)
+                _indices += start
+                sumwindow = np.sum(_window)
+                if sumwindow > 0:
+                    indices, window = _indices, _window / sumwindow
+            all_indices.append(indices)
+            all_weights.append(window)
+            indptr[fc_index + 1] = indptr[fc_index] + indices.size
+        return csr_matrix((np.concatenate(all_weights), np.concatenate(all_indices), indptr),
+                          shape=(fcs.size, frequencies.size))
+
+    @staticmethod
+    def _savitzky_and_golay_weights(frequencies, fcs, bandwidth):
+        nfcs, coefficients, normalization_coefficient = _savitzky_and_golay_setup(
+            frequencies, fcs, bandwidth)
+        ncoeff = coefficients.size
+        nfreqs = frequencies.size
+
+        offsets = np.arange(-(ncoeff-1), ncoeff)
+        window = coefficients[-1 - np.abs(offsets)] / normalization_coefficient
+        valid = (nfcs >= ncoeff) & (nfcs + ncoeff <= nfreqs)
+
+        indptr = np.zeros(nfcs.size + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.where(valid, offsets.size, 0))
+        indices = (nfcs[valid][:, np.newaxis] + offsets).flatten()
+        data = np.tile(window, np.count_nonzero(valid))
+        return csr_matrix((data, indices, indptr), shape=(nfcs.size, nfreqs))
+
+    @classmethod
+    def from_cache(cls, operator, frequencies, fcs, bandwidth):
+        """Retrieve smoothing operator from cache, building if necessary.
+
+        Operators are cached by ``(operator, bandwidth, frequencies,
+        fcs)`` in the bounded ``SMOOTHING_OPERATOR_CACHE``.
+
+        Parameters
+        ----------
+        operator : str
+            Name of smoothing operator, see ``SMOOTHING_OPERATORS``.
+        frequencies : ndarray
+            Frequencies of the spectrum to be smoothed, must be of
+            shape `(nfrequency,)`.
+        fcs : ndarray
+            1D array of center frequencies where smoothed spectrum is
+            calculated.
+        bandwidth : float
+            Bandwidth of smoothing operator.
+
+        Returns
+        -------
+        SmoothingOperator
+            Smoothing operator, possibly shared with previous calls.
+
+        """
+        frequencies = np.array(frequencies, dtype=float)
+        fcs = np.array(fcs, dtype=float)
+        key = (operator, float(bandwidth),
+               array_digest(frequencies), array_digest(fcs))
+        return SMOOTHING_OPERATOR_CACHE.get(
+            key, lambda: cls(operator, frequencies, fcs, bandwidth))
+
+    def smooth(self, spectrum):
+        """Smooth spectrum(s).
+
+        Parameters
+        ----------
+        spectrum : ndarray
+            Spectrum(s) to be smoothed, must be of shape
+            `(nspectrum, nfrequency)`.
+
+        Returns
+        -------
+        ndarray
+            Spectrum smoothed at the center frequencies of shape
+            `(nspectrum, nfcs)`, ``float32`` if ``spectrum`` is
+            ``float32`` otherwise ``float64``.
+
+        """
+        nfcs, nfrequency = self.weights.shape
+        if spectrum.ndim != 2 or spectrum.shape[1] != nfrequency:
+            msg = f"spectrum must be of shape (nspectrum, {nfrequency}), "
+            msg += f"not {spectrum.shape}."
+            raise IndexError(msg)
+
+        # single precision spectra are smoothed in single precision.
+        if spectrum.dtype == np.float32:
+            if self._single_precision_weights is None:
+                self._single_precision_weights = self.weights.astype(np.float32)
+            weights = self._single_precision_weights
+        else:
+            weights = self.weights
+
+        # product in batches as the spectrum is copied to C-order.
+        nrows = spectrum.shape[0]
+        batch_size = max(1, SMOOTHING_BATCH_SIZE_IN_BYTES // (weights.dtype.itemsize*nfrequency))
+        smoothed_spectrum = np.empty((nrows, nfcs), dtype=weights.dtype)
+        for start in range(0, nrows, batch_size):
+            stop = start + batch_size
+            smoothed_spectrum[start:stop] = (weights @ spectrum[start:stop].T).T
+        return smoothed_spectrum
+
+
+def apply_smoothing(frequencies, spectrum, smoothing):
+    """Smooth spectrum(s) as specified by smoothing settings.
+
+    Parameters
+    ----------
+    frequencies : ndarray
+        Frequencies of the spectrum to be smoothed, must be of shape
+        `(nfrequency,)`.
+    spectrum : ndarray
+        Spectrum(s) to be smoothed, must be of shape
+        `(nspectrum, nfrequency)`.
+    smoothing : dict
+        Smoothing information like ``dict(operator="konno_and_ohmachi",
+        bandwidth=40, center_frequencies_in_hz=np.geomspace(0.1, 50, 200))``.
+        May optionally include ``engine`` to select the implementation,
+        either ``"sparse"`` (default) which uses a cached
+        ``SmoothingOperator``, ``"numba"`` which uses the compiled
+        functions in ``SMOOTHING_OPERATORS``, or ``"numba_parallel"``
+        which uses the multithreaded functions in
+        ``PARALLEL_SMOOTHING_OPERATORS``. The number of threads used by
+        ``"numba_parallel"`` may be set with ``n_threads``, default is
+        all threads available to ``numba``.
+
+    Returns
+    -------
+    ndarray
+        Spectrum smoothed at the specified center frequencies,
+        ``float32`` if ``spectrum`` is ``float32`` otherwise
+        ``float64``.
+
+    """
+    operator = smoothing["operator"]
+    bandwidth = smoothing["bandwidth"]
+    fcs = np.array(smoothing["center_frequencies_in_hz"], dtype=float)
+    engine = smoothing.get("engine", "sparse")
+
+    if engine == "sparse":
+        smoothing_operator = SmoothingOperator.from_cache(
+            operator, frequencies, fcs, bandwidth)
+        return smoothing_operator.smooth(spectrum)
+    elif engine == "numba":
+        smoothed_spectrum = SMOOTHING_OPERATORS[operator](frequencies, spectrum, fcs, bandwidth)
+    elif engine == "numba_parallel":
+        n_threads = smoothing.get("n_threads", None)
+        with PARALLEL_REGION_LOCK:
+            if n_threads is None:
+                smoothed_spectrum = PARALLEL_SMOOTHING_OPERATORS[operator](frequencies, spectrum, fcs, bandwidth)
+            else:
+                previous_n_threads = numba.get_num_threads()
+                numba.set_num_threads(n_threads)
+                try:
+                    smoothed_spectrum = PARALLEL_SMOOTHING_OPERATORS[operator](frequencies, spectrum, fcs, bandwidth)
+                finally:
+                    numba.set_num_threads(previous_n_threads)
+    else:
+        msg = f"Smoothing engine {engine} not recognized, "
+        msg += "try one of ['sparse', 'numba', 'numba_parallel']."
+        raise ValueError(msg)
+
+    # compiled operators accumulate in double precision.
+    if spectrum.dtype == np.float32:
+        smoothed_spectrum = smoothed_spectrum.astype(np.float32)
+    return smoothed_spectrum
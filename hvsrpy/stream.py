@@ -0,0 +1,445 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Streaming (i.e., out-of-core) processing of long recordings."""
+
+import pathlib
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
+from scipy.signal import sosfiltfilt
+
+from .data_wrangler import _arrange_traces
+from .miniseed import COL_N_SAMPLES, COL_STARTTIME_NS, NS_PER_S, _index_traces, _decode
+from .seismic_recording_3c import SeismicRecording3C
+from .timeseries import TimeSeries, _butterworth_sos
+from .preprocessing import _split_and_detrend
+from .processing import process, prepare_fft_settings, PsdAccumulator, _concatenate_results
+
+__all__ = ["iter_mseed_chunks", "process_stream"]
+
+
+def iter_mseed_chunks(fnames, chunk_length_in_seconds=3600., degrees_from_north=None):
+    """Read a miniSEED recording as a sequence of consecutive chunks.
+
+    The records of the file(s) are indexed once and only the records
+    spanning a chunk are decoded when that chunk is requested, such
+    that only a single chunk is held in memory at a time.
+
+    Parameters
+    ----------
+    fnames : {str, list}
+        Name of the miniSEED file containing all three components or
+        list with the names of the three miniSEED files, one per
+        component, see ``hvsrpy.read_single`` for details.
+    chunk_length_in_seconds : float, optional
+        Duration of each chunk in seconds, default is ``3600.``.
+    degrees_from_north : float, optional
+        Rotation in degrees of the sensor's north component relative to
+        magnetic north; clock wise positive. Default is ``None``
+        indicating the sensor's north component is aligned with
+        magnetic north.
+
+    Yields
+    ------
+    SeismicRecording3C
+        Consecutive, non-overlapping chunks of the recording. Chunks
+        only include time periods for which all three components are
+        available, and never span a gap. Chunks of the same continuous
+        segment of the recording share the same ``meta["segment"]``,
+        which is incremented after each gap.
+
+    Raises
+    ------
+    ValueError
+        If the file(s) are not miniSEED or do not contain three
+        components with a common sample rate.
+    NotImplementedError
+        If the file(s) contain records that cannot be decoded natively
+        (see ``hvsrpy.miniseed``).
+
+    """
+    if isinstance(fnames, (str, pathlib.Path)):
+        sources = [fnames]
+        meta_fnames = str(fnames)
+    else:
+        sources = list(fnames)
+        meta_fnames = [str(fname) for fname in fnames]
+
+    channels = []
+    for source in sources:
+        buf, traces = _index_traces(source)
+        channels.extend(SimpleNamespace(source=source, buf=buf, **vars(trace)) for trace in traces)
+    if len(channels) != 3:
+        msg = f"Provided {len(channels)} traces, but must only provide 3."
+        raise ValueError(msg)
+    sampling_rate = channels[0].sampling_rate
+    for channel in channels[1:]:
+        if abs(channel.sampling_rate - sampling_rate) > 1e-4*sampling_rate:
+            msg = "All components must have the same sample rate."
+            raise ValueError(msg)
+    delta_ns = NS_PER_S / sampling_rate
+    n_per_chunk = max(int(round(chunk_length_in_seconds*sampling_rate)), 1)
+
+    for channel in channels:
+        channel.segments = _continuous_segments(channel.table, delta_ns)
+    spans = [(segment.start_ns, segment.end_ns) for segment in channels[0].segments]
+    for channel in channels[1:]:
+        spans = _intersect(spans, [(segment.start_ns, segment.end_ns) for segment in channel.segments])
+
+    if degrees_from_north is None:
+        degrees_from_north = 0.
+
+    segment_index = 0
+    for span_start_ns, span_end_ns in spans:
+        # first sample of the span and samples available, per component.
+        firsts, n_samples = [], []
+        for channel in channels:
+            segment = _segment_at(channel.segments, span_start_ns, delta_ns)
+            first = segment.skip + int(round((span_start_ns - segment.start_ns)/delta_ns))
+            firsts.append((segment, first))
+            n_samples.append(segment.cumulative[-1] - first)
+        n_samples = min(n_samples)
+        if n_samples <= 0:
+            continue
+
+        for chunk_start in range(0, n_samples, n_per_chunk):
+            chunk_stop = min(chunk_start + n_per_chunk, n_samples)
+            traces = []
+            for channel, (segment, first) in zip(channels, firsts):
+                data = _decode_samples(channel, segment,
+                                       first + chunk_start, first + chunk_stop)
+                stats = SimpleNamespace(channel=channel.identifier[3],
+                                        delta=1/sampling_rate)
+                traces.append(SimpleNamespace(data=data, stats=stats, meta=stats))
+            ns, ew, vt = _arrange_traces(traces)
+            meta = {"file name(s)": meta_fnames, "segment": segment_index}
+            yield SeismicRecording3C(ns, ew, vt,
+                                     degrees_from_north=degrees_from_north,
+                                     meta=meta)
+        segment_index += 1
+
+
+def _continuous_segments(table, delta_ns):
+    """Split the records of a trace into continuous segments.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Records are split at gaps and overlaps larger than half a sample.
+    Samples overlapping those of a previous segment are skipped.
+
+    Returns
+    -------
+    list
+        Of segments with attributes ``table`` (records of the segment),
+        ``cumulative`` (number of samples before each record and, last,
+        in total), ``skip`` (number of leading samples to be skipped),
+        ``start_ns``, and ``end_ns`` (time of the first sample after
+        those skipped and the time after the last sample).
+
+    """
+    n_samples = table[:, COL_N_SAMPLES]
+    starts = table[:, COL_STARTTIME_NS]
+    expected = starts[:-1] + n_samples[:-1]*delta_ns
+    breaks = np.flatnonzero(np.abs(starts[1:] - expected) > delta_ns/2) + 1
+
+    segments = []
+    end_ns = None
+    for records in np.split(np.arange(len(table)), breaks):
+        cumulative = np.concatenate(([0], np.cumsum(n_samples[records])))
+        start_ns = float(starts[records[0]])
+        skip = 0
+        if end_ns is not None:
+            skip = max(int(np.ceil((end_ns - start_ns)/delta_ns - 0.5)), 0)
+        if skip >= cumulative[-1]:
+            continue
+        start_ns += skip*delta_ns
+        end_ns = start_ns + (cumulative[-1] - skip)*delta_ns
+        segments.append(SimpleNamespace(table=table[records], cumulative=cumulative,
+                                        skip=skip, start_ns=start_ns, end_ns=end_ns))
+    return segments
+
+
+def _intersect(spans_a, spans_b):
+    """Intersection of two sorted lists of disjoint time spans.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    spans = []
+    idx_a, idx_b = 0, 0
+    while idx_a < len(spans_a) and idx_b < len(spans_b):
+        start = max(spans_a[idx_a][0], spans_b[idx_b][0])
+        end = min(spans_a[idx_a][1], spans_b[idx_b][1])
+        if start < end:
+            spans.append((start, end))
+        if spans_a[idx_a][1] < spans_b[idx_b][1]:
+            idx_a += 1
+        else:
+            idx_b += 1
+    return spans
+
+
+def _segment_at(segments, time_ns, delta_ns):
+    """Continuous segment including the sample nearest ``time_ns``.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    for segment in segments:
+        if segment.start_ns - delta_ns/2 <= time_ns < segment.end_ns:
+            return segment
+    raise ValueError(f"No segment includes {time_ns} ns.") # pragma: no cover
+
+
+def _decode_samples(channel, segment, start, stop):
+    """Decode samples ``[start, stop)`` of a continuous segment.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    first_record = np.searchsorted(segment.cumulative, start, side="right") - 1
+    stop_record = np.searchsorted(segment.cumulative, stop, side="left")
+    data = _decode(channel.buf, segment.table[first_record:stop_record], channel.source)
+    offset = segment.cumulative[first_record]
+    return data[start - offset:stop - offset]
+
+
+def _default_filter_margin_in_seconds(fcs_in_hz):
+    """Duration over which the filter's response is non-negligible.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    fcs = [fc for fc in fcs_in_hz if fc is not None]
+    if len(fcs) == 0:
+        return 0.
+    return 20. / min(fcs)
+
+
+def process_stream(source, preprocessing_settings, processing_settings,
+                   chunk_length_in_seconds=3600., filter_margin_in_seconds=None):
+    """Preprocess and process a recording one chunk at a time.
+
+    Unlike ``preprocess`` and ``process``, which require the entire
+    recording (and all of its time windows) to be held in memory, only
+    a single chunk of the recording and the smoothed HVSR of each
+    time window are retained. The results are equivalent to those of
+    ``preprocess`` followed by ``process`` to within a small tolerance
+    introduced by the chunk-wise time-domain filter. For diffuse field
+    processing only the running sum of the power spectra is retained
+    (see ``PsdAccumulator``).
+
+    Parameters
+    ----------
+    source : {str, list, iterable of SeismicRecording3C}
+        If ``str`` or ``list`` of ``str``, name(s) of miniSEED file(s),
+        see ``iter_mseed_chunks``. Otherwise an iterable of
+        ``SeismicRecording3C`` objects which are consecutive,
+        non-overlapping chunks of the same recording. Chunks with a
+        different ``meta["segment"]`` than the previous chunk follow
+        a gap, time windows never span a gap.
+    preprocessing_settings : HvsrPreProcessingSettings
+        ``HvsrPreProcessingSettings`` object that controls how the
+        time-domain data will be preprocessed, the
+        ``window_length_in_seconds`` cannot be ``None``.
+    processing_settings : HvsrProcessingSettings
+        ``HvsrProcessingSettings`` object that controls how the
+        time-domain data will be processed. Only the
+        ``"traditional"``, ``"azimuthal"``, and ``"diffuse_field"``
+        processing methods are supported.
+    chunk_length_in_seconds : float, optional
+        Duration of each chunk read when ``source`` is the name of a
+        file, default is ``3600.``.
+    filter_margin_in_seconds : float, optional
+        Duration of data on either side of a chunk included when
+        filtering to mitigate edge effects, default is ``None``
+        indicating twenty periods of the lowest corner frequency.
+
+    Returns
+    -------
+    HvsrTraditional, HvsrAzimuthal, or HvsrDiffuseField
+        Instantiated object according to the processing settings
+        selected.
+
+    """
+    if processing_settings.processing_method not in ["traditional", "azimuthal", "diffuse_field"]:
+        msg = "process_stream only supports processing methods "
+        msg += "['traditional', 'azimuthal', 'diffuse_field'], not "
+        msg += f"{processing_settings.processing_method}."
+        raise NotImplementedError(msg)
+
+    window_length_in_seconds = preprocessing_settings.window_length_in_seconds
+    if window_length_in_seconds is None:
+        raise ValueError("window_length_in_seconds cannot be None when streaming.")
+
+    if isinstance(source, (str, pathlib.Path)) or (isinstance(source, (list, tuple)) and isinstance(source[0], (str, pathlib.Path))):
+        source = iter_mseed_chunks(source,
+                                   chunk_length_in_seconds=chunk_length_in_seconds)
+
+    fcs_in_hz = preprocessing_settings.filter_corner_frequencies_in_hz
+    if filter_margin_in_seconds is None:
+        filter_margin_in_seconds = _default_filter_margin_in_seconds(fcs_in_hz)
+
+    results = []
+    if processing_settings.processing_method == "diffuse_field":
+        accumulator = PsdAccumulator(processing_settings)
+    else:
+        accumulator = None
+    buffer = None
+    buffer_start = 0
+    next_window_start = 0
+    segment = None
+    windows = None
+    for chunk in source:
+        if preprocessing_settings.orient_to_degrees_from_north is not None:
+            chunk.orient_sensor_to(preprocessing_settings.orient_to_degrees_from_north)
+
+        # chunks after a gap start a new buffer, windows never span a gap.
+        if buffer is not None and chunk.meta.get("segment") != segment:
+            remaining_windows = _preprocess_remaining_windows(buffer, buffer_start, next_window_start,
+                                                              step, margin, sos, dt, degrees_from_north,
+                                                              meta, preprocessing_settings)
+            if remaining_windows is not None:
+                windows = remaining_windows
+                _process_windows(windows, processing_settings, results, accumulator)
+            buffer = np.empty((3, 0))
+            buffer_start = 0
+            next_window_start = 0
+        segment = chunk.meta.get("segment")
+
+        if buffer is None:
+            dt = chunk.vt.dt_in_seconds
+            meta = {key: value for key, value in chunk.meta.items() if key != "segment"}
+            degrees_from_north = chunk.degrees_from_north
+            step = int(window_length_in_seconds/dt)
+            margin = int(np.ceil(filter_margin_in_seconds/dt))
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                sos = _butterworth_sos(fcs_in_hz, 5, 1/dt)
+            buffer = np.empty((3, 0))
+        elif abs(chunk.vt.dt_in_seconds - dt) > 1E-8:
+            msg = "All chunks must have the same dt_in_seconds; "
+            msg += f"expected {dt}, not {chunk.vt.dt_in_seconds}."
+            raise ValueError(msg)
+
+        amplitudes = np.array([chunk.ns.amplitude, chunk.ew.amplitude, chunk.vt.amplitude])
+        buffer = np.concatenate((buffer, amplitudes), axis=1)
+        buffer_end = buffer_start + buffer.shape[1]
+
+        # windows are complete once the filter margin after them is read.
+        n_windows = (buffer_end - margin - 1 - next_window_start) // step
+        if n_windows > 0:
+            stop = next_window_start + n_windows*step + 1
+            windows = _preprocess_windows(buffer, buffer_start, next_window_start, stop,
+                                          margin, sos, dt, degrees_from_north, meta,
+                                          preprocessing_settings)
+            _process_windows(windows, processing_settings, results, accumulator)
+            next_window_start += n_windows*step
+
+            # discard samples no longer required.
+            keep_start = max(next_window_start - margin, buffer_start)
+            buffer = buffer[:, keep_start - buffer_start:]
+            buffer_start = keep_start
+
+    if buffer is None:
+        raise ValueError("source did not provide any data.")
+
+    remaining_windows = _preprocess_remaining_windows(buffer, buffer_start, next_window_start,
+                                                      step, margin, sos, dt, degrees_from_north,
+                                                      meta, preprocessing_settings)
+    if remaining_windows is not None:
+        windows = remaining_windows
+        _process_windows(windows, processing_settings, results, accumulator)
+    buffer_end = buffer_start + buffer.shape[1]
+
+    if len(results) == 0 and (accumulator is None or accumulator.n_windows == 0):
+        msg = f"Window length of {window_length_in_seconds} s is larger "
+        msg += f"than the record length of {(buffer_end-1)*dt} s."
+        raise ValueError(msg)
+
+    if accumulator is not None:
+        return accumulator.to_hvsr_diffuse_field(meta={**windows[0].meta, **processing_settings.attr_dict})
+    return _concatenate_results(results)
+
+
+def _process_windows(windows, processing_settings, results, accumulator=None):
+    """Process windows, either accumulating their PSD or their results.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    if accumulator is None:
+        results.append(process(windows, processing_settings))
+    else:
+        if accumulator.n_windows == 0:
+            prepare_fft_settings(windows, processing_settings)
+        accumulator.partial_fit(windows)
+
+
+def _preprocess_remaining_windows(buffer, buffer_start, start, step, margin, sos, dt,
+                                  degrees_from_north, meta, preprocessing_settings):
+    """Preprocess all remaining windows of the buffer, if any.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    # the last window may be one sample short (see split).
+    buffer_end = buffer_start + buffer.shape[1]
+    n_windows = (buffer_end - start) // step
+    if n_windows == 0:
+        return None
+    stop = min(start + n_windows*step + 1, buffer_end)
+    return _preprocess_windows(buffer, buffer_start, start, stop, margin, sos, dt,
+                               degrees_from_north, meta, preprocessing_settings)
+
+
+def _preprocess_windows(buffer, buffer_start, start, stop, margin, sos, dt,
+                        degrees_from_north, meta, preprocessing_settings):
+    """Filter, split, and detrend a segment of the buffer.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    # filter segment including margins to mitigate edge effects.
+    filter_start = max(start - margin, buffer_start) - buffer_start
+    filter_stop = stop + margin - buffer_start
+    segment = buffer[:, filter_start:filter_stop]
+    if sos is not None:
+        segment = sosfiltfilt(sos.copy(), segment, axis=-1)
+    segment = segment[:, start - buffer_start - filter_start:stop - buffer_start - filter_start]
+
+    record = SeismicRecording3C(TimeSeries(segment[0], dt),
+                                TimeSeries(segment[1], dt),
+                                TimeSeries(segment[2], dt),
+                                degrees_from_north=degrees_from_north,
+                                meta=meta)
+    if sos is not None:
+        record.meta["butterworth_filter"] = preprocessing_settings.filter_corner_frequencies_in_hz
+
+    return _split_and_detrend(record,
+                              preprocessing_settings.window_length_in_seconds,
+                              preprocessing_settings.detrend)
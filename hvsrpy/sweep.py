@@ -0,0 +1,295 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Parameter sweeps sharing intermediate results between settings."""
+
+import copy
+import itertools
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .seismic_recording_3c import SeismicRecording3C
+from .preprocessing import _split_and_detrend
+from .processing import prepare_fft_settings, prepare_records_with_inconsistent_dt, COMBINE_HORIZONTAL_REGISTER, _traditional_raw_spectra, _traditional_hvsr_from_raw_spectra
+from .result_cache import _digest, RAW_SPECTRA_INDEPENDENT_SETTINGS
+from .settings import HvsrPreProcessingSettings, HvsrTraditionalProcessingSettings
+from . import sesame
+
+__all__ = ["sweep"]
+
+# preprocessing settings controlling the orient and filter stage.
+FILTER_STAGE_SETTINGS = ("orient_to_degrees_from_north",
+                         "filter_corner_frequencies_in_hz")
+
+
+def _expand_grid(settings, grid):
+    """Settings for every combination of values in a grid.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    settings : Settings
+        Settings from which all combinations are derived.
+    grid : dict
+        Keys are names of attributes of ``settings`` and values are
+        iterables of the values to be considered. Entries of
+        attributes that are dictionaries are selected with a dot
+        (e.g., ``"smoothing.bandwidth"``).
+
+    Yields
+    ------
+    tuple
+        Of the form ``(combination, settings)`` where ``combination``
+        is a dictionary of the values selected from ``grid`` and
+        ``settings`` is a copy of ``settings`` with those values.
+
+    """
+    names = list(grid.keys())
+    for values in itertools.product(*[list(grid[name]) for name in names]):
+        _settings = copy.deepcopy(settings)
+        for name, value in zip(names, values):
+            attr, _, key = name.partition(".")
+            if not hasattr(_settings, attr):
+                msg = f"{type(_settings).__name__} has no attribute {attr}."
+                raise ValueError(msg)
+            if key:
+                getattr(_settings, attr)[key] = value
+            else:
+                setattr(_settings, attr, value)
+        yield (dict(zip(names, values)), _settings)
+
+
+def _stage_key(settings, names):
+    """Key identifying the output of a stage.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    attr_dict = settings.attr_dict
+    return _digest({name: attr_dict[name] for name in names})
+
+
+def _filtered_records(records, settings):
+    """Orient and filter records, leaving the originals unchanged.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    records = copy.deepcopy(records)
+    for record in records:
+        if settings.orient_to_degrees_from_north is not None:
+            record.orient_sensor_to(settings.orient_to_degrees_from_north)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            record.butterworth_filter(settings.filter_corner_frequencies_in_hz)
+    return records
+
+
+def _windowed_records(records, settings):
+    """Divide records into detrended windows.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    windows = []
+    for record in records:
+        windows.extend(_split_and_detrend(record,
+                                          settings.window_length_in_seconds,
+                                          settings.detrend,
+                                          dtype=settings.dtype))
+    return windows
+
+
+def _summarize(hvsr, window_length_in_seconds, search_range_in_hz):
+    """Resonance statistics and SESAME criteria of an ``HvsrTraditional``.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    hvsr.update_peaks_bounded(search_range_in_hz=search_range_in_hz)
+    mean_curve = hvsr.mean_curve(distribution="lognormal")
+    std_curve = hvsr.std_curve(distribution="lognormal")
+    mc_frequency, mc_amplitude = hvsr.mean_curve_peak(distribution="lognormal")
+    reliability = sesame.reliability(windowlength=window_length_in_seconds,
+                                     passing_window_count=int(np.sum(hvsr.valid_window_boolean_mask)),
+                                     frequency=hvsr.frequency,
+                                     mean_curve=mean_curve,
+                                     std_curve=std_curve,
+                                     search_range_in_hz=search_range_in_hz,
+                                     verbose=0)
+    clarity = sesame.clarity(frequency=hvsr.frequency,
+                             mean_curve=mean_curve,
+                             std_curve=std_curve,
+                             fn_std=hvsr.std_fn_frequency(distribution="normal"),
+                             search_range_in_hz=search_range_in_hz,
+                             verbose=0)
+    return {
+        "n_windows": int(np.sum(hvsr.valid_window_boolean_mask)),
+        "mean_fn_frequency_in_hz": hvsr.mean_fn_frequency(distribution="lognormal"),
+        "std_fn_frequency_lognormal": hvsr.std_fn_frequency(distribution="lognormal"),
+        "mean_fn_amplitude": hvsr.mean_fn_amplitude(distribution="lognormal"),
+        "mean_curve_peak_frequency_in_hz": mc_frequency,
+        "mean_curve_peak_amplitude": mc_amplitude,
+        "sesame_reliability_criteria_passed": int(np.sum(reliability)),
+        "sesame_clarity_criteria_passed": int(np.sum(clarity)),
+    }
+
+
+def sweep(records,
+          preprocessing_grid,
+          processing_grid,
+          preprocessing_settings=None,
+          processing_settings=None,
+          search_range_in_hz=(None, None),
+          max_workers=None):
+    """Process records for every combination of settings in a grid.
+
+    Rather than preprocessing and processing the records from scratch
+    for every combination, the stages are arranged as a tree such that
+    stages with identical inputs are only computed once; records are
+    oriented and filtered once per filter, divided into windows once
+    per window length, and transformed once per taper (and other
+    settings affecting the raw spectra). The smoothing of the shared
+    raw amplitude spectra (e.g., for each bandwidth) is then performed
+    in parallel.
+
+    Parameters
+    ----------
+    records : SeismicRecording3C or iterable of SeismicRecording3C
+        Time-domain data to be processed, not modified.
+    preprocessing_grid : dict
+        Keys are attributes of ``HvsrPreProcessingSettings`` and values
+        are iterables of the values to be considered, for example
+        ``{"window_length_in_seconds": [30, 60]}``.
+    processing_grid : dict
+        Keys are attributes of ``HvsrTraditionalProcessingSettings``
+        and values are iterables of the values to be considered.
+        Entries of attributes that are dictionaries are selected with
+        a dot, for example
+        ``{"window_type_and_width": [["tukey", 0.1], ["tukey", 0.2]],
+        "smoothing.bandwidth": [20, 40]}``.
+    preprocessing_settings : HvsrPreProcessingSettings, optional
+        Settings for values not in ``preprocessing_grid``, default is
+        ``None`` indicating the default settings will be used.
+    processing_settings : HvsrTraditionalProcessingSettings, optional
+        Settings for values not in ``processing_grid``, default is
+        ``None`` indicating the default settings will be used.
+    search_range_in_hz : tuple, optional
+        Frequency range to be searched for peaks, default is
+        ``(None, None)`` indicating the full frequency range will be
+        searched.
+    max_workers : int, optional
+        Maximum number of threads used to smooth spectra, default is
+        ``None`` indicating the default of
+        ``concurrent.futures.ThreadPoolExecutor`` will be used.
+
+    Returns
+    -------
+    DataFrame
+        With one row per combination of settings. The first columns
+        hold the values selected from ``preprocessing_grid`` and
+        ``processing_grid``, the remaining columns hold the number of
+        windows, the lognormal statistics of the resonant frequency
+        and amplitude across windows, the peak of the lognormal mean
+        curve, and the number of SESAME (2004) reliability (of 3) and
+        clarity (of 6) criteria passed.
+
+    Raises
+    ------
+    ValueError
+        If the settings are not for traditional HVSR processing with a
+        frequency-domain combination of the horizontals, or if a grid
+        refers to an attribute that does not exist.
+
+    """
+    if isinstance(records, SeismicRecording3C):
+        records = [records]
+    records = list(records)
+
+    preprocessing_settings = HvsrPreProcessingSettings() if preprocessing_settings is None else preprocessing_settings
+    processing_settings = HvsrTraditionalProcessingSettings() if processing_settings is None else processing_settings
+    if (processing_settings.processing_method != "traditional" or
+            processing_settings.method_to_combine_horizontals not in COMBINE_HORIZONTAL_REGISTER):
+        msg = "sweep only supports traditional processing with "
+        msg += f"method_to_combine_horizontals in {list(COMBINE_HORIZONTAL_REGISTER.keys())}."
+        raise ValueError(msg)
+
+    preprocessing_combinations = list(_expand_grid(preprocessing_settings, preprocessing_grid))
+    processing_combinations = list(_expand_grid(processing_settings, processing_grid))
+
+    # visit combinations sharing a filter consecutively, such that only
+    # one set of filtered records is held at a time.
+    keys = [_stage_key(pre_settings, FILTER_STAGE_SETTINGS)
+            for _, pre_settings in preprocessing_combinations]
+    order = sorted(range(len(preprocessing_combinations)), key=lambda idx: keys[idx])
+
+    rows = [None]*len(preprocessing_combinations)
+    filtered_key, filtered_records = None, None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for pre_idx in order:
+            pre_combination, pre_settings = preprocessing_combinations[pre_idx]
+
+            # orient and filter, once per filter, releasing the previous
+            # filter's records first.
+            if keys[pre_idx] != filtered_key:
+                filtered_records = None
+                filtered_records = _filtered_records(records, pre_settings)
+                filtered_key = keys[pre_idx]
+
+            # divide into windows.
+            windows = _windowed_records(filtered_records, pre_settings)
+
+            # group processing settings by their raw spectra.
+            groups = {}
+            all_pro_settings = []
+            for idx, (_, pro_settings) in enumerate(processing_combinations):
+                pro_settings = copy.deepcopy(pro_settings)
+                prepare_fft_settings(windows, pro_settings)
+                all_pro_settings.append(pro_settings)
+                raw_settings = {k: v for k, v in pro_settings.attr_dict.items()
+                                if k not in RAW_SPECTRA_INDEPENDENT_SETTINGS}
+                groups.setdefault(_digest(raw_settings), []).append(idx)
+
+            summaries = [None]*len(processing_combinations)
+            for indices in groups.values():
+                # transform, once per taper.
+                _settings = all_pro_settings[indices[0]]
+                _records, dt_with_count = prepare_records_with_inconsistent_dt(windows, _settings)
+                raw = _traditional_raw_spectra(_records, dt_with_count, _settings)
+
+                # smooth and summarize, in parallel for each smoothing.
+                def _process(pro_settings, _records=_records, raw=raw):
+                    hvsr = _traditional_hvsr_from_raw_spectra(_records, raw, pro_settings)
+                    return _summarize(hvsr, pre_settings.window_length_in_seconds, search_range_in_hz)
+
+                for idx, summary in zip(indices, executor.map(_process, [all_pro_settings[idx] for idx in indices])):
+                    summaries[idx] = summary
+
+            rows[pre_idx] = [{**pre_combination, **pro_combination, **summary}
+                             for (pro_combination, _), summary in zip(processing_combinations, summaries)]
+            del windows
+
+    return pd.DataFrame([row for _rows in rows for row in _rows])
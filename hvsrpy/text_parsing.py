@@ -0,0 +1,216 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Bulk parsing of the numeric body of text-based file formats.
+
+Whitespace-delimited numbers (e.g., ``-1234``, ``.8713554E-03``) are
+tokenized and converted by a compiled kernel. Conversions are exact
+(i.e., identical to Python's ``float``) as only numbers with at most
+15 significant digits and a decimal exponent no larger than 22 in
+magnitude are converted directly; anything else is delegated to
+``float``. Parsing may optionally stop at the first token that is not a
+number, such that trailing text (e.g., a footer) is ignored.
+"""
+
+import numpy as np
+from numba import njit
+
+__all__ = ["parse_numbers"]
+
+# status codes returned by the compiled parser.
+STATUS_OK = 0
+STATUS_INEXACT = 1
+STATUS_NOT_A_NUMBER = 2
+
+# exactly representable powers of ten and the number of significant
+# digits that can be represented exactly by a double.
+POWERS_OF_TEN = np.array([10.**k for k in range(23)])
+MAX_SIGNIFICANT_DIGITS = 15
+
+
+@njit(cache=True)
+def _is_whitespace(byte):  # pragma: no cover
+    # space, tab, line feed, vertical tab, form feed, or carriage return.
+    return byte == 32 or (9 <= byte <= 13)
+
+
+@njit(cache=True)
+def _is_digit(byte):  # pragma: no cover
+    return 48 <= byte <= 57
+
+
+@njit(cache=True, nogil=True)
+def _count_tokens(buf):  # pragma: no cover
+    count = 0
+    in_token = False
+    for idx in range(buf.size):
+        if _is_whitespace(buf[idx]):
+            in_token = False
+        elif not in_token:
+            in_token = True
+            count += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _parse_tokens(buf, out):  # pragma: no cover
+    """Convert whitespace-delimited numbers into floating point values.
+
+    Parameters
+    ----------
+    buf : ndarray
+        Text encoded as an array of bytes.
+    out : ndarray
+        Array, of length equal to the number of tokens, to be
+        populated with the converted values.
+
+    Returns
+    -------
+    tuple
+        Of the form ``(status, count, start)`` where ``status`` is
+        ``STATUS_OK`` if all tokens were converted,
+        ``STATUS_NOT_A_NUMBER`` if the token beginning at byte
+        ``start`` is not a number, or ``STATUS_INEXACT`` if that token
+        cannot be converted exactly. In all cases the first ``count``
+        entries of ``out`` are populated.
+
+    """
+    n = buf.size
+    idx = 0
+    count = 0
+    while True:
+        while idx < n and _is_whitespace(buf[idx]):
+            idx += 1
+        if idx == n:
+            return STATUS_OK, count, idx
+        start = idx
+
+        negative = False
+        if buf[idx] == 45 or buf[idx] == 43:
+            negative = buf[idx] == 45
+            idx += 1
+
+        mantissa = 0
+        n_significant = 0
+        n_digits = 0
+        exponent = 0
+
+        # integer part.
+        while idx < n and _is_digit(buf[idx]):
+            digit = buf[idx] - 48
+            n_digits += 1
+            if mantissa > 0 or digit > 0:
+                n_significant += 1
+                if n_significant > MAX_SIGNIFICANT_DIGITS:
+                    return STATUS_INEXACT, count, start
+                mantissa = mantissa*10 + digit
+            idx += 1
+
+        # fractional part.
+        if idx < n and buf[idx] == 46:
+            idx += 1
+            while idx < n and _is_digit(buf[idx]):
+                digit = buf[idx] - 48
+                n_digits += 1
+                if mantissa > 0 or digit > 0:
+                    n_significant += 1
+                    if n_significant > MAX_SIGNIFICANT_DIGITS:
+                        return STATUS_INEXACT, count, start
+                    mantissa = mantissa*10 + digit
+                exponent -= 1
+                idx += 1
+
+        if n_digits == 0:
+            return STATUS_NOT_A_NUMBER, count, start
+
+        # exponent.
+        if idx < n and (buf[idx] == 69 or buf[idx] == 101):
+            idx += 1
+            exponent_negative = False
+            if idx < n and (buf[idx] == 45 or buf[idx] == 43):
+                exponent_negative = buf[idx] == 45
+                idx += 1
+            n_exponent_digits = 0
+            explicit_exponent = 0
+            while idx < n and _is_digit(buf[idx]):
+                if explicit_exponent < 10000:
+                    explicit_exponent = explicit_exponent*10 + (buf[idx] - 48)
+                n_exponent_digits += 1
+                idx += 1
+            if n_exponent_digits == 0:
+                return STATUS_NOT_A_NUMBER, count, start
+            exponent += -explicit_exponent if exponent_negative else explicit_exponent
+
+        if idx < n and not _is_whitespace(buf[idx]):
+            return STATUS_NOT_A_NUMBER, count, start
+
+        if mantissa == 0:
+            value = 0.
+        elif abs(exponent) > 22:
+            return STATUS_INEXACT, count, start
+        elif exponent >= 0:
+            value = float(mantissa) * POWERS_OF_TEN[exponent]
+        else:
+            value = float(mantissa) / POWERS_OF_TEN[-exponent]
+
+        out[count] = -value if negative else value
+        count += 1
+
+
+def parse_numbers(text, stop_at_non_numeric=False):
+    """Parse whitespace-delimited numbers.
+
+    Parameters
+    ----------
+    text : {str, bytes}
+        Text containing whitespace-delimited numbers.
+    stop_at_non_numeric : bool, optional
+        If ``True`` parsing stops at the first token that is not a
+        number and the remaining text is ignored, default is ``False``
+        indicating an error is raised instead.
+
+    Returns
+    -------
+    ndarray
+        Numbers in the order they appear in ``text``.
+
+    Raises
+    ------
+    ValueError
+        If ``text`` contains a token that is not a number and
+        ``stop_at_non_numeric=False``.
+
+    """
+    if isinstance(text, str):
+        text = text.encode()
+    buf = np.frombuffer(text, dtype=np.uint8)
+    values = np.empty(_count_tokens(buf), dtype=np.float64)
+    status, count, start = _parse_tokens(buf, values)
+    if status == STATUS_OK:
+        return values
+
+    # convert the remaining tokens one at a time.
+    remaining = []
+    for token in text[start:].split():
+        try:
+            remaining.append(float(token))
+        except ValueError:
+            if stop_at_non_numeric:
+                break
+            raise
+    values[count:count+len(remaining)] = remaining
+    return values[:count+len(remaining)]
@@ -21,14 +21,82 @@ import warnings
 import logging
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.signal.windows import tukey
 from scipy.signal import butter, sosfiltfilt, detrend
 
+from .cache import LruCache
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["TimeSeries"]
 
 
+# bounded caches for filter and taper designs shared by all time series.
+TAPER_CACHE = LruCache(maxsize=32)
+BUTTERWORTH_SOS_CACHE = LruCache(maxsize=32)
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+def _taper(n_samples, type="tukey", width=0.1):
+    """Taper (i.e., window) of length ``n_samples``.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Returns
+    -------
+    ndarray
+        Read-only taper, shared between calls with the same arguments
+        through ``TAPER_CACHE``.
+
+    """
+    if type == "tukey":
+        key = (int(n_samples), type, float(width))
+        return TAPER_CACHE.get(key, lambda: _read_only(tukey(n_samples, alpha=width)))
+    else:
+        msg = f"Window type {type} not recognized, try ['tukey',]."
+        raise NotImplementedError(msg)
+
+
+def _butterworth_sos(fcs_in_hz, order, fs):
+    """Second-order sections of a Butterworth filter.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Returns
+    -------
+    ndarray or None
+        Read-only second-order sections of the filter, shared between
+        calls with the same arguments through ``BUTTERWORTH_SOS_CACHE``,
+        ``None`` if no corner frequencies are provided.
+
+    """
+    fc_low, fc_high = fcs_in_hz
+    if fc_low is None and fc_high is not None:
+        btype = "lowpass"
+        wn = fc_high
+    elif fc_low is not None and fc_high is None:
+        btype = "highpass"
+        wn = fc_low
+    elif fc_low is not None and fc_high is not None:
+        btype = "bandpass"
+        wn = (fc_low, fc_high)
+    else:
+        msg = "No corner frequencies provided; no filtering performed."
+        warnings.warn(msg)
+        return None
+
+    key = (int(order), wn, btype, float(fs))
+    return BUTTERWORTH_SOS_CACHE.get(
+        key, lambda: _read_only(butter(order, wn, btype, fs=fs, output='sos')))
+
+
 class TimeSeries():
 
     def __init__(self, amplitude, dt_in_seconds):
@@ -151,14 +219,65 @@ class TimeSeries():
         """
         self.amplitude = detrend(self.amplitude, type=type)
 
-    # TODO (jpv): Consider adding the ability to overlap windows.
-    def split(self, window_length_in_seconds):
+    def _split_views(self, window_length_in_seconds, overlap=0.):
+        """Read-only views of the amplitude, one per window.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        Returns
+        -------
+        tuple
+            Of the form ``(windows, tail)`` where ``windows`` is a
+            read-only ``ndarray`` of shape
+            ``(n_windows, samples_per_window)`` sharing memory with
+            ``amplitude`` and ``tail`` is ``None`` or a read-only
+            ``ndarray`` with the final window, which is one sample
+            shorter than the others.
+
+        """
+        if overlap < 0 or overlap >= 1:
+            msg = f"overlap must be in the interval [0, 1), not {overlap}."
+            raise ValueError(msg)
+
+        samples_per_window = int(window_length_in_seconds/self.dt_in_seconds) + 1
+        step = max(int(round((samples_per_window-1)*(1-overlap))), 1)
+        n_windows = (self.n_samples - (samples_per_window-1)) // step + 1
+
+        if samples_per_window < 2:
+            msg = f"Window length of {window_length_in_seconds} s is shorter "
+            msg += f"than the time step of {self.dt_in_seconds} s."
+            raise ValueError(msg)
+
+        if n_windows < 1:
+            msg = f"Window length of {window_length_in_seconds} s is larger "
+            msg += f"than the record length of {(self.n_samples-1)*self.dt_in_seconds} s."
+            raise ValueError(msg)
+
+        if self.n_samples < samples_per_window:
+            windows = np.empty((0, samples_per_window))
+        else:
+            windows = sliding_window_view(self.amplitude, samples_per_window)[::step]
+
+        # last window may extend one sample past the end of the record.
+        tail = None
+        if n_windows > windows.shape[0]:
+            tail = self.amplitude[(n_windows-1)*step:].view()
+            tail.flags.writeable = False
+
+        return (windows, tail)
+
+    def split(self, window_length_in_seconds, overlap=0.):
         """Split record into set of records.
 
         Parameters
         ----------
         window_length_in_seconds : float
             Duration of each split in seconds.
+        overlap : float, optional
+            Fraction of each window shared with the following window,
+            must be in the interval ``[0, 1)``, default is ``0.``
+            indicating windows only share a single sample (see notes).
 
         Returns
         -------
@@ -172,23 +291,18 @@ class TimeSeries():
             number of windows. Without this, for example, a 10-minute
             record could not be broken into 10, 1-minute records.
 
-        """
-        samples_per_window = int(window_length_in_seconds/self.dt_in_seconds) + 1
-        n_windows = int(self.n_samples / (samples_per_window-1))
-
-        if n_windows < 1:
-            msg = f"Window length of {window_length_in_seconds} s is larger "
-            msg += f"than the record length of {(self.n_samples-1)*self.dt_in_seconds} s."
-            raise ValueError(msg)
+            The windows are read-only views into the ``amplitude`` of
+            the original record, so no data is copied. Operations on
+            a window (e.g., ``detrend``) replace its ``amplitude`` with
+            a private copy and do not affect the other windows.
 
-        start_idx = 0
-        windows = []
-        for _ in range(n_windows):
-            end_idx = start_idx + samples_per_window
-            tseries = TimeSeries(self.amplitude[start_idx:end_idx], self.dt_in_seconds)
-            windows.append(tseries)
-            start_idx = end_idx - 1
-        return windows
+        """
+        windows, tail = self._split_views(window_length_in_seconds,
+                                          overlap=overlap)
+        splits = [TimeSeries._from_view(window, self.dt_in_seconds) for window in windows]
+        if tail is not None:
+            splits.append(TimeSeries._from_view(tail, self.dt_in_seconds))
+        return splits
 
     def window(self, type="tukey", width=0.1):
         """Apply window to time series.
@@ -205,16 +319,11 @@ class TimeSeries():
         Returns
         -------
         None
-            Applies window to the ``amplitude`` attribute in-place.
+            Replaces the ``amplitude`` attribute with its windowed
+            version.
 
         """
-        if type == "tukey":
-            window = tukey(self.n_samples, alpha=width)
-        else:
-            msg = f"Window type {type} not recognized, try ['tukey',]."
-            raise NotImplementedError(msg)
-
-        self.amplitude *= window
+        self.amplitude = self.amplitude * _taper(self.n_samples, type=type, width=width)
 
     def butterworth_filter(self, fcs_in_hz, order=5):
         """Apply Butterworth filter.
@@ -235,29 +344,31 @@ class TimeSeries():
             Filters ``amplitude`` attribute in-place.
 
         """
-        fc_low, fc_high = fcs_in_hz
-        if fc_low is None and fc_high is not None:
-            btype = "lowpass"
-            wn = fc_high
-        elif fc_low is not None and fc_high is None:
-            btype = "highpass"
-            wn = fc_low
-        elif fc_low is not None and fc_high is not None:
-            btype = "bandpass"
-            wn = [fc_low, fc_high]
-        else:
-            msg = "No corner frequencies provided; no filtering performed."
-            warnings.warn(msg)
+        sos = _butterworth_sos(fcs_in_hz, order, self.fs)
+        if sos is None:
             return None
 
-        sos = butter(order, wn, btype, fs=self.fs, output='sos')
-        self.amplitude = sosfiltfilt(sos, self.amplitude)
+        # cached sos is read-only, but scipy requires a writeable buffer.
+        self.amplitude = sosfiltfilt(sos.copy(), self.amplitude)
 
     @classmethod
     def from_trace(cls, trace):
         """Initialize a ``TimeSeries`` object from ``obspy`` ``Trace``."""
         return cls(trace.data, trace.stats.delta)
 
+    @classmethod
+    def _from_view(cls, amplitude, dt_in_seconds):
+        """Initialize a ``TimeSeries`` without copying ``amplitude``.
+
+        .. warning::
+            Private methods are subject to change without warning.
+
+        """
+        obj = cls.__new__(cls)
+        obj.amplitude = amplitude
+        obj.dt_in_seconds = float(dt_in_seconds)
+        return obj
+
     @classmethod
     def from_timeseries(cls, timeseries):
         """Copy constructor for ``TimeSeries`` object.
@@ -21,8 +21,10 @@ import logging
 
 import numpy as np
 
+from .hvsr_curve import HvsrCurve
 from .hvsr_traditional import HvsrTraditional
 from .hvsr_azimuthal import HvsrAzimuthal
+from .statistics import _distribution_factory
 from .interact import ginput_session, plot_continue_button, is_absolute_point_in_relative_box
 from .postprocessing import plt, plot_single_panel_hvsr_curves
 
@@ -279,11 +281,69 @@ def frequency_domain_window_rejection(hvsr,
     return max_performed_iterations
 
 
+class _IncrementalMeanCurve():
+    """Running mean curve of an ``HvsrTraditional`` object's valid windows.
+
+    .. warning::
+        Private classes are subject to change without warning.
+
+    Keeps a running sum of the (transformed) amplitudes per frequency
+    such that when windows are accepted or rejected only their
+    contribution must be added or removed. If the amplitudes are not
+    all finite and positive, the mean curve is instead computed
+    directly from ``hvsr``.
+
+    """
+
+    def __init__(self, hvsr, distribution="lognormal"):
+        self.hvsr = hvsr
+        self.distribution = distribution
+        self._window_mask = np.array(hvsr.valid_window_boolean_mask, dtype=bool)
+        self.is_incremental = bool(np.all(np.isfinite(hvsr.amplitude)) and np.all(hvsr.amplitude > 0))
+        if self.is_incremental:
+            pre_fxn, _ = _distribution_factory(distribution, calculation="mean")
+            self._curves = pre_fxn(hvsr.amplitude)
+            self._curve_sum = np.sum(self._curves[self._window_mask], axis=0)
+
+    def update(self):
+        """Add and remove windows whose mask changed since last update."""
+        window_mask = self.hvsr.valid_window_boolean_mask
+        if self.is_incremental:
+            added = window_mask & ~self._window_mask
+            removed = self._window_mask & ~window_mask
+            if np.any(added):
+                self._curve_sum += np.sum(self._curves[added], axis=0)
+            if np.any(removed):
+                self._curve_sum -= np.sum(self._curves[removed], axis=0)
+        self._window_mask = np.array(window_mask, dtype=bool)
+
+    def mean_curve(self):
+        """Mean curve, equivalent to ``HvsrTraditional.mean_curve``."""
+        n_windows = np.sum(self._window_mask)
+        if not self.is_incremental or n_windows <= 1:
+            return self.hvsr.mean_curve(self.distribution)
+        _, post_fxn = _distribution_factory(self.distribution, calculation="mean")
+        return post_fxn(self._curve_sum / n_windows)
+
+    def mean_curve_peak(self):
+        """Mean curve peak, equivalent to ``HvsrTraditional.mean_curve_peak``."""
+        f_peak, a_peak = HvsrCurve._find_peak_bounded(self.hvsr.frequency,
+                                                      self.mean_curve(),
+                                                      search_range_in_hz=self.hvsr._search_range_in_hz,
+                                                      find_peaks_kwargs=self.hvsr._find_peaks_kwargs)
+        if f_peak is None or a_peak is None:
+            msg = "Mean curve does not have a peak in the specified range."
+            raise ValueError(msg)
+        return (f_peak, a_peak)
+
+
 def _frequency_domain_window_rejection(hvsr,
                                        n=2,
                                        max_iterations=50,
                                        distribution_fn="lognormal",
                                        distribution_mc="lognormal"):
+    mean_curve = _IncrementalMeanCurve(hvsr, distribution=distribution_mc)
+
     for c_iteration in range(1, max_iterations+1):
         logger.debug(f"c_iteration: {c_iteration}")
         logger.debug(
@@ -293,7 +353,7 @@ def _frequency_domain_window_rejection(hvsr,
 
         mean_fn_before = hvsr.mean_fn_frequency(distribution_fn)
         std_fn_before = hvsr.std_fn_frequency(distribution_fn)
-        mc_peak_frq_before, _ = hvsr.mean_curve_peak(distribution_mc)
+        mc_peak_frq_before, _ = mean_curve.mean_curve_peak()
         diff_before = abs(mean_fn_before - mc_peak_frq_before)
 
         logger.debug(f"\tmean_fn_before: {mean_fn_before}")
@@ -304,20 +364,17 @@ def _frequency_domain_window_rejection(hvsr,
         lower_bound = hvsr.nth_std_fn_frequency(-n, distribution_fn)
         upper_bound = hvsr.nth_std_fn_frequency(+n, distribution_fn)
 
-        for _idx, (c_valid, c_peak) in enumerate(zip(hvsr.valid_peak_boolean_mask, hvsr._main_peak_frq)):
-            if not c_valid:
-                continue
-
-            if c_peak > lower_bound and c_peak < upper_bound:
-                hvsr.valid_window_boolean_mask[_idx] = True
-                hvsr.valid_peak_boolean_mask[_idx] = True
-            else:
-                hvsr.valid_window_boolean_mask[_idx] = False
-                hvsr.valid_peak_boolean_mask[_idx] = False
+        # only windows with a valid peak are re-evaluated.
+        c_valid = hvsr.valid_peak_boolean_mask.copy()
+        c_peak = hvsr._main_peak_frq[c_valid]
+        in_bounds = (c_peak > lower_bound) & (c_peak < upper_bound)
+        hvsr.valid_window_boolean_mask[c_valid] = in_bounds
+        hvsr.valid_peak_boolean_mask[c_valid] = in_bounds
+        mean_curve.update()
 
         mean_fn_after = hvsr.mean_fn_frequency(distribution_fn)
         std_fn_after = hvsr.std_fn_frequency(distribution_fn)
-        mc_peak_frq_after, _ = hvsr.mean_curve_peak(distribution_mc)
+        mc_peak_frq_after, _ = mean_curve.mean_curve_peak()
         d_after = abs(mean_fn_after - mc_peak_frq_after)
 
         logger.debug(f"\tmean_fn_after: {mean_fn_after}")
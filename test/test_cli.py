@@ -15,6 +15,104 @@
 # #     You should have received a copy of the GNU General Public License
 # #     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
 
+"""Tests for the command line interface (CLI)."""
+
+import csv
+import json
+import os
+import pathlib
+import tempfile
+
+import numpy as np
+from click.testing import CliRunner
+
+from hvsrpy import settings as hvsr_settings
+from hvsrpy.cli import cli, REPORT_STAGES, _write_report
+from testing_tools import unittest, TestCase, get_full_path
+
+
+class TestCLI(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.full_path = get_full_path(__file__, result_as_string=False)
+        input_path = cls.full_path / "data/input"
+        cls.fnames = [str(input_path / "mseed_combined/ut.stn11.a2_c50.mseed"),
+                      str(input_path / "saf/mt_20211122_133110.saf")]
+
+    def _invoke(self, fnames, *args, report=None, window_length_in_seconds=60.):
+        """Run cli, return its per-file outputs and report (if any)."""
+        # cli writes its outputs to the current working directory.
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+                preprocessing_settings.window_length_in_seconds = window_length_in_seconds
+                preprocessing_settings.save("preprocessing.json")
+                processing_settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+                processing_settings.smoothing["center_frequencies_in_hz"] = np.geomspace(0.2, 20, 64)
+                processing_settings.save("processing.json")
+                if report is not None:
+                    args = (*args, "--report", report)
+                result = CliRunner().invoke(cli, [*fnames,
+                                                  "--preprocessing_settings_file", "preprocessing.json",
+                                                  "--processing_settings_file", "processing.json",
+                                                  "--no_figure", *args])
+                self.assertEqual(0, result.exit_code, msg=repr(result.exception))
+                outputs = {}
+                for fname in fnames:
+                    with open(f"{pathlib.Path(fname).stem}.csv", "r") as f:
+                        outputs[fname] = f.read()
+                if report is None:
+                    return outputs, None
+                with open(report, "r", newline="") as f:
+                    if report.endswith(".json"):
+                        return outputs, json.load(f)
+                    return outputs, list(csv.DictReader(f))
+            finally:
+                os.chdir(cwd)
+
+    def _check_rows(self, rows):
+        self.assertListEqual(sorted(self.fnames), sorted(row["file_name"] for row in rows))
+        for row in rows:
+            for stage in REPORT_STAGES:
+                self.assertTrue(float(row[f"{stage}_time_in_seconds"]) >= 0)
+            self.assertTrue(float(row["total_time_in_seconds"]) > 0)
+            self.assertEqual(os.path.getsize(row["file_name"]), int(row["file_size_in_bytes"]))
+            self.assertTrue("worker_peak_rss_in_bytes" in row)
+
+    def test_cli_report_json(self):
+        _, rows = self._invoke(self.fnames, "--nproc", "2", report="report.json")
+        self._check_rows(rows)
+
+    def test_cli_report_csv(self):
+        _, rows = self._invoke(self.fnames, "--nproc", "2", report="report.csv")
+        self._check_rows(rows)
+
+    def test_cli_independent_of_other_files(self):
+        # windows of 400 s require a longer fft for the miniSEED file
+        # (100 Hz) than the SAF file (50 Hz), with one worker the
+        # settings of one file must not carry over to the other.
+        expected = {}
+        for fname in self.fnames:
+            outputs, _ = self._invoke([fname], "--nproc", "1", window_length_in_seconds=400.)
+            expected.update(outputs)
+        for fnames in [self.fnames, self.fnames[::-1]]:
+            returned, _ = self._invoke(fnames, "--nproc", "1", window_length_in_seconds=400.)
+            self.assertDictEqual(expected, returned)
+
+    def test_cli_report_bad_suffix(self):
+        runner = CliRunner()
+        result = runner.invoke(cli, [*self.fnames, "--report", "report.txt"])
+        self.assertNotEqual(0, result.exit_code)
+        self.assertRaises(ValueError, _write_report, [{}], "report.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
 # """Tests for HvsrRotated object."""
 
 # import logging
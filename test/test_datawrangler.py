@@ -18,7 +18,11 @@
 """Tests associated with hvsrpy's ability to import data."""
 
 import logging
+import os
+import subprocess
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import hvsrpy
 from testing_tools import unittest, TestCase, get_full_path
@@ -91,6 +95,30 @@ class TestDataWrangler(TestCase):
         # data.save(self.input_path / "srecord3c/rsn942_northr.json")
         self.assertTrue(isinstance(data, hvsrpy.SeismicRecording3C))
 
+    def test_sniff_format(self):
+        sniff = hvsrpy.data_wrangler._sniff_format
+        expected = {
+            "mseed_combined/ut.stn11.a2_c50.mseed": "mseed",
+            "mseed_individual/ut.stn11.a2_c50_bhe.mseed": "mseed",
+            "saf/mt_20211122_133110.saf": "saf",
+            "sac_big_endian/ut.stn11.a2_c50_e.sac": "sac",
+            "sac_little_endian/ut.stn11.a2_c50_e.sac": "sac",
+            "peer/rsn942_northr_alh090.vt2": "peer",
+            "gcf/sample.gcf": None,
+        }
+        for fname, ftype in expected.items():
+            self.assertEqual(ftype, sniff(self.input_path / fname))
+
+    def test_read_single_caches_format(self):
+        fname = self.input_path / "sac_big_endian/ut.stn11.a2_c50_e.sac"
+        fnames = [fname, *[str(fname).replace("_e.", f"_{x}.") for x in "nz"]]
+        cache = hvsrpy.data_wrangler.FORMAT_CACHE
+        cache.clear()
+        hvsrpy.data_wrangler.read_single(fnames)
+        hvsrpy.data_wrangler.read_single(fnames)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+
     def test_read_on_many_miniseed(self):
         fnames = [
             [self.input_path /
@@ -123,6 +151,59 @@ class TestDataWrangler(TestCase):
         self.assertAlmostEqual(data[0].degrees_from_north, 10)
         self.assertAlmostEqual(data[1].degrees_from_north, 20)
 
+    def _many_fnames(self):
+        fnames = [
+            [self.input_path / "mseed_combined/ut.stn11.a2_c50.mseed"],
+            [self.input_path / f"sac_big_endian/ut.stn11.a2_c50_{x}.sac" for x in "enz"],
+            [self.input_path / "saf/mt_20211122_133110.saf"],
+            [self.input_path / f"peer/rsn942_northr_alh{x}.vt2" for x in ["090", "360", "-up"]],
+        ]
+        return fnames*3
+
+    def test_read_on_many_concurrently(self):
+        fnames = self._many_fnames()
+        expected = hvsrpy.read(fnames)
+        returned = hvsrpy.read(fnames, max_workers=4,
+                               degrees_from_north=[float(x) for x in range(len(fnames))])
+        self.assertEqual(len(expected), len(returned))
+        for idx, (_expected, _returned) in enumerate(zip(expected, returned)):
+            self.assertEqual(_expected.meta["file name(s)"], _returned.meta["file name(s)"])
+            self.assertArrayEqual(_expected.vt.amplitude, _returned.vt.amplitude)
+            self.assertAlmostEqual(float(idx), _returned.degrees_from_north)
+
+    def test_read_concurrently_with_workqueue_threading_layer(self):
+        # the threading layer is fixed per process, so use a fresh one.
+        fname = self.input_path / "mseed_combined/ut.stn11.a2_c50.mseed"
+        script = "import hvsrpy\n"
+        script += f"hvsrpy.read([[{str(fname)!r}]]*16, max_workers=8)\n"
+        env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+        env["PYTHONPATH"] = os.pathsep.join([str(self.full_path.parent),
+                                             env.get("PYTHONPATH", "")])
+        result = subprocess.run([sys.executable, "-c", script], env=env,
+                                capture_output=True, text=True, timeout=600)
+        self.assertEqual(0, result.returncode, msg=result.stderr)
+
+    def test_iread(self):
+        fnames = self._many_fnames()
+        expected = [str(srecord.meta["file name(s)"]) for srecord in hvsrpy.read(fnames)]
+
+        # ordered, serial and with a thread pool.
+        for max_workers in [1, 3]:
+            returned = [str(srecord.meta["file name(s)"]) for srecord in
+                        hvsrpy.iread(fnames, max_workers=max_workers)]
+            self.assertListEqual(expected, returned)
+
+        # unordered, with a user-provided executor.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            returned = [str(srecord.meta["file name(s)"]) for srecord in
+                        hvsrpy.iread(fnames, executor=executor, ordered=False)]
+        self.assertListEqual(sorted(expected), sorted(returned))
+
+        # closing the generator early abandons outstanding reads.
+        srecords = hvsrpy.iread(fnames, max_workers=2)
+        self.assertTrue(isinstance(next(srecords), hvsrpy.SeismicRecording3C))
+        srecords.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -82,6 +82,35 @@ class TestHvsrCurve(TestCase):
         self.assertTrue(np.isnan(hvsr.peak_frequency))
         self.assertTrue(np.isnan(hvsr.peak_amplitude))
 
+    def test_find_peaks_bounded_batch(self):
+        rng = np.random.default_rng(1824)
+        frequency = np.geomspace(0.2, 20, 128)
+        amplitude = np.round(rng.lognormal(size=(40, 128)), 1)
+        amplitude[0] = 1.
+        for find_peaks_kwargs in [None,
+                                  dict(height=2.),
+                                  dict(height=(None, 3.)),
+                                  dict(prominence=1.5),
+                                  dict(prominence=(0.5, 2.), height=1.),
+                                  dict(distance=5),
+                                  dict(distance=5, prominence=1.),
+                                  dict(width=2)]:
+            for search_range_in_hz in [(None, None), (1., 10.)]:
+                frqs, amps = hvsrpy.HvsrCurve._find_peaks_bounded_batch(frequency,
+                                                                        amplitude,
+                                                                        search_range_in_hz=search_range_in_hz,
+                                                                        find_peaks_kwargs=find_peaks_kwargs)
+                for _amplitude, frq, amp in zip(amplitude, frqs, amps):
+                    expected = hvsrpy.HvsrCurve._find_peak_bounded(frequency,
+                                                                   _amplitude,
+                                                                   search_range_in_hz=search_range_in_hz,
+                                                                   find_peaks_kwargs=find_peaks_kwargs)
+                    if expected[0] is None:
+                        self.assertTrue(np.isnan(frq))
+                        self.assertTrue(np.isnan(amp))
+                    else:
+                        self.assertEqual(expected, (frq, amp))
+
     def test_is_similar(self):
         a = hvsrpy.HvsrCurve([1, 2, 3], [1, 2, 1])
         b = np.array([1, 2, 3])
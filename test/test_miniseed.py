@@ -0,0 +1,128 @@
+# This file is part of hvsrpy, a Python package for
+# horizontal-to-vertical spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for native miniSEED decoder."""
+
+import io
+import struct
+
+import numpy as np
+from obspy import Stream, Trace, UTCDateTime
+
+import hvsrpy
+from hvsrpy.miniseed import read_miniseed
+from hvsrpy.data_wrangler import _read_mseed
+from testing_tools import unittest, TestCase, get_full_path
+
+
+class TestMiniSeed(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.full_path = get_full_path(__file__, result_as_string=False)
+        cls.rng = np.random.default_rng(1824)
+
+    def _stream(self, dtype, scale, n_samples=2003):
+        traces = []
+        for channel in ["HHZ", "HHN", "HHE"]:
+            data = (self.rng.normal(size=n_samples)*scale).astype(dtype)
+            traces.append(Trace(data, header=dict(network="XX", station="STA", location="00",
+                                                   channel=channel, sampling_rate=250.,
+                                                   starttime=UTCDateTime(2020, 2, 29, 23, 59, 58, 123456))))
+        return Stream(traces)
+
+    def test_v2_encodings(self):
+        for encoding, dtype in [("STEIM1", np.int32), ("STEIM2", np.int32),
+                                ("INT16", np.int16), ("INT32", np.int32),
+                                ("FLOAT32", np.float32), ("FLOAT64", np.float64)]:
+            for byteorder in [">", "<"]:
+                for reclen in [256, 4096]:
+                    for scale in [10, 2000, 2**20]:
+                        if encoding == "INT16" and scale > 2000:
+                            continue
+                        expected = self._stream(dtype, scale)
+                        buffer = io.BytesIO()
+                        expected.write(buffer, format="MSEED", encoding=encoding,
+                                       byteorder=byteorder, reclen=reclen)
+                        buffer.seek(0)
+                        with self.subTest(encoding=encoding, byteorder=byteorder, reclen=reclen, scale=scale):
+                            returned = read_miniseed(buffer)
+                            self.assertEqual(len(expected), len(returned))
+                            for etrace, rtrace in zip(expected, returned):
+                                self.assertEqual(etrace.stats.channel, rtrace.stats.channel)
+                                self.assertEqual(etrace.stats.network, rtrace.stats.network)
+                                self.assertAlmostEqual(etrace.stats.delta, rtrace.stats.delta)
+                                self.assertEqual(etrace.stats.starttime.ns, rtrace.stats.starttime_ns)
+                                self.assertArrayEqual(etrace.data.astype(float), rtrace.data)
+
+    def test_v3(self):
+        records = b""
+        expected = {}
+        for channel in "ZNE":
+            data = (self.rng.normal(size=1000)*1000).astype(np.int32)
+            expected[channel] = data
+            for start in range(0, 1000, 250):
+                sid = f"FDSN:XX_STA_00_H_H_{channel}".encode()
+                payload = data[start:start+250].astype("<i4").tobytes()
+                idx = start//250
+                header = struct.pack("<2sBBIHHBBBBdIIBBHI", b"MS", 3, 0, 500_000_000*(idx % 2),
+                                     2024, 60, 12, 0, (5*idx)//2, 3, 100., 250, 0, 1, len(sid), 0, len(payload))
+                records += header + sid + payload
+        traces = read_miniseed(io.BytesIO(records))
+        self.assertListEqual(["HHZ", "HHN", "HHE"], [trace.stats.channel for trace in traces])
+        for trace in traces:
+            self.assertEqual(0.01, trace.stats.delta)
+            self.assertArrayEqual(expected[trace.stats.channel[-1]].astype(float), trace.data)
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            read_miniseed(io.BytesIO(b"not a miniSEED file"*100))
+
+        # gaps are not decoded natively.
+        stream = self._stream(np.int32, 100)
+        gappy = Stream([stream[0].slice(endtime=stream[0].stats.starttime + 2),
+                        stream[0].slice(starttime=stream[0].stats.starttime + 4)])
+        buffer = io.BytesIO()
+        gappy.write(buffer, format="MSEED", reclen=512)
+        buffer.seek(0)
+        with self.assertRaises(NotImplementedError):
+            read_miniseed(buffer)
+
+    def test_read_mseed_matches_obspy(self):
+        fname = self.full_path / "data/input/mseed_combined/ut.stn11.a2_c50.mseed"
+        expected = _read_mseed(fname, obspy_read_kwargs={"format": "MSEED"})
+        returned = hvsrpy.read_single(fname)
+        for component in ["ns", "ew", "vt"]:
+            self.assertArrayEqual(getattr(expected, component).amplitude,
+                                  getattr(returned, component).amplitude)
+            self.assertEqual(getattr(expected, component).dt_in_seconds,
+                             getattr(returned, component).dt_in_seconds)
+
+        # fall back to obspy for traces with gaps.
+        stream = self._stream(np.int32, 100)
+        vt = stream.pop(0)
+        stream.append(vt.slice(endtime=vt.stats.starttime + 2))
+        stream.append(vt.slice(starttime=vt.stats.starttime + 4))
+        buffer = io.BytesIO()
+        stream.write(buffer, format="MSEED", reclen=512)
+        buffer.seek(0)
+        with self.assertRaises(ValueError):
+            _read_mseed(buffer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -150,6 +150,92 @@ class TestObjectIO(TestCase):
             distribution_fn="lognormal"
         )
 
+    def _test_save_and_load_hvsr_binary_boiler_plate(self, hvsr, fname):
+        hvsrpy.write_hvsr_object_to_file(hvsr, fname)
+        self.assertTrue(os.path.exists(fname))
+        nhvsr = hvsrpy.read_hvsr_object_from_file(fname)
+        self.assertTrue(hvsr.is_similar(nhvsr))
+        self.assertEqual(hvsr, nhvsr)
+        self.assertArrayAlmostEqual(hvsr.mean_curve(), nhvsr.mean_curve())
+        if not isinstance(hvsr, hvsrpy.HvsrDiffuseField):
+            self.assertAlmostEqual(
+                hvsr.mean_fn_frequency(), nhvsr.mean_fn_frequency())
+            self.assertArrayAlmostEqual(
+                np.array(hvsr.mean_curve_peak()), np.array(nhvsr.mean_curve_peak()))
+        self.assertDictEqual(hvsr.meta, nhvsr.meta)
+        del nhvsr
+        os.remove(fname)
+
+    def test_write_and_read_hvsr_traditional_binary(self):
+        srecord_fname = self.full_path/"data/input/mseed_combined/ut.stn11.a2_c50.mseed"
+        srecord = hvsrpy.read([[srecord_fname]])
+        srecord = hvsrpy.preprocess(
+            srecord,
+            hvsrpy.HvsrPreProcessingSettings()
+        )
+        hvsr = hvsrpy.process(
+            srecord,
+            hvsrpy.HvsrTraditionalProcessingSettings()
+        )
+        hvsr.update_peaks_bounded(search_range_in_hz=(0.5, 10.))
+        hvsr.valid_peak_boolean_mask[2:8] = False
+        hvsr.valid_window_boolean_mask[2:8] = False
+        fname = "temp_save_and_load_hvsr_traditional.hvsrpy"
+        self._test_save_and_load_hvsr_binary_boiler_plate(hvsr, fname)
+
+        # amplitudes are memory-mapped read-only; masks are writeable.
+        hvsrpy.write_hvsr_object_to_file(hvsr, fname)
+        nhvsr = hvsrpy.read_hvsr_object_from_file(fname)
+        self.assertTrue(isinstance(nhvsr.amplitude, np.memmap))
+        self.assertFalse(nhvsr.amplitude.flags.writeable)
+        self.assertEqual(hvsr._search_range_in_hz, nhvsr._search_range_in_hz)
+        self.assertArrayEqual(hvsr._main_peak_frq, nhvsr._main_peak_frq)
+        nhvsr.valid_window_boolean_mask[0] = False
+        mhvsr = hvsrpy.read_hvsr_object_from_file(fname, mmap_mode=None)
+        self.assertFalse(isinstance(mhvsr.amplitude, np.memmap))
+        self.assertEqual(hvsr, mhvsr)
+        del nhvsr
+        os.remove(fname)
+
+    def test_write_and_read_hvsr_azimuthal_binary(self):
+        srecord_fname = self.full_path/"data/input/mseed_combined/ut.stn11.a2_c50.mseed"
+        srecord = hvsrpy.read([[srecord_fname]])
+        srecord = hvsrpy.preprocess(
+            srecord,
+            hvsrpy.HvsrPreProcessingSettings()
+        )
+        hvsr = hvsrpy.process(
+            srecord,
+            hvsrpy.HvsrAzimuthalProcessingSettings()
+        )
+        hvsr.hvsrs[5].valid_window_boolean_mask[5:10] = False
+        hvsr.hvsrs[5].valid_peak_boolean_mask[5:10] = False
+        hvsr.hvsrs[9].valid_window_boolean_mask[10:20] = False
+        hvsr.hvsrs[9].valid_peak_boolean_mask[10:20] = False
+        self._test_save_and_load_hvsr_binary_boiler_plate(
+            hvsr, "temp_save_and_load_azimuthal.hvsrpy")
+
+    def test_write_and_read_hvsr_diffuse_field_binary(self):
+        srecord_fname = self.full_path/"data/input/mseed_combined/ut.stn11.a2_c50.mseed"
+        srecord = hvsrpy.read([[srecord_fname]])
+        srecord = hvsrpy.preprocess(
+            srecord,
+            hvsrpy.HvsrPreProcessingSettings()
+        )
+        hvsr = hvsrpy.process(
+            srecord,
+            hvsrpy.HvsrDiffuseFieldProcessingSettings()
+        )
+        self._test_save_and_load_hvsr_binary_boiler_plate(
+            hvsr, "temp_save_and_load_hvsr_diffuse_field.hvsrpy")
+
+    def test_read_hvsr_binary_bad_magic(self):
+        fname = "temp_bad_magic.hvsrpy"
+        with open(fname, "wb") as f:
+            f.write(b"not an hvsrpy archive")
+        self.assertRaises(ValueError, hvsrpy.read_hvsr_object_from_file, fname)
+        os.remove(fname)
+
     def _test_write_read_settings_boiler_plate(self, settings, fname):
         hvsrpy.write_settings_object_to_file(settings, fname)
         self.assertTrue(os.path.exists(fname))
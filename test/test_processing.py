@@ -15,11 +15,14 @@
 #     You should have received a copy of the GNU General Public License
 #     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
 
+import copy
+
 import numpy as np
 
 import hvsrpy
 from hvsrpy import settings as hvsr_settings
-from hvsrpy.processing import COMBINE_HORIZONTAL_REGISTER
+from hvsrpy.processing import COMBINE_HORIZONTAL_REGISTER, single_azimuth
+from hvsrpy.smoothing import SMOOTHING_OPERATORS
 from testing_tools import unittest, TestCase, get_full_path
 
 class TestProcessing(TestCase):
@@ -45,6 +48,26 @@ class TestProcessing(TestCase):
         self.assertAlmostEqual(preprocessed_records[0].vt.time()[-1], 60.)
         self.assertTrue(len(preprocessed_records) == 60)
 
+    def test_preprocess_matches_per_window_detrend(self):
+        settings = hvsr_settings.HvsrPreProcessingSettings()
+        settings.window_length_in_seconds = 60
+        settings.filter_corner_frequencies_in_hz = (0.2, 30)
+        record = copy.deepcopy(self.ambient_noise_record)
+        preprocessed_records = hvsrpy.preprocess([record], settings)
+
+        expected_record = copy.deepcopy(self.ambient_noise_record)
+        for component in ["ns", "ew", "vt"]:
+            getattr(expected_record, component).butterworth_filter((0.2, 30))
+        expected_records = expected_record.split(60)
+        self.assertEqual(len(expected_records), len(preprocessed_records))
+        for expected, returned in zip(expected_records, preprocessed_records):
+            expected.detrend("linear")
+            for component in ["ns", "ew", "vt"]:
+                self.assertArrayAlmostEqual(getattr(expected, component).amplitude,
+                                            getattr(returned, component).amplitude,
+                                            atol=1e-9)
+            self.assertEqual("linear", returned.meta["detrend"])
+
     def test_preprocess_w_earthquake_records(self):
         settings = hvsr_settings.HvsrPreProcessingSettings()
         settings.window_length_in_seconds = None
@@ -101,6 +124,70 @@ class TestProcessing(TestCase):
         results = hvsrpy.process(preprocessed_records, settings)
         self.assertTrue(isinstance(results, hvsrpy.HvsrDiffuseField))
 
+    def test_process_single_precision(self):
+        fcs = np.geomspace(0.2, 20, 100)
+        smoothing = dict(operator="konno_and_ohmachi", bandwidth=40,
+                         center_frequencies_in_hz=fcs)
+        processing_settings = [
+            hvsr_settings.HvsrTraditionalProcessingSettings,
+            hvsr_settings.HvsrTraditionalSingleAzimuthProcessingSettings,
+            hvsr_settings.HvsrTraditionalRotDppProcessingSettings,
+            hvsr_settings.HvsrAzimuthalProcessingSettings,
+        ]
+        results = {}
+        for dtype in ["float64", "float32"]:
+            settings = hvsr_settings.HvsrPreProcessingSettings(window_length_in_seconds=120,
+                                                               dtype=dtype)
+            records = [copy.deepcopy(self.ambient_noise_record)]
+            preprocessed_records = hvsrpy.preprocess(records, settings)
+            self.assertEqual(np.dtype(dtype), preprocessed_records[0].vt.amplitude.dtype)
+            for settings_class in processing_settings:
+                settings = settings_class(smoothing=smoothing, dtype=dtype)
+                result = hvsrpy.process(preprocessed_records, settings)
+                hvsrs = result.hvsrs if isinstance(result, hvsrpy.HvsrAzimuthal) else [result]
+                results[(dtype, settings_class)] = hvsrs
+
+        # peak frequencies agree to within one center frequency.
+        max_frequency_ratio = fcs[1]/fcs[0]
+        for settings_class in processing_settings:
+            for expected, returned in zip(results[("float64", settings_class)],
+                                          results[("float32", settings_class)]):
+                self.assertEqual(np.float32, returned.amplitude.dtype)
+                self.assertArrayAlmostEqual(expected.amplitude, returned.amplitude, rtol=1e-4)
+                frequency_ratio = returned.peak_frequencies / expected.peak_frequencies
+                self.assertTrue(np.all(frequency_ratio <= max_frequency_ratio*(1 + 1e-9)))
+                self.assertTrue(np.all(frequency_ratio >= 1/max_frequency_ratio/(1 + 1e-9)))
+
+    def test_process_bad_dtype(self):
+        settings = hvsr_settings.HvsrPreProcessingSettings(window_length_in_seconds=120)
+        preprocessed_records = hvsrpy.preprocess(self.ambient_noise_records, settings)
+        settings = hvsr_settings.HvsrTraditionalProcessingSettings(dtype="float16")
+        self.assertRaises(ValueError, hvsrpy.process, preprocessed_records, settings)
+
+    def test_process_with_executor(self):
+        settings = hvsr_settings.HvsrPreProcessingSettings()
+        settings.window_length_in_seconds = 60
+        preprocessed_records = hvsrpy.preprocess(self.ambient_noise_records, settings)
+
+        for settings in [hvsr_settings.HvsrTraditionalProcessingSettings(),
+                         hvsr_settings.HvsrTraditionalRotDppProcessingSettings(azimuths_in_degrees=[0, 45, 90]),
+                         hvsr_settings.HvsrAzimuthalProcessingSettings(azimuths_in_degrees=[0, 45, 90])]:
+            expected = hvsrpy.process(preprocessed_records, settings)
+            for executor in ["threads", "processes"]:
+                settings.executor = executor
+                settings.max_workers = 3
+                returned = hvsrpy.process(preprocessed_records, settings)
+                self.assertEqual(type(expected), type(returned))
+                self.assertEqual(executor, returned.meta["executor"])
+                if isinstance(expected, hvsrpy.HvsrAzimuthal):
+                    pairs = zip(expected.hvsrs, returned.hvsrs)
+                else:
+                    pairs = [(expected, returned)]
+                for _expected, _returned in pairs:
+                    self.assertArrayEqual(_expected.amplitude, _returned.amplitude)
+            settings.executor = "not_an_executor"
+            self.assertRaises(ValueError, hvsrpy.process, preprocessed_records, settings)
+
     def test_process_compare_single_azimuth_and_azimithal(self):
         settings = hvsr_settings.HvsrPreProcessingSettings()
         settings.window_length_in_seconds = 360
@@ -120,6 +207,132 @@ class TestProcessing(TestCase):
         self.assertArrayEqual(sa_results.mean_curve(), az_results.mean_curve_by_azimuth()[0])
         self.assertArrayEqual(sa_results.mean_curve(), az_results.hvsrs[0].mean_curve())
 
+    def test_process_traditional_batched_fft_matches_per_record_fft(self):
+        settings = hvsr_settings.HvsrPreProcessingSettings()
+        settings.window_length_in_seconds = 60
+        preprocessed_records = hvsrpy.preprocess(self.ambient_noise_records, settings)
+        # include records with an unequal number of samples.
+        preprocessed_records.append(copy.deepcopy(preprocessed_records[-1]))
+        preprocessed_records[-1].trim(0, 30)
+        org_records = copy.deepcopy(preprocessed_records)
+
+        settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+        settings.fft_settings = dict(workers=2)
+        results = hvsrpy.process(preprocessed_records, settings)
+
+        # records should not be modified.
+        for record, org_record in zip(preprocessed_records, org_records):
+            self.assertArrayEqual(record.ns.amplitude, org_record.ns.amplitude)
+
+        # reference per-record implementation.
+        n = settings.fft_settings["n"]
+        frq = np.fft.rfftfreq(n, org_records[0].vt.dt_in_seconds)
+        hors, vers = [], []
+        for record in org_records:
+            record.window(*settings.window_type_and_width)
+            ns = np.abs(np.fft.rfft(record.ns.amplitude, n=n))
+            ew = np.abs(np.fft.rfft(record.ew.amplitude, n=n))
+            hors.append(COMBINE_HORIZONTAL_REGISTER["geometric_mean"](ns, ew))
+            vers.append(np.abs(np.fft.rfft(record.vt.amplitude, n=n)))
+        fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
+        smoothed = SMOOTHING_OPERATORS["konno_and_ohmachi"](
+            frq, np.array(hors + vers), fcs, settings.smoothing["bandwidth"])
+        expected = smoothed[:len(hors)] / smoothed[len(hors):]
+
+        self.assertArrayAlmostEqual(expected, results.amplitude, rtol=1e-10)
+
+    def test_process_traditional_rotdpp_matches_time_domain_rotation(self):
+        settings = hvsr_settings.HvsrPreProcessingSettings()
+        settings.window_length_in_seconds = 120
+        preprocessed_records = hvsrpy.preprocess(self.ambient_noise_records, settings)[:3]
+        settings = hvsr_settings.HvsrTraditionalRotDppProcessingSettings(azimuths_in_degrees=np.arange(0, 180, 15))
+        results = hvsrpy.process(preprocessed_records, settings)
+
+        # reference implementation rotating each record in the time domain.
+        n = settings.fft_settings["n"]
+        frq = np.fft.rfftfreq(n, preprocessed_records[0].vt.dt_in_seconds)
+        fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
+        expected = []
+        for record in preprocessed_records:
+            spectra = []
+            for azimuth in settings.azimuths_in_degrees:
+                h = hvsrpy.TimeSeries(single_azimuth(record.ns.amplitude, record.ew.amplitude, azimuth),
+                                      record.ns.dt_in_seconds)
+                h.window(*settings.window_type_and_width)
+                spectra.append(np.abs(np.fft.rfft(h.amplitude, n=n)))
+            v = hvsrpy.TimeSeries.from_timeseries(record.vt)
+            v.window(*settings.window_type_and_width)
+            spectra.append(np.abs(np.fft.rfft(v.amplitude, n=n)))
+            smoothed = SMOOTHING_OPERATORS["konno_and_ohmachi"](
+                frq, np.array(spectra), fcs, settings.smoothing["bandwidth"])
+            h = np.percentile(smoothed[:-1], settings.ppth_percentile_for_rotdpp_computation, axis=0)
+            expected.append(h / smoothed[-1])
+
+        self.assertArrayAlmostEqual(np.array(expected), results.amplitude, rtol=1e-10)
+
+    def test_process_azimuthal_matches_time_domain_rotation(self):
+        settings = hvsr_settings.HvsrPreProcessingSettings()
+        settings.window_length_in_seconds = 120
+        preprocessed_records = hvsrpy.preprocess(self.ambient_noise_records, settings)[:3]
+        settings = hvsr_settings.HvsrAzimuthalProcessingSettings(azimuths_in_degrees=[0., 30., 125.])
+        results = hvsrpy.process(preprocessed_records, settings)
+
+        # reference implementation rotating each record in the time domain.
+        n = settings.fft_settings["n"]
+        frq = np.fft.rfftfreq(n, preprocessed_records[0].vt.dt_in_seconds)
+        fcs = np.array(settings.smoothing["center_frequencies_in_hz"])
+        for azimuth, hvsr in zip(settings.azimuths_in_degrees, results.hvsrs):
+            hors, vers = [], []
+            for record in preprocessed_records:
+                h = hvsrpy.TimeSeries(single_azimuth(record.ns.amplitude, record.ew.amplitude, azimuth),
+                                      record.ns.dt_in_seconds)
+                h.window(*settings.window_type_and_width)
+                hors.append(np.abs(np.fft.rfft(h.amplitude, n=n)))
+                v = hvsrpy.TimeSeries.from_timeseries(record.vt)
+                v.window(*settings.window_type_and_width)
+                vers.append(np.abs(np.fft.rfft(v.amplitude, n=n)))
+            smoothed = SMOOTHING_OPERATORS["konno_and_ohmachi"](
+                frq, np.array(hors + vers), fcs, settings.smoothing["bandwidth"])
+            expected = smoothed[:len(hors)] / smoothed[len(hors):]
+            self.assertArrayAlmostEqual(expected, hvsr.amplitude, rtol=1e-10)
+            self.assertEqual(azimuth, hvsr.meta["azimuth_in_degrees"])
+
+    def test_psd_accumulator(self):
+        settings = hvsr_settings.PsdPreProcessingSettings()
+        settings.window_length_in_seconds = 60
+        preprocessed_records = hvsrpy.preprocess(self.ambient_noise_records, settings)
+        settings = hvsr_settings.PsdProcessingSettings()
+        expected = hvsrpy.rpsd(preprocessed_records, copy.deepcopy(settings))
+
+        # windows one at a time from a generator.
+        _settings = copy.deepcopy(settings)
+        accumulator = hvsrpy.PsdAccumulator(_settings)
+        accumulator.partial_fit(record for record in preprocessed_records)
+        self.assertEqual(len(preprocessed_records), accumulator.n_windows)
+        returned = accumulator.to_psd()
+        for component in ["ns", "ew", "vt"]:
+            self.assertArrayAlmostEqual(expected[component].amplitude,
+                                        returned[component].amplitude, rtol=1e-10)
+
+        # merge accumulators from separate workers.
+        halves = [hvsrpy.PsdAccumulator(copy.deepcopy(_settings)),
+                  hvsrpy.PsdAccumulator(copy.deepcopy(_settings))]
+        halves[0].partial_fit(preprocessed_records[:5])
+        for record in preprocessed_records[5:]:
+            halves[1].partial_fit(record)
+        merged = hvsrpy.PsdAccumulator(copy.deepcopy(settings)).merge(halves[0]).merge(halves[1])
+        self.assertEqual(accumulator.n_windows, merged.n_windows)
+        for component in ["ns", "ew", "vt"]:
+            self.assertArrayAlmostEqual(accumulator.psd()[component],
+                                        merged.psd()[component], rtol=1e-10)
+
+        # inconsistent time step.
+        record = copy.deepcopy(preprocessed_records[0])
+        for component in ["ns", "ew", "vt"]:
+            getattr(record, component).dt_in_seconds *= 2
+        self.assertRaises(ValueError, accumulator.partial_fit, record)
+        self.assertRaises(ValueError, hvsrpy.PsdAccumulator(settings).psd)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,115 @@
+# This file is part of hvsrpy, a Python package for
+# horizontal-to-vertical spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for on-disk caching of results."""
+
+import copy
+import tempfile
+
+import numpy as np
+
+import hvsrpy
+from hvsrpy import settings as hvsr_settings
+from hvsrpy.cache import DiskCache
+from testing_tools import unittest, TestCase, get_full_path
+
+
+class TestResultCache(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.full_path = get_full_path(__file__, result_as_string=False)
+        cls.fname = str(cls.full_path / "data/input/mseed_combined/ut.stn11.a2_c50.mseed")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_disk_cache(self):
+        cache = DiskCache(self.tmp_dir.name, max_size_in_bytes=2500)
+        calls = []
+
+        def factory(value):
+            def _factory():
+                calls.append(value)
+                return np.full(100, value)
+            return _factory
+
+        # miss then hit.
+        self.assertArrayEqual(np.full(100, 1.), cache.get("a", factory(1.)))
+        self.assertArrayEqual(np.full(100, 1.), cache.get("a", factory(2.)))
+        self.assertListEqual([1.], calls)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+        # entries persist across instances.
+        cache = DiskCache(self.tmp_dir.name, max_size_in_bytes=2500)
+        self.assertArrayEqual(np.full(100, 1.), cache.get("a", factory(2.)))
+
+        # least recently used entry is evicted once full.
+        cache.get("b", factory(3.))
+        cache.get("a", factory(4.))
+        cache.get("c", factory(5.))
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertTrue("c" in cache)
+        self.assertTrue(cache.size_in_bytes <= 2500)
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+        with self.assertRaises(ValueError):
+            DiskCache(self.tmp_dir.name, max_size_in_bytes=0)
+
+    def test_result_cache(self):
+        preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+        preprocessing_settings.window_length_in_seconds = 60
+        processing_settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+
+        records = hvsrpy.read([self.fname])
+        records = hvsrpy.preprocess(records, preprocessing_settings)
+        expected = hvsrpy.process(records, copy.deepcopy(processing_settings))
+
+        cache = hvsrpy.ResultCache(self.tmp_dir.name)
+        for _ in range(2):
+            records = cache.read([self.fname])
+            records = cache.preprocess(records, preprocessing_settings)
+            returned = cache.process(records, copy.deepcopy(processing_settings))
+            self.assertArrayAlmostEqual(expected.frequency, returned.frequency)
+            self.assertArrayAlmostEqual(expected.amplitude, returned.amplitude)
+            self.assertDictEqual(expected.meta, returned.meta)
+        self.assertEqual((3, 3), (cache.disk_cache.hits, cache.disk_cache.misses))
+
+        # changing only smoothing reuses raw spectra.
+        processing_settings.smoothing["bandwidth"] = 60
+        expected = hvsrpy.process(records, copy.deepcopy(processing_settings))
+        returned = cache.process(records, copy.deepcopy(processing_settings))
+        self.assertArrayAlmostEqual(expected.amplitude, returned.amplitude)
+        self.assertEqual((4, 3), (cache.disk_cache.hits, cache.disk_cache.misses))
+
+        # other processing is cached in full.
+        processing_settings = hvsr_settings.HvsrAzimuthalProcessingSettings()
+        expected = hvsrpy.process(records, copy.deepcopy(processing_settings))
+        for _ in range(2):
+            returned = cache.process(records, copy.deepcopy(processing_settings))
+            self.assertArrayAlmostEqual(expected.mean_curve(), returned.mean_curve())
+        self.assertEqual((5, 4), (cache.disk_cache.hits, cache.disk_cache.misses))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,18 @@ class TestSeismicRecording3C(TestCase):
         self.assertTrue(len(windows) == 10)
         self.assertTrue(isinstance(windows[0], hvsrpy.SeismicRecording3C))
 
+    def test_srecord3c_split_with_overlap(self):
+        ex = self.ex_srecord3c_cosine
+        srecord3c = hvsrpy.SeismicRecording3C.from_seismic_recording_3c(ex)
+        windows = srecord3c.split(2.0, overlap=0.5)
+        self.assertEqual(len(windows), 9)
+        for idx, window in enumerate(windows):
+            for component in ["ns", "ew", "vt"]:
+                expected = getattr(srecord3c, component).amplitude[idx*1000:idx*1000+2001]
+                self.assertArrayEqual(expected, getattr(window, component).amplitude)
+            self.assertEqual(srecord3c.degrees_from_north, window.degrees_from_north)
+            self.assertEqual(0.5, window.meta["split overlap"])
+
     def test_srecord3c_save(self):
         ex = self.ex_srecord3c_cosine
         fname = self.full_path / "data/temp/ex_record3c_cosine_save.json"
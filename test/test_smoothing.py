@@ -18,11 +18,14 @@
 """Test smoothing algorithms."""
 
 import logging
+import os
+import subprocess
+import sys
 
 import numpy as np
 
 import hvsrpy
-from testing_tools import unittest, TestCase
+from testing_tools import unittest, TestCase, get_full_path
 
 logger = logging.getLogger("hvsrpy")
 logger.setLevel(level=logging.CRITICAL)
@@ -75,6 +78,122 @@ class TestSmoothing(TestCase):
                                                    fcs=np.array([10]), bandwidth=0.15)
         self.assertAlmostEqual(value[0, 0], 3.6593, places=3)
 
+    def test_smoothing_operator_matches_numba(self):
+        frequency = np.fft.rfftfreq(4096, 0.01)
+        rng = np.random.default_rng(1)
+        amplitude = rng.random((5, frequency.size))
+        fcs = np.concatenate(([0.], np.geomspace(0.1, 49.9, 50)))
+        for operator, bandwidth in [("konno_and_ohmachi", 40),
+                                    ("parzen", 0.5),
+                                    ("savitzky_and_golay", 9),
+                                    ("linear_rectangular", 0.5),
+                                    ("log_rectangular", 0.05),
+                                    ("linear_triangular", 0.5),
+                                    ("log_triangular", 0.05)]:
+            smoothing = dict(operator=operator, bandwidth=bandwidth,
+                             center_frequencies_in_hz=fcs)
+            expected = hvsrpy.smoothing.apply_smoothing(
+                frequency, amplitude, {**smoothing, "engine": "numba"})
+            returned = hvsrpy.smoothing.apply_smoothing(
+                frequency, amplitude, smoothing)
+            self.assertArrayAlmostEqual(expected, returned, rtol=1e-10, atol=1e-12)
+
+    def test_smoothing_with_unsorted_frequencies(self):
+        frequency = np.fft.rfftfreq(1024, 0.01)
+        rng = np.random.default_rng(3)
+        amplitude = rng.random((2, frequency.size))
+        order = rng.permutation(frequency.size)
+        fcs = np.geomspace(0.5, 45, 20)
+        for operator, bandwidth in [("konno_and_ohmachi", 40),
+                                    ("parzen", 0.5),
+                                    ("linear_triangular", 0.5),
+                                    ("log_triangular", 0.05)]:
+            for engine in ["numba", "sparse"]:
+                smoothing = dict(operator=operator, bandwidth=bandwidth,
+                                 center_frequencies_in_hz=fcs, engine=engine)
+                expected = hvsrpy.smoothing.apply_smoothing(frequency, amplitude, smoothing)
+                returned = hvsrpy.smoothing.apply_smoothing(frequency[order], amplitude[:, order], smoothing)
+                self.assertArrayAlmostEqual(expected, returned, rtol=1e-12)
+
+    def test_smoothing_parallel_matches_serial(self):
+        frequency = np.fft.rfftfreq(4096, 0.01)
+        rng = np.random.default_rng(2)
+        amplitude = rng.random((5, frequency.size))
+        fcs = np.concatenate(([0.], np.geomspace(0.1, 49.9, 50)))
+        for operator, bandwidth in [("konno_and_ohmachi", 40),
+                                    ("parzen", 0.5),
+                                    ("savitzky_and_golay", 9),
+                                    ("linear_rectangular", 0.5),
+                                    ("log_rectangular", 0.05),
+                                    ("linear_triangular", 0.5),
+                                    ("log_triangular", 0.05)]:
+            smoothing = dict(operator=operator, bandwidth=bandwidth,
+                             center_frequencies_in_hz=fcs, engine="numba")
+            expected = hvsrpy.smoothing.apply_smoothing(frequency, amplitude, smoothing)
+            for n_threads in [None, 1]:
+                smoothing.update(dict(engine="numba_parallel", n_threads=n_threads))
+                returned = hvsrpy.smoothing.apply_smoothing(frequency, amplitude, smoothing)
+                self.assertArrayEqual(expected, returned)
+
+    def test_smoothing_parallel_from_threads_with_workqueue(self):
+        # the threading layer is fixed per process, so use a fresh one.
+        script = "from concurrent.futures import ThreadPoolExecutor\n"
+        script += "import numpy as np\n"
+        script += "from hvsrpy.smoothing import apply_smoothing\n"
+        script += "frequency = np.fft.rfftfreq(4096, 0.01)\n"
+        script += "amplitude = np.ones((5, frequency.size))\n"
+        script += "smoothing = dict(operator='konno_and_ohmachi', bandwidth=40,\n"
+        script += "                 center_frequencies_in_hz=np.geomspace(0.1, 49.9, 50),\n"
+        script += "                 engine='numba_parallel')\n"
+        script += "with ThreadPoolExecutor(max_workers=8) as executor:\n"
+        script += "    futures = [executor.submit(apply_smoothing, frequency, amplitude, smoothing)\n"
+        script += "               for _ in range(32)]\n"
+        script += "    [future.result() for future in futures]\n"
+        env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+        env["PYTHONPATH"] = os.pathsep.join([str(get_full_path(__file__, result_as_string=False).parent),
+                                             env.get("PYTHONPATH", "")])
+        result = subprocess.run([sys.executable, "-c", script], env=env,
+                                capture_output=True, text=True, timeout=600)
+        self.assertEqual(0, result.returncode, msg=result.stderr)
+
+    def test_smoothing_operator_cache(self):
+        cache = hvsrpy.smoothing.SMOOTHING_OPERATOR_CACHE
+        cache.clear()
+        smoothing = dict(operator="konno_and_ohmachi", bandwidth=40,
+                         center_frequencies_in_hz=np.array([5., 10.]))
+        for _ in range(3):
+            hvsrpy.smoothing.apply_smoothing(self.frequency, self.amplitude, smoothing)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(2, cache.hits)
+
+        smoothing["bandwidth"] = 20
+        hvsrpy.smoothing.apply_smoothing(self.frequency, self.amplitude, smoothing)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(2, len(cache))
+
+        for maxsize in range(cache.maxsize + 4):
+            smoothing["bandwidth"] = 10 + maxsize
+            hvsrpy.smoothing.apply_smoothing(self.frequency, self.amplitude, smoothing)
+        self.assertEqual(cache.maxsize, len(cache))
+
+    def test_smoothing_single_precision(self):
+        smoothing = dict(operator="konno_and_ohmachi", bandwidth=40,
+                         center_frequencies_in_hz=np.array([5., 10.]))
+        amplitude = np.array(self.amplitude, dtype=np.float32)
+        for engine in ["sparse", "numba"]:
+            smoothing["engine"] = engine
+            expected = hvsrpy.smoothing.apply_smoothing(self.frequency, self.amplitude, smoothing)
+            returned = hvsrpy.smoothing.apply_smoothing(self.frequency, amplitude, smoothing)
+            self.assertEqual(np.float32, returned.dtype)
+            self.assertArrayAlmostEqual(expected, returned, rtol=1e-5)
+
+    def test_smoothing_bad_engine(self):
+        smoothing = dict(operator="konno_and_ohmachi", bandwidth=40,
+                         center_frequencies_in_hz=np.array([10.]),
+                         engine="not_an_engine")
+        self.assertRaises(ValueError, hvsrpy.smoothing.apply_smoothing,
+                          self.frequency, self.amplitude, smoothing)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+# This file is part of hvsrpy, a Python package for
+# horizontal-to-vertical spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for streaming processing."""
+
+import copy
+import tempfile
+
+import numpy as np
+import obspy
+
+import hvsrpy
+from hvsrpy import settings as hvsr_settings
+from hvsrpy.stream import iter_mseed_chunks
+from testing_tools import unittest, TestCase, get_full_path
+
+
+class TestStream(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.full_path = get_full_path(__file__, result_as_string=False)
+        cls.fname = cls.full_path / "data/input/mseed_combined/ut.stn11.a2_c50.mseed"
+        cls.record = hvsrpy.read_single(cls.fname)
+
+    def _chunks(self, n_samples_per_chunk):
+        n_samples = self.record.vt.n_samples
+        dt = self.record.vt.dt_in_seconds
+        for start in range(0, n_samples, n_samples_per_chunk):
+            stop = min(start + n_samples_per_chunk, n_samples)
+            tseries = [hvsrpy.TimeSeries(getattr(self.record, component).amplitude[start:stop], dt)
+                       for component in ["ns", "ew", "vt"]]
+            yield hvsrpy.SeismicRecording3C(*tseries, meta=self.record.meta)
+
+    def test_iter_mseed_chunks(self):
+        chunks = list(iter_mseed_chunks(self.fname, chunk_length_in_seconds=250.))
+        self.assertEqual(8, len(chunks))
+        for component in ["ns", "ew", "vt"]:
+            amplitude = np.concatenate([getattr(chunk, component).amplitude for chunk in chunks])
+            self.assertArrayEqual(getattr(self.record, component).amplitude, amplitude)
+
+    def _gapped_segments(self):
+        # all components miss [60000, 70000), vt also misses [100000, 105000).
+        segments = [(0, 60000), (70000, 100000), (105000, self.record.vt.n_samples)]
+        stream = obspy.read(str(self.fname))
+        gapped = obspy.Stream()
+        for trace in stream:
+            pieces = [(0, 60000), (70000, None)]
+            if trace.stats.channel.endswith("Z"):
+                pieces = [(0, 60000), (70000, 100000), (105000, None)]
+            for start, stop in pieces:
+                piece = trace.copy()
+                piece.data = trace.data[start:stop]
+                piece.stats.starttime = trace.stats.starttime + start*trace.stats.delta
+                gapped.append(piece)
+        return gapped, segments
+
+    def test_iter_mseed_chunks_with_gaps(self):
+        gapped, segments = self._gapped_segments()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = f"{tmpdir}/gapped.mseed"
+            gapped.write(fname, format="MSEED", reclen=512)
+            chunks = list(iter_mseed_chunks(fname, chunk_length_in_seconds=250.))
+
+        # chunks never span a gap.
+        self.assertListEqual([0, 0, 0, 1, 1, 2, 2, 2, 2],
+                             [chunk.meta["segment"] for chunk in chunks])
+        for segment, (start, stop) in enumerate(segments):
+            for component in ["ns", "ew", "vt"]:
+                amplitude = np.concatenate([getattr(chunk, component).amplitude for chunk in chunks
+                                            if chunk.meta["segment"] == segment])
+                self.assertArrayEqual(getattr(self.record, component).amplitude[start:stop], amplitude)
+
+    def test_process_stream_with_gaps(self):
+        gapped, segments = self._gapped_segments()
+        preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+        processing_settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+        windows = []
+        for start, stop in segments:
+            tseries = [hvsrpy.TimeSeries(getattr(self.record, component).amplitude[start:stop],
+                                         self.record.vt.dt_in_seconds)
+                       for component in ["ns", "ew", "vt"]]
+            record = hvsrpy.SeismicRecording3C(*tseries, meta=self.record.meta)
+            windows.extend(hvsrpy.preprocess(record, preprocessing_settings))
+        expected = hvsrpy.process(windows, processing_settings)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = f"{tmpdir}/gapped.mseed"
+            gapped.write(fname, format="MSEED", reclen=512)
+            returned = hvsrpy.process_stream(fname, preprocessing_settings,
+                                             processing_settings,
+                                             chunk_length_in_seconds=250.)
+        self.assertEqual(expected.amplitude.shape, returned.amplitude.shape)
+        self.assertArrayAlmostEqual(expected.amplitude, returned.amplitude, rtol=1e-10)
+
+    def test_process_stream_traditional(self):
+        preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+        preprocessing_settings.filter_corner_frequencies_in_hz = (0.2, 30)
+        expected = hvsrpy.process(hvsrpy.preprocess(copy.deepcopy(self.record), preprocessing_settings),
+                                  hvsr_settings.HvsrTraditionalProcessingSettings())
+
+        for n_samples_per_chunk in [6000, 12345, 50000]:
+            returned = hvsrpy.process_stream(self._chunks(n_samples_per_chunk),
+                                             preprocessing_settings,
+                                             hvsr_settings.HvsrTraditionalProcessingSettings())
+            self.assertTrue(isinstance(returned, hvsrpy.HvsrTraditional))
+            self.assertArrayEqual(expected.frequency, returned.frequency)
+            self.assertArrayAlmostEqual(expected.amplitude, returned.amplitude, rtol=1e-6)
+
+    def test_process_stream_azimuthal_from_file(self):
+        preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+        processing_settings = hvsr_settings.HvsrAzimuthalProcessingSettings()
+        processing_settings.azimuths_in_degrees = [0., 45.]
+        expected = hvsrpy.process(hvsrpy.preprocess(copy.deepcopy(self.record), preprocessing_settings),
+                                  processing_settings)
+        returned = hvsrpy.process_stream(self.fname, preprocessing_settings,
+                                         processing_settings,
+                                         chunk_length_in_seconds=250.)
+        self.assertTrue(isinstance(returned, hvsrpy.HvsrAzimuthal))
+        for expected_hvsr, returned_hvsr in zip(expected.hvsrs, returned.hvsrs):
+            self.assertArrayAlmostEqual(expected_hvsr.amplitude, returned_hvsr.amplitude, rtol=1e-10)
+
+    def test_process_stream_diffuse_field(self):
+        preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+        expected = hvsrpy.process(hvsrpy.preprocess(copy.deepcopy(self.record), preprocessing_settings),
+                                  hvsr_settings.HvsrDiffuseFieldProcessingSettings())
+        returned = hvsrpy.process_stream(self._chunks(12345),
+                                         preprocessing_settings,
+                                         hvsr_settings.HvsrDiffuseFieldProcessingSettings())
+        self.assertTrue(isinstance(returned, hvsrpy.HvsrDiffuseField))
+        self.assertArrayEqual(expected.frequency, returned.frequency)
+        self.assertArrayAlmostEqual(expected.amplitude, returned.amplitude, rtol=1e-10)
+
+    def test_process_stream_unsupported_method(self):
+        self.assertRaises(NotImplementedError, hvsrpy.process_stream,
+                          self.fname, hvsr_settings.HvsrPreProcessingSettings(),
+                          hvsr_settings.PsdProcessingSettings())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# This file is part of hvsrpy, a Python package for
+# horizontal-to-vertical spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for parameter sweeps."""
+
+import copy
+import importlib
+from unittest import mock
+
+import hvsrpy
+from hvsrpy import settings as hvsr_settings
+from testing_tools import unittest, TestCase, get_full_path
+
+
+class TestSweep(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.full_path = get_full_path(__file__, result_as_string=False)
+        cls.records = hvsrpy.read([str(cls.full_path / "data/input/mseed_combined/ut.stn11.a2_c50.mseed")])
+
+    def test_sweep(self):
+        preprocessing_grid = {"window_length_in_seconds": [60, 100],
+                              "filter_corner_frequencies_in_hz": [(None, None), (0.2, 20)]}
+        processing_grid = {"window_type_and_width": [["tukey", 0.1], ["tukey", 0.3]],
+                           "smoothing.bandwidth": [20, 40]}
+        original = copy.deepcopy(self.records)
+        module = importlib.import_module("hvsrpy.sweep")
+        with mock.patch.object(module, "_filtered_records",
+                               wraps=module._filtered_records) as filtered_records:
+            df = hvsrpy.sweep(self.records, preprocessing_grid, processing_grid)
+        self.assertEqual(16, len(df))
+
+        # records are filtered once per filter, rows remain in grid order.
+        self.assertEqual(2, filtered_records.call_count)
+        self.assertListEqual([60]*8 + [100]*8, list(df["window_length_in_seconds"]))
+        self.assertListEqual(([(None, None)]*4 + [(0.2, 20)]*4)*2,
+                             list(df["filter_corner_frequencies_in_hz"]))
+
+        # records are not modified.
+        self.assertArrayEqual(original[0].ns.amplitude, self.records[0].ns.amplitude)
+
+        # rows match independent processing, in grid order.
+        for _, row in df.iloc[[0, 7, 13]].iterrows():
+            preprocessing_settings = hvsr_settings.HvsrPreProcessingSettings()
+            preprocessing_settings.window_length_in_seconds = row["window_length_in_seconds"]
+            preprocessing_settings.filter_corner_frequencies_in_hz = row["filter_corner_frequencies_in_hz"]
+            processing_settings = hvsr_settings.HvsrTraditionalProcessingSettings()
+            processing_settings.window_type_and_width = row["window_type_and_width"]
+            processing_settings.smoothing["bandwidth"] = row["smoothing.bandwidth"]
+            records = hvsrpy.preprocess(copy.deepcopy(self.records), preprocessing_settings)
+            hvsr = hvsrpy.process(records, processing_settings)
+            self.assertEqual(hvsr.n_curves, row["n_windows"])
+            self.assertAlmostEqual(hvsr.mean_fn_frequency(), row["mean_fn_frequency_in_hz"])
+            self.assertAlmostEqual(hvsr.mean_curve_peak()[1], row["mean_curve_peak_amplitude"])
+
+    def test_sweep_raises(self):
+        with self.assertRaises(ValueError):
+            hvsrpy.sweep(self.records, {"not_an_attribute": [1]}, {})
+        with self.assertRaises(ValueError):
+            hvsrpy.sweep(self.records, {}, {},
+                         processing_settings=hvsr_settings.HvsrAzimuthalProcessingSettings())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# This file is part of hvsrpy, a Python package for
+# horizontal-to-vertical spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for bulk parsing of text-based file formats."""
+
+import io
+
+import numpy as np
+
+import hvsrpy
+from hvsrpy.text_parsing import parse_numbers
+from testing_tools import unittest, TestCase
+
+
+class TestTextParsing(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rng = np.random.default_rng(1824)
+
+    def test_parse_numbers_matches_float(self):
+        values = self.rng.standard_normal(5000)
+        values *= 10.**self.rng.integers(-12, 12, values.size)
+        for fmt in ["{:.7E}", "{:.15g}", "{:.3f}", "{:.0f}"]:
+            text = "\n".join(fmt.format(value) for value in values)
+            expected = np.array([float(token) for token in text.split()])
+            self.assertArrayEqual(expected, parse_numbers(text))
+
+    def test_parse_numbers_special_cases(self):
+        tokens = ["-0", "+5", ".0000000E+00", "-.8713554E-03", "-12.",
+                  "1e22", "1e23", "123456789012345678", "5e-324", "inf"]
+        returned = parse_numbers("\t".join(tokens))
+        expected = np.array([float(token) for token in tokens])
+        self.assertArrayEqual(expected, returned)
+        self.assertTrue(np.signbit(returned[0]))
+
+    def test_parse_numbers_empty(self):
+        self.assertEqual(0, parse_numbers(" \r\n").size)
+
+    def test_parse_numbers_bad_token(self):
+        self.assertRaises(ValueError, parse_numbers, "1 2 three")
+
+    def test_parse_numbers_stop_at_non_numeric(self):
+        cases = [("1 -2.5 3E1\n# end of file 4\n", [1., -2.5, 30.]),
+                 ("1 -2.5 3E1 12abc 5", [1., -2.5, 30.]),
+                 ("1 -2.5 1e23 1\n# 4", [1., -2.5, 1e23, 1.])]
+        for text, expected in cases:
+            returned = parse_numbers(text, stop_at_non_numeric=True)
+            self.assertArrayEqual(np.array(expected), returned)
+            self.assertRaises(ValueError, parse_numbers, text)
+
+    def _minishark_text(self, samples, footer=""):
+        text = f"#Sample number:\t{len(samples)}\n#Sample rate (sps):\t200\n"
+        text += "#Gain:\t4\n#Conversion factor:\t1000\n"
+        text += "".join("{}\t{}\t{}\n".format(*row) for row in samples)
+        return text + footer
+
+    def test_read_minishark_from_text(self):
+        samples = self.rng.integers(-2**23, 2**23, (1000, 3))
+        text = self._minishark_text(samples)
+        srecord = hvsrpy.read_single(io.StringIO(text))
+        expected = (samples.astype(np.float32) / 4 / 1000).astype(float)
+        self.assertArrayEqual(expected[:, 0], srecord.vt.amplitude)
+        self.assertArrayEqual(expected[:, 1], srecord.ns.amplitude)
+        self.assertArrayEqual(expected[:, 2], srecord.ew.amplitude)
+        self.assertEqual(0.005, srecord.vt.dt_in_seconds)
+
+    def test_read_minishark_with_trailing_text(self):
+        samples = self.rng.integers(-2**23, 2**23, (10, 3))
+        text = self._minishark_text(samples, footer="# end of file\n")
+        srecord = hvsrpy.data_wrangler._read_minishark(io.StringIO(text))
+        expected = (samples.astype(np.float32) / 4 / 1000).astype(float)
+        self.assertArrayEqual(expected[:, 0], srecord.vt.amplitude)
+
+    def test_read_minishark_with_stray_sample(self):
+        samples = self.rng.integers(-2**23, 2**23, (3, 3))
+        text = self._minishark_text(samples, footer="7\n")
+        with self.assertRaisesRegex(ValueError, "does not match"):
+            hvsrpy.data_wrangler._read_minishark(io.StringIO(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
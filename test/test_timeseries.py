@@ -20,6 +20,7 @@
 import logging
 
 import numpy as np
+from scipy.signal.windows import tukey
 
 import hvsrpy
 from testing_tools import unittest, TestCase
@@ -62,6 +63,53 @@ class TestTimeSeries(TestCase):
         self.assertTrue(len(windows), 10)
         self.assertTrue(isinstance(windows[0], hvsrpy.TimeSeries))
 
+    def test_timeseries_split_windows_are_views(self):
+        tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
+        windows = tseries.split(window_length_in_seconds=1.0)
+        self.assertEqual(len(windows), 10)
+        for idx, window in enumerate(windows[:-1]):
+            expected = tseries.amplitude[idx*1000:idx*1000 + 1001]
+            self.assertArrayEqual(expected, window.amplitude)
+            self.assertTrue(np.shares_memory(tseries.amplitude, window.amplitude))
+        self.assertArrayEqual(tseries.amplitude[9000:], windows[-1].amplitude)
+
+        # windows are read-only until modified.
+        self.assertFalse(windows[0].amplitude.flags.writeable)
+        windows[0].detrend()
+        windows[1].window()
+        self.assertFalse(np.shares_memory(tseries.amplitude, windows[0].amplitude))
+        self.assertArrayEqual(tseries.amplitude[1000:2001]*tukey(1001, 0.1), windows[1].amplitude)
+        self.assertArrayEqual(self.ex_tseries_sine.amplitude, tseries.amplitude)
+
+    def test_timeseries_split_with_overlap(self):
+        tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
+        windows = tseries.split(window_length_in_seconds=1.0, overlap=0.5)
+        self.assertEqual(len(windows), 19)
+        for idx, window in enumerate(windows[:-1]):
+            self.assertArrayEqual(tseries.amplitude[idx*500:idx*500 + 1001],
+                                  window.amplitude)
+        self.assertArrayEqual(tseries.amplitude[9000:], windows[-1].amplitude)
+        self.assertRaises(ValueError, tseries.split, 1.0, overlap=1.)
+
+    def test_timeseries_taper_and_filter_designs_are_cached(self):
+        from hvsrpy.timeseries import TAPER_CACHE, BUTTERWORTH_SOS_CACHE
+        TAPER_CACHE.clear()
+        BUTTERWORTH_SOS_CACHE.clear()
+        tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
+        windows = tseries.split(window_length_in_seconds=1.0)
+        for window in windows[:-1]:
+            window.window("tukey", 0.2)
+            window.butterworth_filter((1, 20))
+        self.assertEqual(1, TAPER_CACHE.misses)
+        self.assertEqual(len(windows) - 2, TAPER_CACHE.hits)
+        self.assertEqual(1, BUTTERWORTH_SOS_CACHE.misses)
+        self.assertEqual(len(windows) - 2, BUTTERWORTH_SOS_CACHE.hits)
+
+        # cached designs are read-only.
+        for cache in [TAPER_CACHE, BUTTERWORTH_SOS_CACHE]:
+            for array in cache._entries.values():
+                self.assertFalse(array.flags.writeable)
+
     def test_timeseries_split_where_window_length_is_too_large(self):
         tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
         self.assertRaises(ValueError, tseries.split, 11.0)
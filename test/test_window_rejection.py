@@ -99,6 +99,44 @@ class TestHvsrDomainWindowRejectionAlgorithms(TestCase):
         hvsrpy.frequency_domain_window_rejection(ahvsr, n=2)
         self.assertArrayEqual(ahvsr.peak_frequencies[0], frequency[c_idx[:-1]])
 
+    def test_fdwra_matches_direct_statistics(self):
+        rng = np.random.default_rng(seed=1824)
+        frequency = np.geomspace(0.2, 20, 256)
+        n_curves = 200
+        fns = rng.lognormal(mean=np.log(2.), sigma=0.3, size=n_curves)
+        fns[:20] = rng.uniform(0.3, 15, size=20)
+        amplitude = 1 + 4*np.exp(-np.log(frequency/fns[:, np.newaxis])**2/0.05)
+        amplitude *= rng.lognormal(sigma=0.1, size=amplitude.shape)
+        amplitude[:3] = 0
+
+        # reference implementation computing all statistics directly.
+        expected = hvsrpy.HvsrTraditional(frequency, amplitude)
+        for c_iteration in range(50):
+            mean_fn_before = expected.mean_fn_frequency()
+            std_fn_before = expected.std_fn_frequency()
+            diff_before = abs(mean_fn_before - expected.mean_curve_peak()[0])
+            lower_bound = expected.nth_std_fn_frequency(-2)
+            upper_bound = expected.nth_std_fn_frequency(+2)
+            for _idx, (c_valid, c_peak) in enumerate(zip(expected.valid_peak_boolean_mask, expected._main_peak_frq)):
+                if c_valid:
+                    in_bounds = c_peak > lower_bound and c_peak < upper_bound
+                    expected.valid_window_boolean_mask[_idx] = in_bounds
+                    expected.valid_peak_boolean_mask[_idx] = in_bounds
+            std_fn_after = expected.std_fn_frequency()
+            d_after = abs(expected.mean_fn_frequency() - expected.mean_curve_peak()[0])
+            if (abs(d_after - diff_before)/diff_before < 0.01) and (abs(std_fn_after - std_fn_before) < 0.01):
+                break
+        expected_iterations = c_iteration + 1
+
+        for _amplitude in [amplitude, amplitude[3:]]:
+            hvsr = hvsrpy.HvsrTraditional(frequency, _amplitude)
+            iterations = hvsrpy.frequency_domain_window_rejection(hvsr, n=2)
+            n_offset = len(amplitude) - len(_amplitude)
+            self.assertEqual(expected_iterations, iterations)
+            self.assertArrayEqual(expected.valid_window_boolean_mask[n_offset:],
+                                  hvsr.valid_window_boolean_mask)
+            self.assertArrayAlmostEqual(expected.mean_curve(), hvsr.mean_curve())
+
 
 if __name__ == "__main__":
     unittest.main()